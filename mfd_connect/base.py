@@ -71,6 +71,8 @@ class ConnectionCompletedProcess:
     1
     """
 
+    __slots__ = ("_args", "_stdout", "_stderr", "_stdout_bytes", "_stderr_bytes", "_return_code")
+
     def __init__(
         self,
         args: list[str] | str,
@@ -102,7 +104,7 @@ class ConnectionCompletedProcess:
     def __repr__(self):
         args = [
             f"{arg_name.lstrip('_')}={arg_value!r}"
-            for arg_name, arg_value in self.__dict__.items()
+            for arg_name, arg_value in ((name, getattr(self, name)) for name in self.__slots__)
             if arg_value is not None
         ]
         return "{}({})".format(type(self).__name__, ", ".join(args))
@@ -4,7 +4,6 @@
 
 import logging
 import re
-import shlex
 import typing
 from importlib import import_module
 from pathlib import Path
@@ -17,6 +16,7 @@ from mfd_typing.os_values import OSName, OSType
 from .base import PythonConnection, ConnectionCompletedProcess
 from .exceptions import OsNotSupported
 from .process.local import LocalProcess, POSIXLocalProcess, WindowsLocalProcess
+from .util.process_utils import split_command
 
 if typing.TYPE_CHECKING:
     from pydantic import BaseModel  # from pytest_mfd_config.models.topology import ConnectionModel
@@ -172,7 +172,7 @@ class LocalConnection(PythonConnection):
         command = self._adjust_command(command)
 
         if not shell and not powershell_called:
-            command = shlex.split(command, posix=self._os_type == OSType.POSIX)
+            command = split_command(command, posix=self._os_type == OSType.POSIX)
 
         if self.get_os_name() == OSName.ESXI:
             completed_process = self._run_esxi_command(command, cwd, env, input_data, shell, stderr, stdout, timeout)
@@ -329,7 +329,7 @@ class LocalConnection(PythonConnection):
                 command = f"taskset {hex(cpus)} {command}"
 
         if not shell:
-            command = shlex.split(command, posix=self._os_type == OSType.POSIX)
+            command = split_command(command, posix=self._os_type == OSType.POSIX)
 
         if enable_input:
             stdin = PIPE
@@ -411,7 +411,7 @@ class LocalConnection(PythonConnection):
                 command = f"taskset {hex(cpus)} {command}"
 
         if not shell:
-            command = shlex.split(command, posix=self._os_type == OSType.POSIX)
+            command = split_command(command, posix=self._os_type == OSType.POSIX)
 
         if enable_input:
             stdin = PIPE
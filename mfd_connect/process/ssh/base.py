@@ -8,7 +8,7 @@ from abc import abstractmethod
 from collections import namedtuple
 from contextlib import suppress
 from signal import SIGTERM, Signals
-from threading import Lock, Thread
+from threading import RLock, Thread
 from time import sleep
 from typing import Optional, Iterator, TYPE_CHECKING, Type, Set, ClassVar, List, Union
 
@@ -39,6 +39,9 @@ class SSHProcess(RemoteProcess):
     POOL_INTERVAL = 0.1
     """Interval for polling operations."""
 
+    READ_CHUNK_SIZE = 32768
+    """Max number of bytes received from channel at once when draining stdout/stderr streams."""
+
     _os_name: ClassVar[Set[Type["OSName"]]] = None
 
     def __init__(
@@ -79,17 +82,14 @@ class SSHProcess(RemoteProcess):
         self._pid = pid
         self._connection_handle = connection
 
+        # one reentrant lock per stream guards both cached queue and cached iterator of that stream
         self._cached_stdout_queue = None
-        self._stdout_queue_cache_lock = Lock()
-
         self._cached_stdout_iter = None
-        self._stdout_iter_cache_lock = Lock()
+        self._stdout_lock = RLock()
 
         self._cached_stderr_queue = None
-        self._stderr_queue_cache_lock = Lock()
-
         self._cached_stderr_iter = None
-        self._stderr_iter_cache_lock = Lock()
+        self._stderr_lock = RLock()
 
         self._channel = (
             channel
@@ -239,7 +239,7 @@ class SSHProcess(RemoteProcess):
     @property
     def _stdout_queue(self) -> BatchQueue:
         """Stdout line-by-line queue."""
-        with self._stdout_queue_cache_lock:
+        with self._stdout_lock:
             if self._cached_stdout_queue is None:
                 self._cached_stdout_queue = self._get_process_io_queue(self.stdout_stream)
         return self._cached_stdout_queue
@@ -247,7 +247,7 @@ class SSHProcess(RemoteProcess):
     @property
     def _stderr_queue(self) -> BatchQueue:
         """Stderr line-by-line queue."""
-        with self._stderr_queue_cache_lock:
+        with self._stderr_lock:
             if self._cached_stderr_queue is None:
                 self._cached_stderr_queue = self._get_process_io_queue(self.stderr_stream)
         return self._cached_stderr_queue
@@ -301,7 +301,7 @@ class SSHProcess(RemoteProcess):
 
         :return: Iterator over stdout lines of the process.
         """
-        with self._stdout_iter_cache_lock:
+        with self._stdout_lock:
             super().get_stdout_iter()
             if self._cached_stdout_iter is None:
                 self._cached_stdout_iter = self._iterate_non_blocking_queue(self._stdout_queue)
@@ -321,7 +321,7 @@ class SSHProcess(RemoteProcess):
 
         :return: Iterator over stderr lines of the process.
         """
-        with self._stderr_iter_cache_lock:
+        with self._stderr_lock:
             super().get_stderr_iter()
             if self._cached_stderr_iter is None:
                 self._cached_stderr_iter = self._iterate_non_blocking_queue(self._stderr_queue)
@@ -4,25 +4,82 @@
 
 import logging
 from signal import Signals, SIGTERM
-from typing import Optional, List, TYPE_CHECKING, Union
+from time import monotonic
+from typing import Optional, List, TYPE_CHECKING, Union, ClassVar
 
 from mfd_common_libs import log_levels
 from mfd_typing.os_values import OSName
 
 from .base import SSHProcess
-from ...exceptions import RemoteProcessInvalidState, SSHRemoteProcessEndException
+from ...exceptions import RemoteProcessInvalidState, SSHRemoteProcessEndException, SSHPIDException
 
 if TYPE_CHECKING:
     from mfd_connect import SSHConnection
 
 logger = logging.getLogger(__name__)
 
+FIND_PIDS_COMMAND = (
+    r'powershell -command "Get-CimInstance Win32_Process '
+    r"| Where-Object -Match -Property CommandLine -Value .*\/c\s\Dtitle\s%s.* "
+    r'| Select-Object  -ExpandProperty ProcessId"'
+)  # %s is unique name of process injected by start process
+
 
 class WindowsSSHProcess(SSHProcess):
     """Implementation of Windows SSH process."""
 
     _os_name = {OSName.WINDOWS}
 
+    _PID_CACHE_TTL: ClassVar[float] = 5.0
+    """Time in seconds for which result of PID lookup is reused."""
+
+    _cached_pids: Optional[List[int]] = None
+    _pids_cached_at: Optional[float] = None
+
+    @property
+    def pid(self) -> int:
+        """
+        Field for Process ID.
+
+        Result of PID lookup is reused for _PID_CACHE_TTL seconds, querying WMI takes a while.
+
+        :return: PID
+        :raises RemoteProcessInvalidState: if process is not available in system.
+        """
+        if not self._pid:
+            all_pids = self._find_cached_pids()
+            if len(all_pids) > 1:
+                raise SSHPIDException("Found more than one PID. You should consider using StartProcesses method.")
+            self._pid = all_pids[0]
+        return self._pid
+
+    def _find_cached_pids(self) -> List[int]:
+        """
+        Find PIDs of process, reuse result of previous successful lookup if it's not older than _PID_CACHE_TTL.
+
+        :return: List of PIDs
+        :raises RemoteProcessInvalidState: if cannot find PID
+        """
+        now = monotonic()
+        if self._cached_pids and now - self._pids_cached_at <= self._PID_CACHE_TTL:
+            return self._cached_pids
+        # misses are not cached, process may not be listed by WMI yet right after start
+        self._cached_pids = self._find_pids(self._connection_handle, self._unique_name)
+        self._pids_cached_at = now
+        return self._cached_pids
+
+    @property
+    def running(self) -> bool:
+        """Whenever the process is running or not."""
+        if self._pid is not None:
+            return super().running
+        try:
+            # live lookup, cached PIDs could report process which already exited as running
+            return bool(self._find_pids(self._connection_handle, self._unique_name))
+        except RemoteProcessInvalidState:
+            logger.log(log_levels.MODULE_DEBUG, msg="Not found PID in system, process is not running.")
+            return False
+
     def stop(self, wait: Optional[int] = 60) -> None:
         """
         Signal the process to stop gracefully.
@@ -45,7 +102,10 @@ class WindowsSSHProcess(SSHProcess):
         if self.running:
             super().kill()
             logger.log(level=log_levels.MODULE_DEBUG, msg="Using signals on Windows for killing process is available.")
-            self._kill(self.pid)
+            if self._pid:
+                self._kill(self._pid)
+            else:
+                self._kill_many(self._find_cached_pids())
             if wait is not None:
                 self.wait(timeout=wait)
         else:
@@ -63,18 +123,23 @@ class WindowsSSHProcess(SSHProcess):
         :return: List of PIDs if any PID exists
         :raises RemoteProcessInvalidState: if cannot find PID
         """
-        result = connection.execute_command(
-            command=f'powershell -command "Get-CimInstance Win32_Process '
-            f"| Where-Object -Match -Property CommandLine -Value .*\/c\s\Dtitle\s{name}.* "  # noqa: W605
-            f'| Select-Object  -ExpandProperty ProcessId"'
-        )
-        pids = result.stdout.strip()
+        result = connection.execute_command(command=FIND_PIDS_COMMAND % name)
+        pids = [int(pid) for pid in result.stdout.split() if pid.isdigit()]
         if not pids:
             raise RemoteProcessInvalidState("Process is finished, cannot find PID")
-        return [int(pid) for pid in pids.splitlines()]
+        return pids
 
     def _kill(self, pid: int) -> None:
-        kill_command = f"taskkill /F /PID {pid}"
+        self._kill_many([pid])
+
+    def _kill_many(self, pids: List[int]) -> None:
+        """
+        Kill processes using single taskkill call.
+
+        :param pids: PIDs of processes to kill
+        :raises SSHRemoteProcessEndException: if cannot kill any of processes.
+        """
+        kill_command = "taskkill /F " + " ".join(f"/PID {pid}" for pid in pids)
         result = self._connection_handle.execute_command(kill_command, expected_return_codes=None)
         if result.return_code != 0:
-            raise SSHRemoteProcessEndException(f"Cannot kill process pid:{pid}")
+            raise SSHRemoteProcessEndException(f"Cannot kill process pid:{', '.join(str(pid) for pid in pids)}")
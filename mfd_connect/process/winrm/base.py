@@ -2,14 +2,16 @@
 # SPDX-License-Identifier: MIT
 """Package for winrm process."""
 
-import codecs
 import typing
-
+from threading import Event
+from time import monotonic
 from typing import Optional, Union
 
+from mfd_common_libs import TimeoutCounter
+
 from winrm.exceptions import WinRMOperationTimeoutError
 
-from mfd_connect.exceptions import RemoteProcessInvalidState
+from mfd_connect.exceptions import RemoteProcessInvalidState, RemoteProcessTimeoutExpired
 from mfd_connect.process import RemoteProcess
 
 if typing.TYPE_CHECKING:
@@ -21,6 +23,13 @@ if typing.TYPE_CHECKING:
 class WinRmProcess(RemoteProcess):
     """Class for WinRM process."""
 
+    MIN_POLL_INTERVAL = 0.05
+    """Initial interval between polls of command status."""
+    MAX_POLL_INTERVAL = 2.0
+    """Max interval between polls of command status, reached when command doesn't produce any output."""
+    POLL_BACKOFF_FACTOR = 1.5
+    """Multiplier of poll interval applied after each poll without new output."""
+
     def __init__(
         self,
         *,
@@ -40,28 +49,41 @@ class WinRmProcess(RemoteProcess):
         self.command_id = command_id
         self._connection_handle = connection
         self.shell_id = connection._shell_id
+        # command is bound to the shell (and protocol) of connection at process start, resolve getter once
+        self._get_output = connection._server._raw_get_command_output
+        self._stdout_buf = bytearray()
+        self._stderr_buf = bytearray()
         self._stdout = None
         self._stderr = None
         self._return_code = None
-        self._running = None
+        self._done = Event()
+        self._poll_interval = self.MIN_POLL_INTERVAL
+        self._next_poll_at = 0.0
 
     @property
     def running(self) -> bool:  # noqa D102
-        self._pull_data()
-        return self._running
+        if not self._done.is_set() and monotonic() >= self._next_poll_at:
+            self._pull_data()
+        return not self._done.is_set()
 
     @property
     def stdout_text(self) -> str:  # noqa D102
         _ = super().stdout_text
         if self._stdout is None:
-            self._pull_data()
+            if not self._stdout_buf:
+                self._pull_data()
+            if self._stdout_buf:
+                self._stdout = self._decode(self._stdout_buf)
         return self._stdout
 
     @property
     def stderr_text(self) -> str:  # noqa D102
         _ = super().stderr_text
         if self._stderr is None:
-            self._pull_data()
+            if not self._stderr_buf:
+                self._pull_data()
+            if self._stderr_buf:
+                self._stderr = self._decode(self._stderr_buf)
         return self._stderr
 
     @property
@@ -89,8 +111,23 @@ class WinRmProcess(RemoteProcess):
     def get_stderr_iter(self) -> "Iterator":  # noqa D102
         raise NotImplementedError
 
-    def wait(self, timeout: int = 60) -> int:  # noqa D102
-        raise NotImplementedError
+    def wait(self, timeout: int = 60) -> int:
+        """
+        Wait for the process to conclude on its own.
+
+        Between polls of command status waits on completion event, so it returns as soon as any poll sees it done.
+
+        :param timeout: Time to wait for process to conclude.
+        :return: Process return code.
+        :raises RemoteProcessTimeoutExpired: If the process did not conclude before the timer ran out.
+        """
+        super().wait(timeout)
+        timeout_counter = TimeoutCounter(timeout)
+        while not timeout_counter:
+            if not self.running:
+                return self.return_code
+            self._done.wait(max(self._next_poll_at - monotonic(), 0))
+        raise RemoteProcessTimeoutExpired()
 
     def stop(self, wait: Optional[int] = 60) -> None:
         """
@@ -128,7 +165,20 @@ class WinRmProcess(RemoteProcess):
         try:
             self.__pull_data()
         except WinRMOperationTimeoutError:
-            self._running = True  # todo refactor reading status of command
+            # command is still running, completion event stays not set
+            self._schedule_next_poll(new_data=False)
+
+    def _schedule_next_poll(self, new_data: bool) -> None:
+        """
+        Schedule next poll of command status.
+
+        :param new_data: Whether last poll brought anything new, otherwise interval between polls is increased
+        """
+        if new_data:
+            self._poll_interval = self.MIN_POLL_INTERVAL
+        else:
+            self._poll_interval = min(self._poll_interval * self.POLL_BACKOFF_FACTOR, self.MAX_POLL_INTERVAL)
+        self._next_poll_at = monotonic() + self._poll_interval
 
     def __pull_data(self) -> None:
         """
@@ -141,13 +191,23 @@ class WinRmProcess(RemoteProcess):
             _stderr_bytes,
             self._return_code,
             command_done,
-        ) = self._connection_handle._server._raw_get_command_output(self.shell_id, self.command_id)
-        self._running = not command_done
+        ) = self._get_output(self.shell_id, self.command_id)
+        if command_done:
+            self._done.set()
+        self._schedule_next_poll(new_data=bool(_stdout_bytes or _stderr_bytes or command_done))
         if _stdout_bytes:
-            if self._stdout is None:
-                self._stdout = ""
-            self._stdout += codecs.decode(_stdout_bytes, encoding="utf-8", errors="backslashreplace")
+            self._stdout_buf.extend(_stdout_bytes)
+            self._stdout = None
         if _stderr_bytes:
-            if self._stderr is None:
-                self._stderr = ""
-            self._stderr += codecs.decode(_stderr_bytes, encoding="utf-8", errors="backslashreplace")
+            self._stderr_buf.extend(_stderr_bytes)
+            self._stderr = None
+
+    @staticmethod
+    def _decode(output: bytearray) -> str:
+        """
+        Decode collected output of command.
+
+        :param output: Bytes of output
+        :return: Decoded output
+        """
+        return output.decode(encoding="utf-8", errors="backslashreplace")
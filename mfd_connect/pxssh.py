@@ -5,6 +5,7 @@
 import codecs
 import logging
 import platform
+import re
 from pathlib import Path
 
 from subprocess import CalledProcessError
@@ -42,12 +43,21 @@ add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG
 add_logging_level(level_name="CMD", level_value=log_levels.CMD)
 add_logging_level(level_name="OUT", level_value=log_levels.OUT)
 
+_IS_WINDOWS = "windows" in platform.system().casefold()
+DEFAULT_ERROR_LIST = (b"FAILED", b"Invalid input", b"ERROR", b"not found", b"Syntax error", b"Segmentation fault")
+DEFAULT_ERROR_REGEX = re.compile(b"|".join(re.escape(error) for error in DEFAULT_ERROR_LIST))
+
 
 class PxsshConnection(AsyncConnection):
     """Handling execute command with expected prompt."""
 
     _process_classes = [PosixSSHProcess, ESXiSSHProcess]
 
+    MAX_READ = 32768
+    """Max number of bytes read from pexpect child at once."""
+    SEARCH_WINDOW_SIZE = 4096
+    """Number of the most recent bytes of output searched for expected prompt."""
+
     def __init__(
         self,
         ip: str,
@@ -74,7 +84,7 @@ class PxsshConnection(AsyncConnection):
         :param pexpect_args: extra pexpect arguments
         """
         super().__init__(ip=ip, model=model, cache_system_data=cache_system_data)
-        self.__use_sudo = False
+        self._sudo_prefix = ""
         self._username = username
         self._password = password
         self._prompts = prompts
@@ -82,7 +92,7 @@ class PxsshConnection(AsyncConnection):
             self._connect()
         except ExceptionPxssh as e:
             raise ModuleFrameworkDesignError("Found problem with connection") from e
-        if "windows" in platform.system().casefold():
+        if _IS_WINDOWS:
             raise PxsshException("Windows is not supported as test controller, yet")
 
     def _connect(self) -> None:
@@ -93,7 +103,11 @@ class PxsshConnection(AsyncConnection):
         :raises ExceptionPxssh: if connection is not successful
         """
         try:
-            self._child = pxssh.pxssh(options={"StrictHostKeyChecking": "no"})
+            self._child = pxssh.pxssh(
+                maxread=self.MAX_READ,
+                searchwindowsize=self.SEARCH_WINDOW_SIZE,
+                options={"StrictHostKeyChecking": "no"},
+            )
             self._child.login(self._ip, self._username, self._password)
             index = self._child.prompt()
             if index == 0:
@@ -168,13 +182,16 @@ class PxsshConnection(AsyncConnection):
         :return: stdin_pipe, stdout_pipe, stderr_pipe, returncode as
             input command, cli output string, signal status and exit status
         """
-        _error_list = ["FAILED", "Invalid input", "ERROR", "not found", "Syntax error", "Segmentation fault"]
-        _error_list = error_list if error_list else _error_list
+        # output is checked as bytes in single pass, no need to decode it
+        if error_list:
+            error_regex = re.compile(b"|".join(re.escape(error.encode("utf-8")) for error in error_list))
+        else:
+            error_regex = DEFAULT_ERROR_REGEX
         self._child.sendline(command)
         i = self._child.expect([prompts if prompts != "" else self._prompts, EOF, TIMEOUT], timeout=timeout)
         if i == 0:
             logger.log(level=log_levels.MODULE_DEBUG, msg=self._child.before)
-            if any(error in self._child.before.decode("utf-8") for error in _error_list):
+            if error_regex.search(self._child.before):
                 # 5   EIO I/O error
                 self._child.exitstatus = 5
             else:
@@ -280,9 +297,9 @@ class PxsshConnection(AsyncConnection):
         :param command: command to adjust
         :return: command
         """
-        if self.__use_sudo:
-            return f'sudo sh -c "{command}"' if "echo" in command else f"sudo {command}"
-        return command
+        if not self._sudo_prefix:
+            return command
+        return f'{self._sudo_prefix}sh -c "{command}"' if "echo" in command else self._sudo_prefix + command
 
     def enable_sudo(self) -> None:
         """
@@ -294,12 +311,12 @@ class PxsshConnection(AsyncConnection):
             raise OsNotSupported(f"{self._os_type} is not supported for enabling sudo!")
 
         logger.log(level=log_levels.MODULE_DEBUG, msg="Enabled sudo for command execution.")
-        self.__use_sudo = True
+        self._sudo_prefix = "sudo "
 
     def disable_sudo(self) -> None:
         """Disable sudo for command execution."""
         logger.log(level=log_levels.MODULE_DEBUG, msg="Disabled sudo for command execution.")
-        self.__use_sudo = False
+        self._sudo_prefix = ""
 
     def _disconnect(self) -> None:
         """To terminate ssh connection."""
@@ -4,11 +4,15 @@
 
 import codecs
 import base64
+import itertools
 import json
 import logging
-import shlex
+import random
+import socket
 import time
 import typing
+from collections import defaultdict, deque
+from threading import Lock
 from warnings import warn
 from pathlib import Path
 from subprocess import PIPE, STDOUT, DEVNULL, CalledProcessError, CompletedProcess
@@ -18,6 +22,7 @@ import rpyc
 from funcy import retry
 from mfd_common_libs import TimeoutCounter, add_logging_level, log_levels
 from mfd_typing.os_values import OSName, OSType
+from rpyc.core import netref
 from rpyc.core.service import ClassicService, ModuleNamespace
 
 from mfd_connect.util.rpc_system_info_utils import DEFAULT_RPYC_6_0_0_RESPONDER_PORT
@@ -32,6 +37,7 @@ from mfd_connect.exceptions import (
 )
 from .process.rpyc import RPyCProcess, WindowsRPyCProcess, PosixRPyCProcess, ESXiRPyCProcess, WindowsRPyCProcessByStart
 from .util.decorators import clear_system_data_cache
+from .util.process_utils import split_command
 from .util.account_utils import create_user as create_user_util, delete_user as delete_user_util
 
 if typing.TYPE_CHECKING:
@@ -44,13 +50,117 @@ add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG
 add_logging_level(level_name="CMD", level_value=log_levels.CMD)
 add_logging_level(level_name="OUT", level_value=log_levels.OUT)
 
+CONNECTION_RETRY_BASE_DELAY = 0.01
+CONNECTION_RETRY_MAX_DELAY = 1.0
+
+
+def connection_retry_delay(attempt: int) -> float:
+    """
+    Calculate delay before next connection attempt.
+
+    Delay grows exponentially with attempt number up to CONNECTION_RETRY_MAX_DELAY and is randomly shortened
+    by up to half, so clients which lost connection at the same time don't reconnect at the same time.
+
+    :param attempt: Number of failed attempt, counted from 0
+    :return: Delay in seconds
+    """
+    return min(CONNECTION_RETRY_MAX_DELAY, CONNECTION_RETRY_BASE_DELAY * 2**attempt) * random.uniform(0.5, 1.0)
+
+
+class _ConnectionPool:
+    """Thread-safe store of idle RPyC connections, grouped by connection target."""
+
+    PING_TIMEOUT = 1
+    """Timeout in seconds for liveness check of idle connection before handing it out."""
+
+    def __init__(self) -> None:
+        """Initialise pool."""
+        self._idle: Dict[tuple, deque] = defaultdict(deque)
+        self._lock = Lock()
+
+    def acquire(self, key: tuple) -> rpyc.Connection | None:
+        """
+        Take live idle connection for target out of pool.
+
+        Dead connections found on the way are closed and dropped.
+
+        :param key: Target identifier
+        :return: Idle connection or None if pool has no live connection for target
+        """
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                connection = idle.pop()
+            if self._is_alive(connection):
+                return connection
+            self._close(connection)
+
+    def release(self, key: tuple, connection: rpyc.Connection, max_idle: int) -> None:
+        """
+        Return connection to pool.
+
+        Closed connections are dropped, connections above pool limit are closed.
+
+        :param key: Target identifier
+        :param connection: Connection no longer used by its owner
+        :param max_idle: Maximum number of idle connections kept per target
+        """
+        if connection.closed:
+            return
+        with self._lock:
+            idle = self._idle[key]
+            if len(idle) < max_idle:
+                idle.append(connection)
+                return
+        self._close(connection)
+
+    def _is_alive(self, connection: rpyc.Connection) -> bool:
+        """
+        Check if connection is open and remote side responds.
+
+        :param connection: Connection to check
+        :return: True if connection can be reused, False otherwise
+        """
+        if connection.closed:
+            return False
+        try:
+            connection.ping(timeout=self.PING_TIMEOUT)
+        except Exception:
+            return False
+        return True
+
+    @staticmethod
+    def _close(connection: rpyc.Connection) -> None:
+        """
+        Close connection, ignoring errors of already broken connection.
+
+        :param connection: Connection to close
+        """
+        try:
+            connection.close()
+        except Exception as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Ignoring error while closing pooled connection: {e}")
+
 
 class RPyCConnection(PythonConnection):
     """RPyC Connection class."""
 
     DEFAULT_RPYC_6_0_0_RESPONDER_PORT = DEFAULT_RPYC_6_0_0_RESPONDER_PORT  # used for rpyc ver. 6+
+    CONNECTION_POOL_SIZE = 4
+    """Maximum number of idle connections kept per target when connection reuse is enabled, checked on release."""
+    REMOTE_ENV_CACHE_TTL = 60
+    """Time in seconds for which local copy of remote environment is reused, when system data is cached."""
+    _connection_pool = _ConnectionPool()
     _system_name: Optional[str] = None  # Must be defined by subclasses
     _process_classes = {PosixRPyCProcess, WindowsRPyCProcess, ESXiRPyCProcess}
+    _reuse_connection: bool = False
+    _pooled_connection: Optional[rpyc.Connection] = None
+    _channels: int = 1
+    _subprocess_run_cache: Optional[Dict[int, Tuple["ModuleNamespace", Callable]]] = None
+    _remote_env: Optional[Dict[str, str]] = None
+    _remote_env_fetched_at: float = 0.0
 
     def __init__(
         self,
@@ -74,6 +184,8 @@ class RPyCConnection(PythonConnection):
         ssl_keyfile: str | None = None,
         ssl_certfile: str | None = None,
         ipv6: bool = False,
+        reuse_connection: bool = False,
+        channels: int = 1,
         **kwargs,
     ) -> None:  # noqa: D200
         """
@@ -99,6 +211,10 @@ class RPyCConnection(PythonConnection):
         :param ssl_keyfile: Path to SSL key file.
         :param ssl_certfile: Path to SSL certificate file.
         :param ipv6: set to ``True`` when *ip* is an IPv6 address (default: ``False``)
+        :param reuse_connection: Take connection from pool of idle connections to the same target if available
+        and return it to the pool on disconnect instead of closing it.
+        :param channels: Number of RPyC connections used round robin for execute_command calls,
+        additional connections are opened on first use.
         """
         super().__init__(ip, model, default_timeout, cache_system_data)
         self.path_extension = path_extension
@@ -116,6 +232,12 @@ class RPyCConnection(PythonConnection):
         self._ssl_keyfile: str | None = ssl_keyfile
         self._ssl_certfile: str | None = ssl_certfile
         self._ipv6: bool = ipv6
+        self._reuse_connection = reuse_connection
+        self._channels = max(channels, 1)
+        self._channel_connections: List[rpyc.Connection | None] = [None] * (self._channels - 1)
+        self._channel_counter = itertools.count()
+        self._channel_lock = Lock()
+        self._subprocess_run_cache: Dict[int, Tuple["ModuleNamespace", Callable]] = {}
         self._establish_connection(retry_timeout=retry_timeout, retry_time=retry_time)
 
     def _ensure_remote_winapi_helper(self) -> str:
@@ -221,7 +343,11 @@ class RPyCConnection(PythonConnection):
 
         :raises RPyCDeploymentException: if remote sha is different from local, when enable_deploy is True
         """
+        self._close_channel_connections()
         self._connection = self._create_connection()
+        self._remote_env = None
+        if self._reuse_connection:
+            self._pooled_connection = self._connection
         if self.enable_deploy:
             self.check_sha_correctness()
         if hasattr(self, "_background_serving_thread") and not self._background_serving_thread._active:
@@ -281,15 +407,35 @@ class RPyCConnection(PythonConnection):
         """
         return self.remote.modules
 
-    @retry(5, errors=OSError)
+    @property
+    def _pool_key(self) -> tuple:
+        """Identifier of connection target in connection pool."""
+        return (
+            str(self._ip),
+            self._port,
+            self._ipv6,
+            self._ssl_keyfile,
+            self._ssl_certfile,
+            self._connection_timeout,
+        )
+
+    @retry(5, errors=OSError, timeout=connection_retry_delay)
     def _create_connection(self) -> rpyc.Connection:
         """
         Create RPyC connection to the represented host.
 
+        When connection reuse is enabled, live idle connection to the same target is taken from pool first.
+
         :return: RPyC connection object.
         """
+        if self._reuse_connection:
+            connection = self._connection_pool.acquire(self._pool_key)
+            if connection is not None:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Reusing idle connection with {self._ip}")
+                return connection
+
         if self._ssl_keyfile and self._ssl_certfile:
-            return rpyc.ssl_connect(
+            connection = rpyc.ssl_connect(
                 str(self._ip),
                 port=self._port,
                 ipv6=self._ipv6,
@@ -299,14 +445,77 @@ class RPyCConnection(PythonConnection):
                 keyfile=self._ssl_keyfile,
                 certfile=self._ssl_certfile,
             )
-        return rpyc.connect(
-            str(self._ip),
-            port=self._port,
-            ipv6=self._ipv6,
-            service=ClassicService,
-            keepalive=True,
-            config={"sync_request_timeout": self._connection_timeout},
-        )
+        else:
+            connection = rpyc.connect(
+                str(self._ip),
+                port=self._port,
+                ipv6=self._ipv6,
+                service=ClassicService,
+                keepalive=True,
+                config={"sync_request_timeout": self._connection_timeout},
+            )
+        self._disable_nagle(connection)
+        return connection
+
+    @staticmethod
+    def _disable_nagle(connection: rpyc.Connection) -> None:
+        """
+        Set TCP_NODELAY on socket of connection, RPyC requests are many small messages delayed by Nagle's algorithm.
+
+        :param connection: RPyC connection object.
+        """
+        try:
+            connection._channel.stream.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (AttributeError, OSError) as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Could not set TCP_NODELAY on RPyC socket: {e}")
+
+    def _next_channel(self) -> Tuple[int, "ModuleNamespace"]:
+        """
+        Select next channel in round robin order and expose python module-space on machine via it.
+
+        Channel 0 is the main connection, other channels are opened on first use and reopened after drop.
+        Use only for self-contained calls, which don't pass remote objects of other channel.
+
+        :return: Channel number and object which exposes python module installed on machine.
+        """
+        channel = next(self._channel_counter) % self._channels if self._channels > 1 else 0
+        if channel == 0:
+            return channel, self.modules()
+        with self._channel_lock:
+            connection = self._channel_connections[channel - 1]
+            if connection is None or connection.closed:
+                connection = self._channel_connections[channel - 1] = self._create_connection()
+        return channel, connection.modules
+
+    def _close_channel_connections(self) -> None:
+        """
+        Close additional channel connections and drop remote functions resolved on any channel.
+
+        Additional connections don't survive reboot or loss of main connection, they are reopened on next use.
+        """
+        connections = getattr(self, "_channel_connections", [])
+        self._channel_connections = [None] * (self._channels - 1)
+        self._subprocess_run_cache = {}
+        for connection in connections:
+            if connection is not None:
+                _ConnectionPool._close(connection)
+
+    def _remote_subprocess_run(self) -> Callable:
+        """
+        Get remote subprocess.run function on next channel.
+
+        Each attribute lookup on remote module is a round trip, so function is resolved once per channel
+        and reused until channel is reconnected.
+
+        :return: Remote subprocess.run
+        """
+        channel, modules = self._next_channel()
+        if self._subprocess_run_cache is None:
+            self._subprocess_run_cache = {}
+        cached = self._subprocess_run_cache.get(channel)
+        if cached is None or cached[0] is not modules:
+            cached = self._subprocess_run_cache[channel] = (modules, modules.subprocess.run)
+        return cached[1]
 
     def _execute_command_as_user_windows(
         self,
@@ -706,7 +915,7 @@ class RPyCConnection(PythonConnection):
                 shell = True
 
         if not shell and not powershell_called:
-            command = shlex.split(command, posix=self._os_type == OSType.POSIX)
+            command = split_command(command, posix=self._os_type == OSType.POSIX)
 
         env = self._handle_path_extension(env)
         env = self._handle_env_extension(env)
@@ -804,7 +1013,7 @@ class RPyCConnection(PythonConnection):
         stdout: int,
         timeout: Optional[int],
     ) -> "CompletedProcess":
-        completed_process: "CompletedProcess" = self.modules().subprocess.run(
+        completed_process: "CompletedProcess" = self._remote_subprocess_run()(
             command,
             input=input_data,
             cwd=cwd,
@@ -816,6 +1025,12 @@ class RPyCConnection(PythonConnection):
             check=False,
             stdin=PIPE if not input_data else None,
         )
+        if isinstance(completed_process, netref.BaseNetref):
+            # transfer whole result at once instead of proxying every attribute access
+            try:
+                completed_process = rpyc.classic.obtain(completed_process)
+            except Exception as e:  # e.g. pickle protocol not supported by remote python
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Cannot obtain remote process result at once: {e}")
         return completed_process
 
     def _run_esxi_command(
@@ -850,6 +1065,7 @@ class RPyCConnection(PythonConnection):
         Send to host command and disconnect rpyc.
 
         Closing rpyc connection
+        Command is sent via main connection, additional channel connections are closed before
         If send command failed, return code != 0 and raise ConnectionCalledProcessError
         Handle EOFError, which has been raised when dropped connection
         If command send correct, sleep 'sleep_time' for start rebooting and end responder
@@ -859,11 +1075,14 @@ class RPyCConnection(PythonConnection):
         sleep_time = 10
         if hasattr(self, "_background_serving_thread"):
             self._background_serving_thread.stop()
+        self._close_channel_connections()
+        channels, self._channels = self._channels, 1
         try:
             self.execute_command(command)
         except EOFError:  # EOFError: [Errno 104] Connection reset by peer (dropped connection)
             logger.log(level=log_levels.MODULE_DEBUG, msg="Dropped connection via RPyC, expected")
         finally:
+            self._channels = channels
             self._connection.close()
         time.sleep(sleep_time)
 
@@ -956,8 +1175,11 @@ class RPyCConnection(PythonConnection):
             try:
                 logger.log(level=log_levels.MODULE_DEBUG, msg="Reconnecting...")
                 self._connection = self._create_connection()
+                if self._reuse_connection:
+                    self._pooled_connection = self._connection
                 if self._connection:
                     logger.log(level=log_levels.MODULE_DEBUG, msg="Connected via RPyC")
+                    self._close_channel_connections()
                     if self._enable_bg_serving_thread:
                         self._background_serving_thread = rpyc.BgServingThread(self.remote)
                         time.sleep(0.1)
@@ -1094,7 +1316,7 @@ class RPyCConnection(PythonConnection):
         if log_path is not None:
             log_file = True
         if not shell:
-            command = shlex.split(command, posix=self._os_type == OSType.POSIX)
+            command = split_command(command, posix=self._os_type == OSType.POSIX)
 
         env = self._handle_path_extension(env)
         env = self._handle_env_extension(env)
@@ -1207,13 +1429,40 @@ class RPyCConnection(PythonConnection):
         """
         Extend/override the environment if env parameter is defined.
 
+        Empty dictionary extends nothing, so remote process inherits its environment without fetching it.
+
         :param _env: Environment dictionary
         :return: Environment, in which custom env is extended, if necessary
         """
-        if _env is not None:
-            env = self.modules().os.environ.copy()
-            return dict(env, **_env)
-        return _env
+        if _env:
+            return dict(self._get_remote_environment(), **_env)
+        return None
+
+    def _get_remote_environment(self) -> Dict[str, str]:
+        """
+        Get local copy of environment of remote python process.
+
+        Environment is transferred in one pickled chunk instead of item by item access via proxy.
+        When system data is cached, copy is reused for REMOTE_ENV_CACHE_TTL seconds, caller must not modify it.
+
+        :return: Environment dictionary
+        """
+        now = time.monotonic()
+        if (
+            self.cache_system_data
+            and self._remote_env is not None
+            and now - self._remote_env_fetched_at < self.REMOTE_ENV_CACHE_TTL
+        ):
+            return self._remote_env
+
+        remote_env = self.modules().os.environ.copy()
+        try:
+            env = rpyc.classic.obtain(remote_env)
+        except Exception as e:  # e.g. pickle protocol not supported by remote python
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Cannot obtain remote environment at once: {e}")
+            env = dict(remote_env)
+        self._remote_env, self._remote_env_fetched_at = env, now
+        return env
 
     def teleport_function(self, func: Callable) -> Callable:
         """
@@ -1246,7 +1495,19 @@ class RPyCConnection(PythonConnection):
                 logger.log(level=log_levels.MODULE_DEBUG, msg=f"Closing connection with {self._ip}")
                 if hasattr(self, "_background_serving_thread"):
                     self._background_serving_thread.stop()
-                self._connection.close()
+                for index, connection in enumerate(getattr(self, "_channel_connections", [])):
+                    if connection is None:
+                        continue
+                    if self._reuse_connection:
+                        self._connection_pool.release(self._pool_key, connection, self.CONNECTION_POOL_SIZE)
+                    else:
+                        connection.close()
+                    self._channel_connections[index] = None
+                if self._reuse_connection and self._connection is self._pooled_connection:
+                    self._connection_pool.release(self._pool_key, self._connection, self.CONNECTION_POOL_SIZE)
+                    self._connection = self._pooled_connection = None
+                else:
+                    self._connection.close()
             except Exception as e:
                 raise ModuleFrameworkDesignError(f"Exception occurred while closing connection: {e}") from e
 
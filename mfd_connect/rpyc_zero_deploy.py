@@ -18,6 +18,7 @@ from plumbum.machines.paramiko_machine import ParamikoMachine
 from rpyc.utils.zerodeploy import DeployedServer
 
 from mfd_connect import RPyCConnection
+from mfd_connect.rpyc import connection_retry_delay
 from mfd_connect.exceptions import RPyCZeroDeployException
 
 if TYPE_CHECKING:
@@ -141,7 +142,7 @@ class RPyCZeroDeployConnection(RPyCConnection):
         except Exception as e:
             raise RPyCZeroDeployException("Unexpected exception during deploying RPyC server via SSH.") from e
 
-    @retry(5, errors=OSError)
+    @retry(5, errors=OSError, timeout=connection_retry_delay)
     def _create_connection(self) -> "Connection":
         """
         Create RPyC connection to the represented host.
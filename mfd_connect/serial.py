@@ -35,6 +35,8 @@ logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 add_logging_level(level_name="CMD", level_value=log_levels.CMD)
 
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
 
 class SerialConnection(Connection):
     """Class handling communication via Serial."""
@@ -143,10 +145,14 @@ class SerialConnection(Connection):
     def _run_netcat(self, start_netcat_wait_time: float = 0.5) -> None:
         """Start netcat server and forward traffic from char device to/from TCP."""
         logger.log(level=log_levels.MODULE_DEBUG, msg="Killing old netcat connections on host")
-        self._remote_host.execute_command(f'pkill -f "nc -k -l -4 {self._telnet_port}"', expected_return_codes=None)
-
         logger.log(level=log_levels.MODULE_DEBUG, msg="Starting netcat server on host")
-        netcat_server_command = f"nc -k -l -4 {self._telnet_port} > {self._serial_device} < {self._serial_device}"
+        # kill and start in one shell, port is passed via variable, so pkill pattern doesn't match the shell itself
+        # no exec, shell must stay alive, SSH process looks up nc as child of shell carrying `&& true <name>` marker
+        netcat_server_command = (
+            f"port={self._telnet_port}; "
+            'pkill -f "nc -k -l -4 $port"; '
+            f'nc -k -l -4 "$port" > {self._serial_device} < {self._serial_device}'
+        )
         self._server_process = self._remote_host.start_process(netcat_server_command, shell=True)
 
         logger.log(level=log_levels.MODULE_DEBUG, msg="Waiting for netcat server to start...")
@@ -238,7 +244,7 @@ class SerialConnection(Connection):
             remote_sha256sum = remote_sha256sum_stdout.split(" ", 1)[0]
 
             # get sha256sum for local file
-            local_sha256sum = hashlib.sha256(open(local_path, "rb").read()).hexdigest()
+            local_sha256sum = self._local_sha256sum(local_path)
         except Exception as e:
             raise TransferFileError("Failed to get control sums") from e
 
@@ -250,6 +256,24 @@ class SerialConnection(Connection):
         else:
             raise TransferFileError(f"Incorrect sha256sum, local: {local_sha256sum}, remote: {remote_sha256sum}")
 
+    @staticmethod
+    def _local_sha256sum(path: Union[str, Path]) -> str:
+        """
+        Calculate sha256sum of local file.
+
+        File is read in chunks into one reused buffer, so memory usage doesn't depend on file size.
+
+        :param path: Path of local file
+        :return: Hex digest of file content
+        """
+        sha256 = hashlib.sha256()
+        buffer = bytearray(CHECKSUM_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(path, "rb", buffering=0) as file:
+            while read_size := file.readinto(buffer):
+                sha256.update(view[:read_size])
+        return sha256.hexdigest()
+
     def execute_command(
         self,
         command: str,
@@ -491,11 +515,11 @@ class SerialConnection(Connection):
         output = self._telnet_connection.console.read().decode("ASCII", errors="ignore")
         term = Ansiterm(ANSITERM_ROWS_SIZE, ANSITERM_COLS_SIZE)
         term.feed(output)
-        output = "\n".join(
-            term.get_string(y * ANSITERM_COLS_SIZE, y * ANSITERM_COLS_SIZE + ANSITERM_COLS_SIZE)
-            for y in range(ANSITERM_ROWS_SIZE)
+        screen = term.get_string(0, ANSITERM_ROWS_SIZE * ANSITERM_COLS_SIZE)
+        return "\n".join(
+            screen[start : start + ANSITERM_COLS_SIZE]
+            for start in range(0, ANSITERM_ROWS_SIZE * ANSITERM_COLS_SIZE, ANSITERM_COLS_SIZE)
         )
-        return output
 
     def get_screen_field_value(self, field_regex: str, group_name: Optional[str]) -> Optional[str]:
         """
@@ -590,6 +590,7 @@ class SolConnection(Connection):
 
         return "\n".join(output_lines)
 
+    @conditional_cache
     def _check_if_unix(self) -> bool:
         """Check if Unix is the client OS."""
         unix_check_command = "uname -a"
@@ -608,6 +609,7 @@ class SolConnection(Connection):
                 return os
         raise OsNotSupported("Client OS not supported")
 
+    @conditional_cache
     def _check_if_efi_shell(self) -> bool:
         """Check if EFI shell is the client OS."""
         efi_shell_check_command = "ver"
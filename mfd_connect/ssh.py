@@ -701,9 +701,11 @@ class SSHConnection(AsyncConnection):
 
         chan.exec_command(command)
 
+        # by default paramiko reads output line by line in 8 KiB chunks, use bigger chunks for draining pipes
+        read_bufsize = SSHProcess.READ_CHUNK_SIZE if bufsize < 0 else bufsize
         stdin = chan.makefile_stdin("wb", bufsize) if enable_input else None
-        stdout = chan.makefile("r", bufsize) if not discard_stdout else None
-        stderr = chan.makefile_stderr("r", bufsize) if not discard_stderr else None
+        stdout = chan.makefile("r", read_bufsize) if not discard_stdout else None
+        stderr = chan.makefile_stderr("r", read_bufsize) if not discard_stderr else None
 
         if stderr_to_stdout:
             chan.set_combine_stderr(combine=True)
@@ -80,6 +80,7 @@ class TunneledRPyCConnection(RPyCConnection):
             **kwargs,
         )
         self._tunnel_connection = self._connection
+        self._channels = 1  # additional channels would be opened to jump host, not to the target
         self.path_extension = path_extension
         self._port = port
         self._connection_timeout = connection_timeout
@@ -47,7 +47,7 @@ class Tile:
 
 
 class Ansiterm:
-    _escape_parser = re.compile(r"^\x1b\[?([\d;]*)(\w)")
+    _escape_parser = re.compile(r"\x1b\[?([\d;]*)(\w)")
 
     def __init__(self, rows, cols):
         """Initializes the ansiterm with rows*cols white-on-black spaces"""
@@ -108,22 +108,24 @@ class Ansiterm:
         if self.cursor["y"] >= self.rows:
             self.cursor["y"] = self.rows - 1
 
-    def _parse_sequence(self, input):
+    def _parse_sequence(self, input, pos=0):
         """
-        This method parses the input into the numeric arguments and
+        This method parses the input at position pos into the numeric arguments and
         the type of sequence. If no numeric arguments are supplied,
         we manually insert a 0 or a 1 depending on the sequence type,
         because different types have different default values.
+        Returns parsed sequence (or None if there is no sequence at pos)
+        and position right after it.
 
         Example 1: \x1b[1;37;40m -> numbers=[1, 37, 40] char=m
         Example 2: \x1b[m = numbers=[0] char=m
         """
-        if input[0] != "\x1b":
-            return None, input
+        if input[pos] != "\x1b":
+            return None, pos
 
-        match = Ansiterm._escape_parser.match(input)
+        match = Ansiterm._escape_parser.match(input, pos)
         if not match:
-            raise Exception("Invalid escape sequence, input[:20]=%r" % input[:20])
+            raise Exception("Invalid escape sequence, input[:20]=%r" % input[pos : pos + 20])
 
         args, char = match.groups()
         # If arguments are omitted, add the default argument for this sequence.
@@ -137,7 +139,7 @@ class Ansiterm:
         else:
             numbers = list(map(int, args.split(";")))
 
-        return (char, numbers), input[match.end() :]
+        return (char, numbers), match.end()
 
     def get_cursor_idx(self):
         return self.cursor["y"] * self.cols + self.cursor["x"]
@@ -206,20 +208,28 @@ class Ansiterm:
             raise Exception("Unknown escape code: char=%r numbers=%r input=%r" % (char, numbers, input[:20]))
 
     def feed(self, input):
-        """Feeds the terminal with input."""
-        while input:
+        """
+        Feeds the terminal with input.
+
+        Input is walked by index, slicing off the consumed part would copy
+        the remaining input for every character.
+        """
+        pos = 0
+        length = len(input)
+        while pos < length:
             # If the input starts with \x1b, try to parse end evaluate a
             # sequence.
-            parsed, input = self._parse_sequence(input)
+            parsed, end = self._parse_sequence(input, pos)
             if parsed:
                 self._evaluate_sequence(*parsed)
+                pos = end
             else:
                 # If we end up here, the character should should just be
                 # added to the current tile and the cursor should be updated.
                 # Some characters such as \r, \n will only affect the cursor.
                 # TODO: Find out exactly what should be accepted here.
                 #       Only ASCII-7 perhaps?
-                a = input[0]
+                a = input[pos]
                 if a == "\r":
                     self.cursor["x"] = 0
                 elif a == "\b":
@@ -232,5 +242,5 @@ class Ansiterm:
                     self.tiles[self.get_cursor_idx()].set(a, self.color)
                     self.cursor["x"] += 1
 
-                input = input[1:]
+                pos += 1
         self._fix_cursor()
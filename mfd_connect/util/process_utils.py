@@ -3,7 +3,9 @@
 """Module for Process utils."""
 
 import logging
-from typing import List, TYPE_CHECKING
+import shlex
+from functools import lru_cache
+from typing import List, Tuple, TYPE_CHECKING
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_connect.exceptions import ProcessNotRunning
 from mfd_typing.os_values import OSName
@@ -16,6 +18,23 @@ logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
 linux_kill_signal = "SIGINT"
+SPLIT_COMMAND_CACHE_SIZE = 256
+
+
+def split_command(command: str, posix: bool = True) -> List[str]:
+    """
+    Split command into arguments like shlex.split, memoizing results for repeated commands.
+
+    :param command: Command to split
+    :param posix: Whether to split with POSIX shell rules
+    :return: New list of command arguments, safe to modify by caller
+    """
+    return list(_split_command(command, posix))
+
+
+@lru_cache(maxsize=SPLIT_COMMAND_CACHE_SIZE)
+def _split_command(command: str, posix: bool) -> Tuple[str, ...]:
+    return tuple(shlex.split(command, posix=posix))
 
 
 def get_process_by_name(conn: "Connection", process_name: str) -> List[str]:
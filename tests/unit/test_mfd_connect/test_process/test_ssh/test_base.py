@@ -1,5 +1,6 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import io
 import threading
 from collections import namedtuple
 
@@ -39,10 +40,8 @@ class TestBaseSSHProcess:
             stdout=mocker.create_autospec(ChannelFile),
             stderr=mocker.create_autospec(ChannelStderrFile),
         )
-        ssh_process._stdout_queue_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
-        ssh_process._stdout_iter_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
-        ssh_process._stderr_queue_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
-        ssh_process._stderr_iter_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
+        ssh_process._stdout_lock = mocker.create_autospec(threading.RLock(), spec_set=True)
+        ssh_process._stderr_lock = mocker.create_autospec(threading.RLock(), spec_set=True)
         ssh_process._pid = 0
         return ssh_process
 
@@ -106,8 +105,8 @@ class TestBaseSSHProcess:
         ssh_process._get_process_io_queue = mocker.create_autospec(ssh_process._get_process_io_queue, spec_set=True)
         assert ssh_process._stdout_queue == mocker.sentinel.cached
 
-        ssh_process._stdout_queue_cache_lock.__enter__.assert_called()
-        ssh_process._stdout_queue_cache_lock.__exit__.assert_called()
+        ssh_process._stdout_lock.__enter__.assert_called()
+        ssh_process._stdout_lock.__exit__.assert_called()
 
     def test__stderr_queue_not_cached(self, ssh_process, mocker):
         stderr_stream_mock = mocker.patch.object(
@@ -118,16 +117,25 @@ class TestBaseSSHProcess:
         ssh_process._cached_stderr_queue = None
         assert ssh_process._stderr_queue == ssh_process._get_process_io_queue.return_value
         ssh_process._get_process_io_queue.assert_called_once_with(stderr_stream_mock.return_value)
-        ssh_process._stderr_queue_cache_lock.__enter__.assert_called()
-        ssh_process._stderr_queue_cache_lock.__exit__.assert_called()
+        ssh_process._stderr_lock.__enter__.assert_called()
+        ssh_process._stderr_lock.__exit__.assert_called()
 
     def test__stderr_queue_cached(self, ssh_process, mocker):
         ssh_process._cached_stderr_queue = mocker.sentinel.cached
         ssh_process._remote_get_process_io_queue_cache_lock = mocker.sentinel.cached
         ssh_process._get_process_io_queue = mocker.create_autospec(ssh_process._get_process_io_queue, spec_set=True)
         assert ssh_process._stderr_queue == mocker.sentinel.cached
-        ssh_process._stderr_queue_cache_lock.__enter__.assert_called()
-        ssh_process._stderr_queue_cache_lock.__exit__.assert_called()
+        ssh_process._stderr_lock.__enter__.assert_called()
+        ssh_process._stderr_lock.__exit__.assert_called()
+
+    def test__get_process_io_queue_reads_in_chunks(self, ssh_process, mocker):
+        output = io.BytesIO((b"x" * 1023 + b"\n") * 1024)
+        channel = mocker.create_autospec(Channel)
+        channel.recv.side_effect = output.read
+        stdout = ChannelFile(channel, "r", ssh_process.READ_CHUNK_SIZE)
+        lines = list(ssh_process._iterate_non_blocking_queue(ssh_process._get_process_io_queue(stdout)))
+        assert len(lines) == 1024
+        assert channel.recv.call_count <= 1024 * 1024 // ssh_process.READ_CHUNK_SIZE + 1
 
     def test_get_stdout_iter_not_cached(self, ssh_process, _stdout_queue_mock, mocker):
         expected_return = [mocker.sentinel.line1, mocker.sentinel.line2]
@@ -142,8 +150,8 @@ class TestBaseSSHProcess:
 
         ssh_process._iterate_non_blocking_queue.assert_called_once_with(_stdout_queue_mock.return_value)
         assert ssh_process._cached_stdout_iter is not None
-        ssh_process._stdout_iter_cache_lock.__enter__.assert_called()
-        ssh_process._stdout_iter_cache_lock.__exit__.assert_called()
+        ssh_process._stdout_lock.__enter__.assert_called()
+        ssh_process._stdout_lock.__exit__.assert_called()
 
     def test_get_stdout_iter_cached(self, ssh_process, _stdout_queue_mock, mocker):
         expected_return = [mocker.sentinel.line1, mocker.sentinel.line2]
@@ -156,8 +164,8 @@ class TestBaseSSHProcess:
         assert all([expect == actual for expect, actual in zip(expected_return, ssh_process.get_stdout_iter())])
 
         ssh_process._iterate_non_blocking_queue.assert_not_called()
-        ssh_process._stdout_iter_cache_lock.__enter__.assert_called()
-        ssh_process._stdout_iter_cache_lock.__exit__.assert_called()
+        ssh_process._stdout_lock.__enter__.assert_called()
+        ssh_process._stdout_lock.__exit__.assert_called()
 
     def test_get_stderr_iter_not_cached(self, ssh_process, _stderr_queue_mock, mocker):
         expected_return = [mocker.sentinel.line1, mocker.sentinel.line2]
@@ -172,8 +180,8 @@ class TestBaseSSHProcess:
 
         ssh_process._iterate_non_blocking_queue.assert_called_once_with(_stderr_queue_mock.return_value)
         assert ssh_process._cached_stderr_iter is not None
-        ssh_process._stderr_iter_cache_lock.__enter__.assert_called()
-        ssh_process._stderr_iter_cache_lock.__exit__.assert_called()
+        ssh_process._stderr_lock.__enter__.assert_called()
+        ssh_process._stderr_lock.__exit__.assert_called()
 
     def test_get_stderr_iter_cached(self, ssh_process, _stderr_queue_mock, mocker):
         expected_return = [mocker.sentinel.line1, mocker.sentinel.line2]
@@ -186,8 +194,8 @@ class TestBaseSSHProcess:
         assert all([expect == actual for expect, actual in zip(expected_return, ssh_process.get_stderr_iter())])
 
         ssh_process._iterate_non_blocking_queue.assert_not_called()
-        ssh_process._stderr_iter_cache_lock.__enter__.assert_called()
-        ssh_process._stderr_iter_cache_lock.__exit__.assert_called()
+        ssh_process._stderr_lock.__enter__.assert_called()
+        ssh_process._stderr_lock.__exit__.assert_called()
 
     def test_stdout_text(self, ssh_process, running_mock, mocker):
         running_mock.return_value = False
@@ -36,10 +36,8 @@ class TestPosixSSHProcess:
             stdout=mocker.create_autospec(ChannelFile),
             stderr=mocker.create_autospec(ChannelStderrFile),
         )
-        ssh_process._stdout_queue_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
-        ssh_process._stdout_iter_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
-        ssh_process._stderr_queue_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
-        ssh_process._stderr_iter_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
+        ssh_process._stdout_lock = mocker.create_autospec(threading.RLock(), spec_set=True)
+        ssh_process._stderr_lock = mocker.create_autospec(threading.RLock(), spec_set=True)
         ssh_process._pid = 123
         mocker.patch("mfd_connect.process.ssh.posix.PosixSSHProcess.running", return_value=True)
         return ssh_process
@@ -1,15 +1,13 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
-import threading
 from collections import namedtuple
 
 import pytest
 from mfd_typing import OSName
 from paramiko import ChannelStdinFile, ChannelFile, ChannelStderrFile
-from textwrap import dedent
 
 from mfd_connect.base import ConnectionCompletedProcess
-from mfd_connect.exceptions import SSHRemoteProcessEndException, RemoteProcessInvalidState
+from mfd_connect.exceptions import SSHRemoteProcessEndException, RemoteProcessInvalidState, SSHPIDException
 from mfd_connect.process.ssh.windows import WindowsSSHProcess
 
 from mfd_connect import SSHConnection
@@ -36,19 +34,20 @@ class TestWindowsSSHProcess:
             stdout=mocker.create_autospec(ChannelFile),
             stderr=mocker.create_autospec(ChannelStderrFile),
         )
-        ssh_process._stdout_queue_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
-        ssh_process._stdout_iter_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
-        ssh_process._stderr_queue_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
-        ssh_process._stderr_iter_cache_lock = mocker.create_autospec(threading.Lock(), spec_set=True)
+        ssh_process._stdout_lock = mocker.MagicMock()
+        ssh_process._stderr_lock = mocker.MagicMock()
         ssh_process._pid = 123
-        mocker.patch("mfd_connect.process.ssh.windows.WindowsSSHProcess.running", return_value=True)
         return ssh_process
 
+    @pytest.fixture
+    def running(self, mocker):
+        return mocker.patch("mfd_connect.process.ssh.windows.WindowsSSHProcess.running", return_value=True)
+
     def test_stop(self, ssh_process):
         with pytest.raises(NotImplementedError):
             ssh_process.stop()
 
-    def test_kill_no_wait(self, ssh_process, mocker):
+    def test_kill_no_wait(self, ssh_process, running, mocker):
         ssh_process._start_pipe_drain = mocker.create_autospec(ssh_process._start_pipe_drain)
         ssh_process.wait = mocker.create_autospec(ssh_process.wait)
         ssh_process._kill = mocker.create_autospec(ssh_process._kill)
@@ -57,7 +56,7 @@ class TestWindowsSSHProcess:
         ssh_process._start_pipe_drain.assert_called_once_with()
         ssh_process.wait.assert_not_called()
 
-    def test_kill_wait(self, ssh_process, mocker):
+    def test_kill_wait(self, ssh_process, running, mocker):
         ssh_process._start_pipe_drain = mocker.create_autospec(ssh_process._start_pipe_drain)
         ssh_process.wait = mocker.create_autospec(ssh_process.wait)
         ssh_process._kill = mocker.create_autospec(ssh_process._kill)
@@ -78,7 +77,48 @@ class TestWindowsSSHProcess:
         with pytest.raises(SSHRemoteProcessEndException, match="Cannot kill process pid:1"):
             ssh_process._kill(pid=1)
 
-    def test_kill_already_finished_process_exception(self, ssh_process):
+    def test_kill_multiple_pids(self, ssh_process, mocker):
+        ssh_process._pid = None
+        ssh_process._find_pids = mocker.create_autospec(ssh_process._find_pids, return_value=[1, 2])
+        ssh_process._start_pipe_drain = mocker.create_autospec(ssh_process._start_pipe_drain)
+        ssh_process._kill_many = mocker.create_autospec(ssh_process._kill_many)
+        ssh_process.kill(wait=None)
+        ssh_process._kill_many.assert_called_once_with([1, 2])
+
+    def test_running_without_pid_not_cached(self, ssh_process, mocker):
+        ssh_process._pid = None
+        ssh_process._find_pids = mocker.create_autospec(
+            ssh_process._find_pids, side_effect=[[1, 2], RemoteProcessInvalidState]
+        )
+        mocker.patch("mfd_connect.process.ssh.windows.monotonic", return_value=0)
+        assert ssh_process.running is True
+        assert ssh_process.running is False
+
+    def test_kill_multiple_pids_already_finished(self, ssh_process, mocker):
+        ssh_process._pid = None
+        ssh_process._find_pids = mocker.create_autospec(ssh_process._find_pids, side_effect=RemoteProcessInvalidState)
+        ssh_process._kill_many = mocker.create_autospec(ssh_process._kill_many)
+        with pytest.raises(RemoteProcessInvalidState, match="Process has already finished"):
+            ssh_process.kill()
+        ssh_process._kill_many.assert_not_called()
+
+    def test_running_with_pid(self, ssh_process, mocker):
+        ssh_process._find_pids = mocker.create_autospec(ssh_process._find_pids, return_value=[1, 123])
+        assert ssh_process.running is True
+
+    def test__kill_many(self, ssh_process):
+        ssh_process._connection_handle.execute_command.return_value = ConnectionCompletedProcess("kill", return_code=0)
+        ssh_process._kill_many(pids=[1, 2, 3])
+        ssh_process._connection_handle.execute_command.assert_called_once_with(
+            "taskkill /F /PID 1 /PID 2 /PID 3", expected_return_codes=None
+        )
+
+    def test__kill_many_failure(self, ssh_process):
+        ssh_process._connection_handle.execute_command.return_value = ConnectionCompletedProcess("kill", return_code=1)
+        with pytest.raises(SSHRemoteProcessEndException, match="Cannot kill process pid:1, 2"):
+            ssh_process._kill_many(pids=[1, 2])
+
+    def test_kill_already_finished_process_exception(self, ssh_process, running):
         ssh_process.running = False
 
         with pytest.raises(RemoteProcessInvalidState, match="Process has already finished"):
@@ -103,13 +143,7 @@ class TestWindowsSSHProcess:
             '| Select-Object  -ExpandProperty ProcessId"'
         )
         pids_found = [1231, 1232, 1233]
-        get_ciminstance_output = dedent(
-            """\
-            1231
-            1232
-            1233
-            """
-        )
+        get_ciminstance_output = "1231\n1232\n1233\n"
         ssh_process._connection_handle.execute_command.return_value = ConnectionCompletedProcess(
             command, return_code=0, stdout=get_ciminstance_output
         )
@@ -138,3 +172,30 @@ class TestWindowsSSHProcess:
         ssh_process._find_pids = mocker.create_autospec(ssh_process._find_pids, return_value=[1])
         _ = ssh_process.pid
         ssh_process._find_pids.assert_not_called()
+
+    def test_pid_lookup_cached_within_ttl(self, ssh_process, mocker):
+        ssh_process._pid = None
+        ssh_process._find_pids = mocker.create_autospec(ssh_process._find_pids, return_value=[1, 2])
+        for _ in range(2):
+            with pytest.raises(SSHPIDException):
+                _ = ssh_process.pid
+        ssh_process._find_pids.assert_called_once()
+
+    def test_pid_lookup_not_found_retried(self, ssh_process, mocker):
+        ssh_process._pid = None
+        ssh_process._find_pids = mocker.create_autospec(
+            ssh_process._find_pids, side_effect=[RemoteProcessInvalidState, [1]]
+        )
+        with pytest.raises(RemoteProcessInvalidState):
+            _ = ssh_process.pid
+        assert ssh_process.pid == 1
+        assert ssh_process._find_pids.call_count == 2
+
+    def test_pid_lookup_repeated_after_ttl(self, ssh_process, mocker):
+        ssh_process._pid = None
+        ssh_process._find_pids = mocker.create_autospec(ssh_process._find_pids, return_value=[1, 2])
+        mocker.patch("mfd_connect.process.ssh.windows.monotonic", side_effect=[0, ssh_process._PID_CACHE_TTL + 1])
+        for _ in range(2):
+            with pytest.raises(SSHPIDException):
+                _ = ssh_process.pid
+        assert ssh_process._find_pids.call_count == 2
@@ -7,7 +7,7 @@ from winrm import Protocol
 from winrm.exceptions import WinRMOperationTimeoutError
 
 from mfd_connect import WinRmConnection
-from mfd_connect.exceptions import RemoteProcessInvalidState
+from mfd_connect.exceptions import RemoteProcessInvalidState, RemoteProcessTimeoutExpired
 from mfd_connect.process.winrm.base import WinRmProcess
 
 
@@ -26,30 +26,41 @@ class TestWinRmProcess:
         process = WinRmProcess(command_id=command_id, connection=connection)
         return process
 
-    def test_init(self, process):
+    def test_init(self, process, connection):
         assert process.command_id == "command_id"
+        assert process._get_output is connection._server._raw_get_command_output
         assert process._stdout is None
         assert process._stderr is None
         assert process._return_code is None
 
     def test_running_true(self, mocker, process, caplog):
-        process._running = True
-        process._connection_handle._server._raw_get_command_output = mocker.MagicMock(
-            return_value=(b"stdout_msg", b"stderr_msg", 0, False)
-        )
+        process._get_output = mocker.MagicMock(return_value=(b"stdout_msg", b"stderr_msg", 0, False))
         assert process.running
 
     def test_running_false(self, mocker, process, caplog):
         process._stdout = "stdout_msg"
         process._stderr = "stderr_msg"
         process._return_code = 0
-        process._running = False
-        process._connection_handle._server._raw_get_command_output = mocker.MagicMock(
-            return_value=(b"stdout_msg", b"stderr_msg", 0, True)
-        )
+        process._done.set()
+        process._get_output = mocker.MagicMock(return_value=(b"stdout_msg", b"stderr_msg", 0, True))
         with caplog.at_level(logging.DEBUG):
             assert not process.running
 
+    def test_running_polled_once_within_backoff_window(self, mocker, process):
+        process._get_output = mocker.MagicMock(return_value=(b"", b"", None, False))
+        mocker.patch("mfd_connect.process.winrm.base.monotonic", return_value=100.0)
+        assert all(process.running for _ in range(3))
+        process._get_output.assert_called_once()
+
+    def test_running_poll_interval_backoff(self, mocker, process):
+        process._get_output = mocker.MagicMock(return_value=(b"", b"", None, False))
+        for _ in range(20):
+            process._pull_data()
+        assert process._poll_interval == process.MAX_POLL_INTERVAL
+        process._get_output.return_value = (b"output", b"", None, False)
+        process._pull_data()
+        assert process._poll_interval == process.MIN_POLL_INTERVAL
+
     def test_stop(self, connection, process, caplog):
         connection._server.cleanup_command.side_effect = Exception("cleanup command exception")  # Raise exception
         with pytest.raises(RemoteProcessInvalidState, match="Found problem during stop"):
@@ -64,62 +75,95 @@ class TestWinRmProcess:
         connection._server._raw_get_command_output.return_value = (b"stdout_msg", b"", 0, True)
         with caplog.at_level(logging.DEBUG):
             process._pull_data()
-            assert process._stdout == "stdout_msg"
+            assert process._stdout_buf == b"stdout_msg"
+            connection._server._raw_get_command_output.return_value = (b"", b"", 0, True)
+            assert process.stdout_text == "stdout_msg"
 
     def test_pull_data_stderr(self, connection, process, caplog):
         connection._server._raw_get_command_output.return_value = (b"", b"stderr_msg", 0, True)
         with caplog.at_level(logging.DEBUG):
             process._pull_data()
-            assert process._stderr == "stderr_msg"
+            assert process._stderr_buf == b"stderr_msg"
+            connection._server._raw_get_command_output.return_value = (b"", b"", 0, True)
+            assert process.stderr_text == "stderr_msg"
 
     def test_pull_data_exception(self, mocker, process, caplog):
-        process._connection_handle._server._raw_get_command_output = mocker.MagicMock(
-            side_effect=WinRMOperationTimeoutError("Operation timed out")
-        )
+        process._get_output = mocker.MagicMock(side_effect=WinRMOperationTimeoutError("Operation timed out"))
         assert process.running
 
+    def test_pull_data_exception_backoff(self, mocker, process):
+        process._get_output = mocker.MagicMock(side_effect=WinRMOperationTimeoutError("Operation timed out"))
+        mocker.patch("mfd_connect.process.winrm.base.monotonic", return_value=100.0)
+        assert process.running
+        assert process.running
+        process._get_output.assert_called_once()
+        assert process._poll_interval > process.MIN_POLL_INTERVAL
+
     def test_stdout_text(self, mocker, process):
         process._stdout = "Expected stdout text"
-        process._running = False
-        process._connection_handle._server._raw_get_command_output = mocker.MagicMock(return_value=(b"", b"", 0, True))
+        process._done.set()
+        process._get_output = mocker.MagicMock(return_value=(b"", b"", 0, True))
         assert process.stdout_text == "Expected stdout text"
 
     def test_stdout_text_pull_data(self, mocker, process):
-        process._connection_handle._server._raw_get_command_output = mocker.MagicMock(
-            return_value=(b"stdout_msg", b"", 0, True)
-        )
+        process._get_output = mocker.MagicMock(return_value=(b"stdout_msg", b"", 0, True))
         assert process.stdout_text == "stdout_msg"
 
+    def test_stdout_text_pulled_in_chunks(self, mocker, process):
+        process._get_output = mocker.MagicMock(
+            side_effect=[(b"stdout_\xc5", b"", None, False), (b"\x82msg", b"", 0, True)]
+        )
+        process._pull_data()
+        process._pull_data()
+        assert process.stdout_text == "stdout_\u0142msg"
+        assert process.stdout_text == "stdout_\u0142msg"
+
     def test_stderr_text(self, mocker, process):
         process._stderr = "Expected stderr text"
-        process._running = False
-        process._connection_handle._server._raw_get_command_output = mocker.MagicMock(return_value=(b"", b"", 0, True))
+        process._done.set()
+        process._get_output = mocker.MagicMock(return_value=(b"", b"", 0, True))
         assert process.stderr_text == "Expected stderr text"
 
     def test_stderr_text_pull_data(self, mocker, process):
-        process._connection_handle._server._raw_get_command_output = mocker.MagicMock(
-            return_value=(b"", b"stderr_msg", 0, True)
-        )
+        process._get_output = mocker.MagicMock(return_value=(b"", b"stderr_msg", 0, True))
         assert process.stderr_text == "stderr_msg"
 
     def test_return_code(self, mocker, process):
         process._return_code = 0
-        process._connection_handle._server._raw_get_command_output = mocker.MagicMock(
-            return_value=(b"stdout_msg", b"stderr_msg", 0, True)
-        )
+        process._get_output = mocker.MagicMock(return_value=(b"stdout_msg", b"stderr_msg", 0, True))
         assert process.return_code == 0
 
     def test_return_code_pull_data(self, mocker, process):
-        process._connection_handle._server._raw_get_command_output = mocker.MagicMock(return_value=(b"", b"", 0, True))
+        process._get_output = mocker.MagicMock(return_value=(b"", b"", 0, True))
         assert process.return_code == 0
 
     def test_running(self, mocker, process):
-        process._connection_handle._server._raw_get_command_output = mocker.MagicMock(
-            return_value=(b"stdout_msg", b"stderr_msg", 0, True)
-        )
-        process._running = False
+        process._get_output = mocker.MagicMock(return_value=(b"stdout_msg", b"stderr_msg", 0, True))
+        process._done.set()
         assert not process.running
 
     def test_running_pull_data(self, mocker, process):
-        process._connection_handle._server._raw_get_command_output = mocker.MagicMock(return_value=(b"", b"", 0, True))
+        process._get_output = mocker.MagicMock(return_value=(b"", b"", 0, True))
         assert not process.running
+
+    def test_running_not_polled_after_done(self, mocker, process):
+        process._get_output = mocker.MagicMock(return_value=(b"", b"", 0, True))
+        assert not process.running
+        assert not process.running
+        process._get_output.assert_called_once()
+
+    def test_wait(self, mocker, process):
+        process._get_output = mocker.MagicMock(side_effect=[(b"", b"", None, False), (b"", b"", 1, True)])
+        # waiting on event until next poll is due
+        mocker.patch.object(process._done, "wait", side_effect=lambda _: setattr(process, "_next_poll_at", 0.0))
+        assert process.wait(timeout=10) == 1
+        process._done.wait.assert_called_once()
+
+    def test_wait_timeout(self, mocker, process):
+        process._get_output = mocker.MagicMock(return_value=(b"", b"", None, False))
+        mocker.patch(
+            "mfd_connect.process.winrm.base.TimeoutCounter",
+            return_value=mocker.MagicMock(__bool__=mocker.Mock(side_effect=[False, True])),
+        )
+        with pytest.raises(RemoteProcessTimeoutExpired):
+            process.wait(timeout=1)
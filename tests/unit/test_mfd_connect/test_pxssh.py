@@ -10,6 +10,7 @@ from unittest.mock import patch, Mock
 import pytest
 from mfd_typing.os_values import OSBitness, OSType, OSName
 
+import mfd_connect.pxssh
 from mfd_connect import PxsshConnection
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_connect.exceptions import (
@@ -36,13 +37,13 @@ class TestPxsshConnection:
         return pxssh
 
     @pytest.fixture()
-    def pxsshObj(self):
+    def pxsshObj(self, monkeypatch):
         pxsshObj = PxsshConnection(ip="10.10.10.10", username="", password="")
         pxsshObj._ip = "10.10.10.10"
         pxsshObj._username = ""
         pxsshObj._password = ""
         pxsshObj._prompts = "$"
-        platform.system = Mock(return_value="windows")
+        monkeypatch.setattr(mfd_connect.pxssh, "_IS_WINDOWS", True)
         pxsshObj._connect = Mock(
             return_value=ConnectionCompletedProcess(return_code=None, args="command", stdout=None, stderr="stderr")
         )
@@ -50,7 +51,6 @@ class TestPxsshConnection:
 
     @pytest.mark.skipif("Linux" not in platform.system(), reason="Skipping if not Linux.")
     def test_init_windows_exception(self, pxsshObj):
-        platform.system = Mock(return_value="windows")
         with pytest.raises(PxsshException):
             PxsshConnection(ip="10.10.10.10", username="", password="")
 
@@ -157,6 +157,18 @@ class TestPxsshConnection:
         pxssh._process_classes = mocker.Mock(return_value=[OSName.LINUX])
         pxssh._connect()
 
+    @pytest.mark.skipif("Linux" not in platform.system(), reason="Skipping if not Linux.")
+    def test__connect_read_buffer(self, pxssh, mocker):
+        pxssh_mock = mocker.patch("mfd_connect.pxssh.pxssh.pxssh")
+        pxssh.get_os_name = mocker.Mock(return_value=OSName.LINUX)
+        pxssh.get_os_type = mocker.Mock(return_value=OSType.POSIX)
+        pxssh._connect()
+        pxssh_mock.assert_called_once_with(
+            maxread=PxsshConnection.MAX_READ,
+            searchwindowsize=PxsshConnection.SEARCH_WINDOW_SIZE,
+            options={"StrictHostKeyChecking": "no"},
+        )
+
     def test_execute_command_raise_custom_exception(self, pxssh, mocker):
         pxssh._exec_command = mocker.Mock(return_value=(None, None, None, 1))
         pxssh._adjust_command = mocker.Mock(return_value=("cmd arg1 arg2"))
@@ -227,6 +239,15 @@ class TestPxsshConnection:
         assert stdout == b"FAILED, ERROR"
         assert exitstatus == 5
 
+    @pytest.mark.skipif("Linux" not in platform.system(), reason="Skipping if not Linux.")
+    def test__exec_command_error_not_utf8_output(self, pxssh, mocker):
+        pxssh._child = mocker.Mock()
+        pxssh._child.expect = mocker.Mock(return_value=0)
+        pxssh._child.before = b"\xff\xfe Segmentation fault"
+        pxssh._child.signalstatus = None
+        command, stdout, signalstatus, exitstatus = pxssh._exec_command("ls", prompts=" $")
+        assert exitstatus == 5
+
     @pytest.mark.skipif("Linux" not in platform.system(), reason="Skipping if not Linux.")
     def test__exec_command_stderr_pipe(self, pxssh, mocker):
         pxssh.__init__ = mocker.create_autospec(pxssh.__init__, return_value=None)
@@ -297,6 +318,15 @@ class TestPxsshConnection:
         assert stdout == b"Operation resulted in Custom Error"
         assert exitstatus == 5
 
+    @pytest.mark.skipif("Linux" not in platform.system(), reason="Skipping if not Linux.")
+    def test__exec_command_custom_error_special_characters(self, pxssh, mocker):
+        pxssh._child = mocker.Mock()
+        pxssh._child.expect = mocker.Mock(return_value=0)
+        pxssh._child.before = b"Operation resulted in Error (code 1)"
+        pxssh._child.signalstatus = None
+        *_, exitstatus = pxssh._exec_command("ls", prompts=" $", error_list=["Error (code 1)", "[Another] Error"])
+        assert exitstatus == 5
+
     def test__disconnect(self, pxssh, mocker):
         pxssh.__init__ = mocker.create_autospec(pxssh.__init__, return_value=None)
         pxssh._child = mocker.Mock()
@@ -324,6 +354,12 @@ class TestPxsshConnection:
         cmd = "some cmd"
         assert pxssh._adjust_command(cmd) == "sudo " + cmd
 
+    def test__adjust_command_echo(self, pxssh):
+        pxssh._os_type = OSType.POSIX
+        pxssh.enable_sudo()
+        cmd = "echo 1 > file"
+        assert pxssh._adjust_command(cmd) == f'sudo sh -c "{cmd}"'
+
     def test__adjust_command_disable_sudo(self, pxssh):
         pxssh._os_type = OSType.POSIX
         pxssh._os_type = OSType.POSIX
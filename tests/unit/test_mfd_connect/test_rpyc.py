@@ -1,11 +1,14 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import copy
+import itertools
+import socket
 import subprocess
-import time
+import threading
 import types
 from pathlib import Path
 from subprocess import CompletedProcess, CalledProcessError
-from unittest.mock import patch
+from unittest.mock import patch, create_autospec
 from rpyc.core.service import ClassicService
 import pytest
 import rpyc as rpyc_module
@@ -13,6 +16,7 @@ from mfd_common_libs import log_levels
 from mfd_typing.os_values import OSType, OSName
 
 from mfd_connect import RPyCConnection
+from mfd_connect.rpyc import _ConnectionPool, connection_retry_delay
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_connect.exceptions import (
     ConnectionCalledProcessError,
@@ -23,42 +27,89 @@ from mfd_connect.exceptions import (
 )
 from mfd_connect.process.rpyc import PosixRPyCProcess, WindowsRPyCProcess, ESXiRPyCProcess
 
+POWERSHELL_COMMAND = (
+    'powershell.exe -OutPutFormat Text -nologo -noninteractive "$host.UI.RawUI.BufferSize = '
+    'new-object System.Management.Automation.Host.Size(512,3000);cmd arg1 arg 2"'
+)
+EXECUTE_WITH_TIMEOUT_EXPECTED_REPR = repr(
+    ConnectionCompletedProcess(
+        args="arg",
+        stdout="\nstd\nout\n",
+        stdout_bytes=b"\nstd\nout\n",
+        stderr="\nstd\nerr\n",
+        stderr_bytes=b"\nstd\nerr\n",
+        return_code=0,
+    )
+)
+
 
 class TestRPyCConnection:
     """Tests of RPyCConnection."""
 
     CustomTestException = CalledProcessError
 
-    @pytest.fixture()
-    def rpyc(self, mocker):
+    @pytest.fixture(scope="class")
+    def rpyc_template(self):
         with patch.object(RPyCConnection, "__init__", return_value=None):
             conn = RPyCConnection(ip="10.10.10.10")
-            conn._ip = "10.10.10.10"
-            conn._os_type = conn._cached_os_type = OSType.POSIX
-            conn._enable_bg_serving_thread = True
-            conn._default_timeout = None
-            conn._connection_timeout = 360
-            conn.path_extension = None
-            conn.cache_system_data = True
-            conn._ipv6 = False
-            return conn
+        conn._ip = "10.10.10.10"
+        conn._os_type = conn._cached_os_type = OSType.POSIX
+        conn._enable_bg_serving_thread = True
+        conn._default_timeout = None
+        conn._connection_timeout = 360
+        conn.path_extension = None
+        conn.cache_system_data = True
+        conn._ipv6 = False
+        return conn
 
-    def test_wait_for_host(self, rpyc, mocker):
+    @pytest.fixture()
+    def rpyc(self, rpyc_template):
+        return copy.copy(rpyc_template)
+
+    @pytest.fixture()
+    def clock(self, mocker):
+        """Fake clock, sleep calls advance it instantly instead of waiting, monotonic and TimeoutCounter read it."""
+        clock = types.SimpleNamespace(now=0.0)
+
+        def _sleep(seconds: float) -> None:
+            clock.now += seconds
+
+        clock.sleep = mocker.Mock(side_effect=_sleep)
+        mocker.patch("mfd_connect.rpyc.time.sleep", clock.sleep)
+        mocker.patch("mfd_connect.rpyc.time.monotonic", lambda: clock.now)
+        mocker.patch("mfd_common_libs.timeout_counter.time", lambda: clock.now)
+        return clock
+
+    def test_wait_for_host(self, rpyc, mocker, clock):
         rpyc._create_connection = mocker.Mock(side_effect=[OSError, OSError, rpyc_module.Connection])
         rpyc._connection = mocker.Mock()
         remote = mocker.patch("mfd_connect.RPyCConnection.remote", new_callable=mocker.PropertyMock)
         remote.return_value = rpyc_module.Connection
         mocker.patch("rpyc.BgServingThread", mocker.create_autospec(rpyc_module.BgServingThread))
-        time.sleep = mocker.Mock(return_value=None)
         rpyc.wait_for_host(timeout=10)
 
-    def test_wait_for_host_fail(self, rpyc, mocker):
+    def test_wait_for_host_returns_pooled_connection_on_disconnect(self, rpyc, mocker, clock):
+        pooled = mocker.Mock(closed=False)
+        rpyc._port = 18812
+        rpyc._ssl_keyfile = None
+        rpyc._ssl_certfile = None
+        rpyc._reuse_connection = True
+        rpyc._enable_bg_serving_thread = False
+        rpyc._connection_pool = mocker.create_autospec(_ConnectionPool, instance=True)
+        rpyc._create_connection = mocker.Mock(return_value=pooled)
+        rpyc.wait_for_host(timeout=10)
+        assert rpyc._pooled_connection is pooled
+        rpyc.disconnect()
+        rpyc._connection_pool.release.assert_called_once_with(rpyc._pool_key, pooled, rpyc.CONNECTION_POOL_SIZE)
+        pooled.close.assert_not_called()
+
+    def test_wait_for_host_fail(self, rpyc, mocker, clock):
         rpyc._create_connection = mocker.Mock(side_effect=OSError)
-        time.sleep = mocker.Mock(return_value=None)
         with pytest.raises(TimeoutError):
             rpyc.wait_for_host(timeout=1)
+        assert clock.now > 1
 
-    def test_wait_for_host_with_background_thread(self, rpyc, mocker):
+    def test_wait_for_host_with_background_thread(self, rpyc, mocker, clock):
         rpyc._os_type = OSType.WINDOWS
         rpyc._create_connection = mocker.Mock(side_effect=[OSError, OSError, rpyc_module.Connection])
         rpyc._connection = mocker.Mock()
@@ -66,19 +117,17 @@ class TestRPyCConnection:
         remote = mocker.patch("mfd_connect.RPyCConnection.remote", new_callable=mocker.PropertyMock)
         bg_thread = mocker.patch("rpyc.BgServingThread")
         remote.return_value = rpyc_module.Connection
-        time.sleep = mocker.Mock(return_value=None)
         rpyc.wait_for_host(timeout=10)
         bg_thread.assert_called_once()
 
-    def test__send_command_and_disconnect_platform_with_drop(self, rpyc, mocker):
-        time.sleep = mocker.Mock(return_value=None)
+    def test__send_command_and_disconnect_platform_with_drop(self, rpyc, mocker, clock):
         rpyc._connection = mocker.Mock()
         rpyc.execute_command = mocker.Mock(side_effect=EOFError)
         rpyc._background_serving_thread = mocker.Mock()
         rpyc.send_command_and_disconnect_platform("")
+        clock.sleep.assert_called_once_with(10)
 
-    def test__send_command_and_disconnect_platform_fail(self, rpyc, mocker):
-        time.sleep = mocker.Mock(return_value=None)
+    def test__send_command_and_disconnect_platform_fail(self, rpyc, mocker, clock):
         rpyc._connection = mocker.Mock()
         e = ConnectionCalledProcessError(1, "ls")
         rpyc.execute_command = mocker.Mock(side_effect=e)
@@ -86,39 +135,33 @@ class TestRPyCConnection:
         with pytest.raises(ConnectionCalledProcessError):
             rpyc.send_command_and_disconnect_platform("")
 
-    def test__send_command_and_disconnect_platform_with_background_thread(self, rpyc, mocker):
-        time.sleep = mocker.Mock(return_value=None)
+    def test__send_command_and_disconnect_platform_with_background_thread(self, rpyc, mocker, clock):
         rpyc._connection = mocker.Mock()
         rpyc._background_serving_thread = mocker.Mock()
         rpyc.execute_command = mocker.Mock(side_effect=EOFError)
         rpyc.send_command_and_disconnect_platform("")
         rpyc._background_serving_thread.stop.assert_called_once()
 
-    def test_execute_command_raise_custom_exception(self, rpyc, mocker):
-        rpyc.get_os_name = mocker.create_autospec(rpyc.get_os_name)
-        completed_process = CompletedProcess("cmd arg1 arg2", returncode=1)
+    @pytest.fixture
+    def subprocess_run(self, rpyc, mocker):
+        rpyc.get_os_name = mocker.Mock(return_value=None)
         rpyc.modules = mocker.Mock()
-        rpyc.modules().subprocess.run.return_value = completed_process
         rpyc.path_extension = None
+        return rpyc.modules().subprocess.run
+
+    def test_execute_command_raise_custom_exception(self, rpyc, subprocess_run):
+        subprocess_run.return_value = CompletedProcess("cmd arg1 arg2", returncode=1)
         with pytest.raises(self.CustomTestException):
             rpyc.execute_command("cmd arg1 arg2", custom_exception=self.CustomTestException)
 
-    def test_execute_command_not_raise_custom_exception(self, rpyc, mocker):
-        rpyc.get_os_name = mocker.create_autospec(rpyc.get_os_name)
-        completed_process = CompletedProcess("cmd arg1 arg2", returncode=0)
-        rpyc.modules = mocker.Mock()
-        rpyc.modules().subprocess.run.return_value = completed_process
-        rpyc.path_extension = None
+    def test_execute_command_not_raise_custom_exception(self, rpyc, subprocess_run):
+        subprocess_run.return_value = CompletedProcess("cmd arg1 arg2", returncode=0)
         rpyc.execute_command("cmd arg1 arg2", custom_exception=self.CustomTestException)
 
-    def test_execute_command_input_data_provided(self, rpyc, mocker):
-        rpyc.get_os_name = mocker.create_autospec(rpyc.get_os_name)
-        completed_process = CompletedProcess("cmd arg1 arg2", returncode=0)
-        rpyc.modules = mocker.Mock()
-        rpyc.modules().subprocess.run.return_value = completed_process
-        rpyc.path_extension = None
+    def test_execute_command_input_data_provided(self, rpyc, subprocess_run):
+        subprocess_run.return_value = CompletedProcess("cmd arg1 arg2", returncode=0)
         rpyc.execute_command("cmd arg1 arg2", input_data="X\n")
-        rpyc.modules().subprocess.run.assert_called_with(
+        subprocess_run.assert_called_with(
             ["cmd", "arg1", "arg2"],
             input=b"X\n",
             cwd=None,
@@ -131,18 +174,12 @@ class TestRPyCConnection:
             stdin=None,
         )
 
-    def test_execute_command_skip_logging_provided(self, rpyc, mocker, caplog):
-        caplog.set_level(0)
+    def test_execute_command_skip_logging_provided(self, rpyc, subprocess_run, caplog):
+        caplog.set_level(log_levels.OUT, logger="mfd_connect.base")
         cmd = "cmd arg1 arg2"
         stdout = "someout"
         stderr = "someerr"
-        completed_process = CompletedProcess(
-            cmd, stdout=bytes(stdout, encoding="UTF-8"), stderr=bytes(stderr, encoding="UTF-8"), returncode=0
-        )
-        rpyc.get_os_name = mocker.create_autospec(rpyc.get_os_name)
-        rpyc.modules = mocker.Mock()
-        rpyc.modules().subprocess.run.return_value = completed_process
-        rpyc.path_extension = None
+        subprocess_run.return_value = CompletedProcess(cmd, stdout=b"someout", stderr=b"someerr", returncode=0)
         rpyc.execute_command(cmd, skip_logging=True)
         assert not any(stdout in msg or stderr in msg for msg in caplog.messages)
 
@@ -162,12 +199,9 @@ class TestRPyCConnection:
     def test_execute_with_timeout_timeout_reached(self, rpyc, mocker):
         rpyc._os_type = OSType.POSIX
         rpyc.modules = mocker.Mock()
-        rpyc._resolve_process_output_arguments = mocker.create_autospec(
-            rpyc._resolve_process_output_arguments, return_value=("", "")
-        )
+        rpyc._resolve_process_output_arguments = mocker.Mock(return_value=("", ""))
         rpyc._handle_path_extension = mocker.create_autospec(rpyc._handle_path_extension, return_value=None)
-        rpyc._process_class = mocker.Mock(rpyc._process_class)
-        rpyc._process_class.__call__().return_value = None
+        rpyc._process_class = mocker.Mock()
         time_mock = mocker.Mock()
         time_mock.return_value = 0
         with pytest.raises(TimeoutError):
@@ -198,48 +232,19 @@ class TestRPyCConnection:
 
         actual = rpyc.execute_with_timeout(command="arg", timeout=5, custom_exception=self.CustomTestException)
 
-        expected_output = ConnectionCompletedProcess(
-            args="arg",
-            stdout="\nstd\nout\n",
-            stdout_bytes=b"\nstd\nout\n",
-            stderr="\nstd\nerr\n",
-            stderr_bytes=b"\nstd\nerr\n",
-            return_code=0,
-        )
-
-        assert repr(actual) == repr(expected_output)
+        assert repr(actual) == EXECUTE_WITH_TIMEOUT_EXPECTED_REPR
 
-    def test_execute_powershell_raise_custom_exception(self, rpyc, mocker):
-        completed_process = CompletedProcess(
-            'powershell.exe -OutPutFormat Text -nologo -noninteractive "$host.UI.RawUI.BufferSize = '
-            'new-object System.Management.Automation.Host.Size(512,3000);cmd arg1 arg 2"',
-            returncode=1,
-        )
-        rpyc.get_os_name = mocker.create_autospec(rpyc.get_os_name)
-        rpyc.modules = mocker.Mock()
-        rpyc.modules().subprocess.run.return_value = completed_process
-        rpyc.path_extension = None
+    def test_execute_powershell_raise_custom_exception(self, rpyc, subprocess_run):
+        subprocess_run.return_value = CompletedProcess(POWERSHELL_COMMAND, returncode=1)
         with pytest.raises(self.CustomTestException):
             rpyc.execute_powershell(
                 "cmd arg1 arg 2",
                 custom_exception=self.CustomTestException,
             )
 
-    def test_execute_powershell_not_raise_custom_exception(self, rpyc, mocker):
-        completed_process = CompletedProcess(
-            'powershell.exe -OutPutFormat Text -nologo -noninteractive "$host.UI.RawUI.BufferSize = '
-            'new-object System.Management.Automation.Host.Size(512,3000);cmd arg1 arg 2"',
-            returncode=0,
-        )
-        rpyc.get_os_name = mocker.create_autospec(rpyc.get_os_name)
-        rpyc.modules = mocker.Mock()
-        rpyc.modules().subprocess.run.return_value = completed_process
-        rpyc.path_extension = None
-        rpyc.execute_command(
-            'powershell.exe -OutPutFormat Text -nologo -noninteractive "$host.UI.RawUI.BufferSize = '
-            'new-object System.Management.Automation.Host.Size(512,3000);cmd arg1 arg 2"',
-            custom_exception=self.CustomTestException,
-        )
+    def test_execute_powershell_not_raise_custom_exception(self, rpyc, subprocess_run):
+        subprocess_run.return_value = CompletedProcess(POWERSHELL_COMMAND, returncode=0)
+        rpyc.execute_command(POWERSHELL_COMMAND, custom_exception=self.CustomTestException)
 
     def test_execute_powershell_outcome_check(self, rpyc, mocker):
         rpyc.modules = mocker.Mock()
@@ -247,8 +252,7 @@ class TestRPyCConnection:
         rpyc.path_extension = None
         rpyc.execute_powershell("cmd arg1 arg 2", custom_exception=self.CustomTestException, expected_return_codes={0})
         rpyc.execute_command.assert_called_with(
-            command='powershell.exe -OutPutFormat Text -nologo -noninteractive "$host.UI.RawUI.BufferSize = '
-            'new-object System.Management.Automation.Host.Size(512,3000);cmd arg1 arg 2"',
+            command=POWERSHELL_COMMAND,
             custom_exception=self.CustomTestException,
             cwd=None,
             discard_stderr=False,
@@ -602,27 +606,28 @@ class TestRPyCConnection:
             skip_logging=False,
         )
 
-    @pytest.fixture()
-    def prepared_rpyc(self, mocker):
+    @pytest.fixture(scope="class")
+    def prepared_rpyc_class(self):
         class PreparedRPyCConnection(RPyCConnection):
             pass
 
-        mocker.patch("rpyc.BgServingThread", mocker.Mock())
+        PreparedRPyCConnection._create_connection = create_autospec(RPyCConnection._create_connection)
+        PreparedRPyCConnection.wait_for_host = create_autospec(RPyCConnection.wait_for_host)
+        PreparedRPyCConnection.get_os_type = create_autospec(RPyCConnection.get_os_type, return_value=OSType.POSIX)
+        PreparedRPyCConnection._os_type = OSType.POSIX
+        PreparedRPyCConnection.get_os_name = create_autospec(RPyCConnection.get_os_name, return_value=OSName.LINUX)
+        return PreparedRPyCConnection
+
+    @pytest.fixture()
+    def prepared_rpyc(self, prepared_rpyc_class, mocker):
+        for method in ("_create_connection", "wait_for_host", "get_os_type", "get_os_name"):
+            getattr(prepared_rpyc_class, method).reset_mock()
         connection = mocker.create_autospec(rpyc_module.Connection)
         connection.closed = False
-        PreparedRPyCConnection._create_connection = mocker.create_autospec(
-            RPyCConnection._create_connection, return_value=connection
-        )
-        PreparedRPyCConnection.wait_for_host = mocker.create_autospec(RPyCConnection.wait_for_host)
-        PreparedRPyCConnection.get_os_type = mocker.create_autospec(
-            RPyCConnection.get_os_type, return_value=OSType.POSIX
-        )
-        PreparedRPyCConnection._os_type = OSType.POSIX
-        PreparedRPyCConnection.get_os_name = mocker.create_autospec(
-            RPyCConnection.get_os_name, return_value=OSName.LINUX
-        )
+        prepared_rpyc_class._create_connection.return_value = connection
+        mocker.patch("rpyc.BgServingThread", mocker.Mock())
         mocker.patch("mfd_connect.base.Connection.log_connected_host_info", mocker.Mock())
-        return PreparedRPyCConnection
+        return prepared_rpyc_class
 
     def test__init__(self, prepared_rpyc):
         rpyc = prepared_rpyc("10.10.10.10")
@@ -647,91 +652,28 @@ class TestRPyCConnection:
         assert rpyc._process_class == PosixRPyCProcess
         assert rpyc._os_type == OSType.POSIX
 
-    def test_disconnect(self, prepared_rpyc, mocker):
+    @pytest.mark.parametrize("case", ["default", "bg_thread", "close_raises"])
+    def test_disconnect(self, prepared_rpyc, mocker, case):
         debug_mock = mocker.patch("mfd_connect.rpyc.logger.log", mocker.Mock())
         rpyc = prepared_rpyc("10.10.10.10")
+        if case == "bg_thread":
+            rpyc._background_serving_thread = mocker.Mock()
         rpyc.remote
-        rpyc.disconnect()
-        rpyc._connection.close.assert_called_once()
-        rpyc._background_serving_thread.stop.assert_called_once()
-        debug_mock.assert_called_with(level=log_levels.MODULE_DEBUG, msg="Closing connection with 10.10.10.10")
-
-    def test_disconnect_with_background_thread(self, prepared_rpyc, mocker):
-        debug_mock = mocker.patch("mfd_connect.rpyc.logger.log", mocker.Mock())
-        rpyc = prepared_rpyc("10.10.10.10")
-        rpyc._background_serving_thread = mocker.Mock()
-        rpyc.remote
-        rpyc.disconnect()
+        if case == "close_raises":
+            rpyc._connection.close.side_effect = Exception("Some exception")
+            with pytest.raises(
+                ModuleFrameworkDesignError, match="Exception occurred while closing connection: Some exception"
+            ):
+                rpyc.disconnect()
+        else:
+            rpyc.disconnect()
         rpyc._connection.close.assert_called_once()
         rpyc._background_serving_thread.stop.assert_called_once()
         debug_mock.assert_called_with(level=log_levels.MODULE_DEBUG, msg="Closing connection with 10.10.10.10")
 
-    def test_disconnect_failure_check(self, prepared_rpyc):
-        rpyc = prepared_rpyc("10.10.10.10")
-        rpyc.remote
-        rpyc._connection.close.side_effect = Exception("Some exception")
-        with pytest.raises(
-            ModuleFrameworkDesignError, match="Exception occurred while closing connection: Some exception"
-        ):
-            rpyc.disconnect()
-        rpyc._background_serving_thread.stop.assert_called_once()
-
-    @pytest.mark.parametrize(
-        "os_type, command, expected_split_command",
-        [
-            (OSType.POSIX, "/root/app -c -b 10", ["/root/app", "-c", "-b", "10"]),
-            (OSType.WINDOWS, "c:\\tmp\\app.exe -c -b 10", ["c:\\tmp\\app.exe", "-c", "-b", "10"]),
-        ],
-    )
-    def test_start_process_no_shell(self, rpyc, mocker, os_type, command, expected_split_command):
-        rpyc._os_type = os_type
-        rpyc.modules = mocker.Mock()
-        rpyc._resolve_process_output_arguments = mocker.create_autospec(
-            rpyc._resolve_process_output_arguments, return_value=("", "")
-        )
-        rpyc._handle_path_extension = mocker.create_autospec(rpyc._handle_path_extension, return_value=None)
-        rpyc._process_class = mocker.Mock(rpyc._process_class)
-        rpyc._process_class.__call__().return_value = None
-        rpyc.start_process(command)
-        rpyc.modules().subprocess.Popen.assert_called_with(
-            expected_split_command,
-            cwd=None,
-            encoding="utf-8",
-            env=None,
-            errors="backslashreplace",
-            shell=False,
-            stderr="",
-            stdin=-3,
-            stdout="",
-        )
-
-    def test_start_process_affinity_posix(self, rpyc, mocker):
-        rpyc._os_type = OSType.POSIX
-        rpyc.modules = mocker.Mock()
-        rpyc._resolve_process_output_arguments = mocker.create_autospec(
-            rpyc._resolve_process_output_arguments, return_value=("", "")
-        )
-        rpyc._handle_path_extension = mocker.create_autospec(rpyc._handle_path_extension, return_value=None)
-        rpyc._process_class = mocker.Mock(rpyc._process_class)
-        rpyc._process_class.__call__().return_value = None
-        rpyc.start_process("command arg1 arg2", cpu_affinity=[1, 3, 7])
-
-        rpyc.modules().subprocess.Popen.assert_called_with(
-            ["taskset", "0x8a", "command", "arg1", "arg2"],
-            cwd=None,
-            encoding="utf-8",
-            env=None,
-            errors="backslashreplace",
-            shell=False,
-            stderr="",
-            stdin=-3,
-            stdout="",
-        )
-
     def test__run_esxi_command(self, rpyc, mocker, caplog):
         caplog.set_level(log_levels.MODULE_DEBUG)
-        rpyc.get_os_name = mocker.create_autospec(rpyc.get_os_name)
-        rpyc.get_os_name.return_value = OSName.ESXI
+        rpyc.get_os_name = mocker.Mock(return_value=OSName.ESXI)
         command = "cmd arg1 arg2"
         expected_output = CompletedProcess(args=command, stdout=b"output", stderr=b"", returncode=1)
         popen_output = mocker.Mock()
@@ -750,8 +692,7 @@ class TestRPyCConnection:
 
     def test__run_esxi_command_empty_output(self, rpyc, mocker, caplog):
         caplog.set_level(log_levels.MODULE_DEBUG)
-        rpyc.get_os_name = mocker.create_autospec(rpyc.get_os_name)
-        rpyc.get_os_name.return_value = OSName.ESXI
+        rpyc.get_os_name = mocker.Mock(return_value=OSName.ESXI)
         command = "cmd arg1 arg2"
         expected_output = CompletedProcess(args=command, stdout=b"", stderr=b"", returncode=0)
         popen_output = mocker.Mock()
@@ -766,38 +707,15 @@ class TestRPyCConnection:
         assert repr(output) == repr(expected_output)
         popen_mock.assert_called_once_with(command, cwd="/", env={}, shell=True, stdout=1, stderr=0)
 
-    @pytest.mark.parametrize(
-        "os_type, command, expected_split_command",
-        [
-            (OSType.POSIX, "/root/app -c -b 10", ["/root/app", "-c", "-b", "10"]),
-            (OSType.WINDOWS, "c:\\tmp\\app.exe -c -b 10", ["c:\\tmp\\app.exe", "-c", "-b", "10"]),
-        ],
-    )
-    def test_start_process_no_log_file(self, rpyc, mocker, os_type, command, expected_split_command):
-        rpyc._os_type = os_type
+    @pytest.fixture
+    def start_process_harness(self, rpyc, mocker):
         rpyc.modules = mocker.Mock()
-        rpyc._resolve_process_output_arguments = mocker.create_autospec(
-            rpyc._resolve_process_output_arguments, return_value=("", "")
-        )
+        rpyc._resolve_process_output_arguments = mocker.Mock(return_value=("", ""))
         rpyc._handle_path_extension = mocker.create_autospec(rpyc._handle_path_extension, return_value=None)
-        rpyc._process_class = mocker.Mock(rpyc._process_class)
-        rpyc._process_class.__call__().return_value = None
-        rpyc.start_process(command)
-        rpyc.modules().subprocess.Popen.assert_called_with(
-            expected_split_command,
-            cwd=None,
-            encoding="utf-8",
-            env=None,
-            errors="backslashreplace",
-            shell=False,
-            stderr="",
-            stdin=-3,
-            stdout="",
-        )
-        rpyc._process_class.assert_has_calls(
-            [mocker.call(log_file_stream=None, log_path=None, owner=rpyc, process=mocker.ANY)]
-        )
+        rpyc._process_class = mocker.Mock()
+        return rpyc
 
+    @pytest.mark.parametrize("output_mode", ["none", "log_file", "output_file"])
     @pytest.mark.parametrize(
         "os_type, command, expected_split_command",
         [
@@ -805,22 +723,25 @@ class TestRPyCConnection:
             (OSType.WINDOWS, "c:\\tmp\\app.exe -c -b 10", ["c:\\tmp\\app.exe", "-c", "-b", "10"]),
         ],
     )
-    def test_start_process_log_file(self, rpyc, mocker, os_type, command, expected_split_command):
+    def test_start_process(self, start_process_harness, mocker, os_type, command, expected_split_command, output_mode):
+        rpyc = start_process_harness
         rpyc._os_type = os_type
-        rpyc.get_os_name = mocker.Mock(return_value=OSName.LINUX)
-        rpyc.modules = mocker.Mock()
-        rpyc._resolve_process_output_arguments = mocker.create_autospec(
-            rpyc._resolve_process_output_arguments, return_value=("", "")
-        )
-        rpyc._handle_path_extension = mocker.create_autospec(rpyc._handle_path_extension, return_value=None)
-        rpyc._process_class = mocker.Mock(rpyc._process_class)
-        rpyc._process_class.__call__().return_value = None
-        path_mock = rpyc.modules.return_value.pathlib.Path = mocker.create_autospec(Path)
-        file_path_mock = mocker.Mock()
-        stream_mock = mocker.Mock()
-        path_mock.return_value.expanduser.return_value.__truediv__.return_value = file_path_mock
-        file_path_mock.open.return_value = stream_mock
-        rpyc.start_process(command, log_file=True)
+        stream_mock = file_path_mock = None
+        kwargs = {}
+        if output_mode != "none":
+            file_path_mock = mocker.Mock()
+            stream_mock = mocker.Mock()
+            file_path_mock.open.return_value = stream_mock
+        if output_mode == "log_file":
+            rpyc.get_os_name = mocker.Mock(return_value=OSName.LINUX)
+            path_mock = rpyc.modules.return_value.pathlib.Path = mocker.create_autospec(Path)
+            path_mock.return_value.expanduser.return_value.__truediv__.return_value = file_path_mock
+            kwargs["log_file"] = True
+        elif output_mode == "output_file":
+            file_path_mock.parents = [mocker.Mock()]
+            kwargs["output_file"] = file_path_mock
+        rpyc.start_process(command, **kwargs)
+        expected_stream = "" if stream_mock is None else stream_mock
         rpyc.modules().subprocess.Popen.assert_called_with(
             expected_split_command,
             cwd=None,
@@ -828,48 +749,29 @@ class TestRPyCConnection:
             env=None,
             errors="backslashreplace",
             shell=False,
-            stderr=stream_mock,
+            stderr=expected_stream,
             stdin=-3,
-            stdout=stream_mock,
+            stdout=expected_stream,
         )
         rpyc._process_class.assert_has_calls(
             [mocker.call(log_file_stream=stream_mock, log_path=file_path_mock, owner=rpyc, process=mocker.ANY)]
         )
 
-    @pytest.mark.parametrize(
-        "os_type, command, expected_split_command",
-        [
-            (OSType.POSIX, "/root/app -c -b 10", ["/root/app", "-c", "-b", "10"]),
-            (OSType.WINDOWS, "c:\\tmp\\app.exe -c -b 10", ["c:\\tmp\\app.exe", "-c", "-b", "10"]),
-        ],
-    )
-    def test_start_process_output_file(self, rpyc, mocker, os_type, command, expected_split_command):
-        rpyc._os_type = os_type
-        rpyc.modules = mocker.Mock()
-        rpyc._resolve_process_output_arguments = mocker.create_autospec(
-            rpyc._resolve_process_output_arguments, return_value=("", "")
-        )
-        rpyc._handle_path_extension = mocker.create_autospec(rpyc._handle_path_extension, return_value=None)
-        rpyc._process_class = mocker.Mock(rpyc._process_class)
-        rpyc._process_class.__call__().return_value = None
-        file_path_mock = mocker.Mock()
-        file_path_mock.parents = [mocker.Mock()]
-        stream_mock = mocker.Mock()
-        file_path_mock.open.return_value = stream_mock
-        rpyc.start_process(command, output_file=file_path_mock)
+    def test_start_process_affinity_posix(self, start_process_harness):
+        rpyc = start_process_harness
+        rpyc._os_type = OSType.POSIX
+        rpyc.start_process("command arg1 arg2", cpu_affinity=[1, 3, 7])
+
         rpyc.modules().subprocess.Popen.assert_called_with(
-            expected_split_command,
+            ["taskset", "0x8a", "command", "arg1", "arg2"],
             cwd=None,
             encoding="utf-8",
             env=None,
             errors="backslashreplace",
             shell=False,
-            stderr=stream_mock,
+            stderr="",
             stdin=-3,
-            stdout=stream_mock,
-        )
-        rpyc._process_class.assert_has_calls(
-            [mocker.call(log_file_stream=stream_mock, log_path=file_path_mock, owner=rpyc, process=mocker.ANY)]
+            stdout="",
         )
 
     def test_str_function(self, rpyc):
@@ -885,9 +787,8 @@ class TestRPyCConnection:
         ],
     )
     def test__set_process_class(self, rpyc, mocker, os_name, os_type, expected_class):
-        rpyc.get_os_name = mocker.create_autospec(rpyc.get_os_name)
+        rpyc.get_os_name = mocker.Mock(return_value=os_name)
         rpyc._os_type = os_type
-        rpyc.get_os_name.return_value = os_name
         rpyc._set_process_class()
         assert rpyc._process_class == expected_class
 
@@ -1020,10 +921,8 @@ class TestRPyCConnection:
     def test_execute_with_timeout(self, rpyc_conn_with_timeout, rpyc, mocker):
         rpyc._connection = mocker.Mock()
         rpyc_conn_with_timeout._connection = mocker.Mock()
-        rpyc.get_os_name = mocker.create_autospec(rpyc.get_os_name, return_value=OSName.LINUX)
-        rpyc_conn_with_timeout.get_os_name = mocker.create_autospec(
-            rpyc_conn_with_timeout.get_os_name, return_value=OSName.LINUX
-        )
+        rpyc.get_os_name = mocker.Mock(return_value=OSName.LINUX)
+        rpyc_conn_with_timeout.get_os_name = mocker.Mock(return_value=OSName.LINUX)
         rpyc_conn_with_timeout._run_command = mocker.create_autospec(
             rpyc_conn_with_timeout._run_command, return_value=CompletedProcess("ping localhost", returncode=0)
         )
@@ -1038,49 +937,58 @@ class TestRPyCConnection:
         )
         rpyc._run_command.assert_called_with(["ping", "localhost"], None, None, None, False, -1, -1, None)
 
-    def test_handle_env_extension_with_custom_env(self, rpyc, mocker):
+    @pytest.fixture()
+    def remote_environ_copy(self, rpyc, mocker):
         rpyc.modules = mocker.Mock()
-        rpyc.modules().os.environ.copy.return_value = {"PATH": "some path"}
+        environ_copy = rpyc.modules().os.environ.copy
+        environ_copy.return_value = {"PATH": "some path"}
+        mocker.patch("mfd_connect.rpyc.rpyc.classic.obtain", side_effect=lambda proxy: dict(proxy))
+        return environ_copy
 
-        # Running the test
+    def test_handle_env_extension_with_custom_env(self, rpyc, remote_environ_copy):
         result = rpyc._handle_env_extension({"my_env": "my_value"})
 
-        # Assertions
         assert result == {"my_env": "my_value", "PATH": "some path"}
-        rpyc.modules().os.environ.copy.assert_called_once()
+        remote_environ_copy.assert_called_once()
 
-    def test_handle_env_extension_with_none_env(self, rpyc, mocker):
-        rpyc.modules = mocker.Mock()
-        rpyc.modules().os.environ.copy.return_value = {"PATH": "some path"}
-
-        # Running the test
+    def test_handle_env_extension_with_none_env(self, rpyc, remote_environ_copy):
         result = rpyc._handle_env_extension(None)
 
-        # Assertions
         assert result is None
-        rpyc.modules().os.environ.copy.assert_not_called()
-
-    def test_handle_env_extension_with_empty_env(self, rpyc, mocker):
-        rpyc.modules = mocker.Mock()
-        rpyc.modules().os.environ.copy.return_value = {"PATH": "some path"}
+        remote_environ_copy.assert_not_called()
 
-        # Running the test
+    def test_handle_env_extension_with_empty_env(self, rpyc, remote_environ_copy):
         result = rpyc._handle_env_extension({})
 
-        # Assertions
-        assert result == {"PATH": "some path"}
-        rpyc.modules().os.environ.copy.assert_called_once()
-
-    def test_handle_env_extension_with_duplicated_value(self, rpyc, mocker):
-        rpyc.modules = mocker.Mock()
-        rpyc.modules().os.environ.copy.return_value = {"PATH": "some path"}
+        assert result is None
+        remote_environ_copy.assert_not_called()
 
-        # Running the test
+    def test_handle_env_extension_with_duplicated_value(self, rpyc, remote_environ_copy):
         result = rpyc._handle_env_extension({"PATH": "other path"})
 
-        # Assertions
         assert result == {"PATH": "other path"}
-        rpyc.modules().os.environ.copy.assert_called_once()
+        remote_environ_copy.assert_called_once()
+
+    def test_handle_env_extension_reuses_remote_environment(self, rpyc, remote_environ_copy, mocker):
+        monotonic = mocker.patch("mfd_connect.rpyc.time.monotonic", return_value=100.0)
+        assert rpyc._handle_env_extension({"A": "1"}) == {"A": "1", "PATH": "some path"}
+        assert rpyc._handle_env_extension({"B": "2"}) == {"B": "2", "PATH": "some path"}
+        remote_environ_copy.assert_called_once()
+        assert rpyc._remote_env == {"PATH": "some path"}
+
+        monotonic.return_value = 100.0 + rpyc.REMOTE_ENV_CACHE_TTL
+        rpyc._handle_env_extension({"C": "3"})
+        assert remote_environ_copy.call_count == 2
+
+    def test_handle_env_extension_without_cache(self, rpyc, remote_environ_copy):
+        rpyc.cache_system_data = False
+        rpyc._handle_env_extension({"A": "1"})
+        rpyc._handle_env_extension({"A": "1"})
+        assert remote_environ_copy.call_count == 2
+
+    def test_get_remote_environment_falls_back_to_proxy_copy(self, rpyc, remote_environ_copy, mocker):
+        mocker.patch("mfd_connect.rpyc.rpyc.classic.obtain", side_effect=ValueError("unsupported pickle protocol"))
+        assert rpyc._get_remote_environment() == {"PATH": "some path"}
 
     def test_restart_platform(self, rpyc, mocker):
         rpyc.get_os_type = mocker.Mock(return_value=OSType.WINDOWS)
@@ -1109,6 +1017,18 @@ class TestRPyCConnection:
         rpyc._connection_timeout = 10
         result = RPyCConnection._create_connection(rpyc)
         assert result == mock_conn
+        mock_conn._channel.stream.sock.setsockopt.assert_called_once_with(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def test__create_connection_nodelay_failure_is_ignored(self, rpyc, mocker):
+        mock_conn = mocker.Mock()
+        mock_conn._channel.stream.sock.setsockopt.side_effect = OSError("not supported")
+        mocker.patch("rpyc.connect", return_value=mock_conn)
+        rpyc._ip = "10.10.10.10"
+        rpyc._port = 18812
+        rpyc._ssl_keyfile = None
+        rpyc._ssl_certfile = None
+        rpyc._connection_timeout = 10
+        assert RPyCConnection._create_connection(rpyc) == mock_conn
 
     def test__create_connection_retry_then_success(self, rpyc, mocker):
         # Simulate OSError on first two tries, then success
@@ -1120,9 +1040,12 @@ class TestRPyCConnection:
         rpyc._ssl_keyfile = None
         rpyc._ssl_certfile = None
         rpyc._connection_timeout = 10
+        sleep_mock = mocker.patch("funcy.flow.time.sleep")
+        mocker.patch("mfd_connect.rpyc.random.uniform", return_value=1.0)
         result = RPyCConnection._create_connection(rpyc)
         assert result == mock_conn
         assert connect_mock.call_count == 3
+        assert sleep_mock.call_args_list == [mocker.call(0.01), mocker.call(0.02)]
 
     def test__create_connection_all_fail(self, rpyc, mocker):
         # Simulate OSError on all retries
@@ -1133,9 +1056,23 @@ class TestRPyCConnection:
         rpyc._ssl_keyfile = None
         rpyc._ssl_certfile = None
         rpyc._connection_timeout = 10
+        sleep_mock = mocker.patch("funcy.flow.time.sleep")
         with pytest.raises(OSError):
             RPyCConnection._create_connection(rpyc)
         assert connect_mock.call_count == 5
+        delays = [call.args[0] for call in sleep_mock.call_args_list]
+        assert len(delays) == 4
+        assert all(0.01 * 2**attempt * 0.5 <= delay <= 0.01 * 2**attempt for attempt, delay in enumerate(delays))
+
+    @pytest.mark.parametrize("attempt, expected", [(0, 0.01), (3, 0.08), (6, 0.64), (7, 1.0), (20, 1.0)])
+    def test_connection_retry_delay_is_capped_exponential(self, mocker, attempt, expected):
+        mocker.patch("mfd_connect.rpyc.random.uniform", return_value=1.0)
+        assert connection_retry_delay(attempt) == pytest.approx(expected)
+
+    def test_connection_retry_delay_jitter(self, mocker):
+        uniform = mocker.patch("mfd_connect.rpyc.random.uniform", return_value=0.5)
+        assert connection_retry_delay(2) == pytest.approx(0.02)
+        uniform.assert_called_once_with(0.5, 1.0)
 
     def test__create_connection_with_ssl(self, rpyc, mocker):
         # Simulate successful connection with SSL keyfile and certfile
@@ -1159,6 +1096,7 @@ class TestRPyCConnection:
             certfile=rpyc._ssl_certfile,
             ipv6=False,
         )
+        mock_conn._channel.stream.sock.setsockopt.assert_called_once_with(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
     def test__create_connection_with_ipv6(self, rpyc, mocker):
         # Simulate successful connection with ipv6=True
@@ -1205,3 +1143,189 @@ class TestRPyCConnection:
             keyfile=rpyc._ssl_keyfile,
             certfile=rpyc._ssl_certfile,
         )
+
+    def test__create_connection_reuses_released_connection(self, rpyc, mocker):
+        mock_conn = mocker.Mock(closed=False)
+        connect_mock = mocker.patch("rpyc.connect", return_value=mock_conn)
+        rpyc._port = 18812
+        rpyc._ssl_keyfile = None
+        rpyc._ssl_certfile = None
+        rpyc._reuse_connection = True
+        rpyc._connection_pool = _ConnectionPool()
+        rpyc.enable_deploy = False
+        rpyc._reconnect()
+        rpyc.disconnect()
+        assert rpyc._connection is None
+        mock_conn.close.assert_not_called()
+
+        assert RPyCConnection._create_connection(rpyc) is mock_conn
+        connect_mock.assert_called_once()
+        mock_conn.ping.assert_called_once_with(timeout=_ConnectionPool.PING_TIMEOUT)
+
+    def test_disconnect_respects_overridden_pool_size(self, rpyc, mocker, monkeypatch):
+        monkeypatch.setattr(RPyCConnection, "CONNECTION_POOL_SIZE", 0)
+        mock_conn = mocker.Mock(closed=False)
+        rpyc._port = 18812
+        rpyc._ssl_keyfile = None
+        rpyc._ssl_certfile = None
+        rpyc._reuse_connection = True
+        rpyc._connection_pool = _ConnectionPool()
+        rpyc._connection = rpyc._pooled_connection = mock_conn
+        rpyc.disconnect()
+        mock_conn.close.assert_called_once()
+        assert rpyc._connection_pool.acquire(rpyc._pool_key) is None
+
+    def test__create_connection_without_reuse_does_not_pool(self, rpyc, mocker):
+        connect_mock = mocker.patch("rpyc.connect", return_value=mocker.Mock(closed=False))
+        rpyc._port = 18812
+        rpyc._ssl_keyfile = None
+        rpyc._ssl_certfile = None
+        rpyc._connection_pool = _ConnectionPool()
+        rpyc._connection = RPyCConnection._create_connection(rpyc)
+        rpyc.disconnect()
+        rpyc._connection.close.assert_called_once()
+        RPyCConnection._create_connection(rpyc)
+        assert connect_mock.call_count == 2
+
+    def test__run_command_resolves_remote_run_once_per_connection(self, rpyc, mocker):
+        rpyc._connection = mocker.Mock(closed=False)
+        run_lookup = mocker.PropertyMock(return_value=mocker.Mock())
+        type(rpyc._connection.modules.subprocess).run = run_lookup
+        for _ in range(3):
+            rpyc._run_command(["cmd"], None, None, None, False, -1, -1, None)
+        run_lookup.assert_called_once()
+        assert run_lookup.return_value.call_count == 3
+
+        rpyc._connection = mocker.Mock(closed=False)
+        rpyc._run_command(["cmd"], None, None, None, False, -1, -1, None)
+        rpyc._connection.modules.subprocess.run.assert_called_once()
+
+    def test__run_command_obtains_remote_result_at_once(self, rpyc, mocker):
+        remote_result = mocker.create_autospec(rpyc_module.core.netref.BaseNetref, instance=True)
+        local_result = CompletedProcess(["cmd"], returncode=0, stdout=b"out", stderr=b"")
+        rpyc._connection = mocker.Mock(closed=False)
+        rpyc._connection.modules.subprocess.run.return_value = remote_result
+        obtain = mocker.patch("mfd_connect.rpyc.rpyc.classic.obtain", return_value=local_result)
+
+        assert rpyc._run_command(["cmd"], None, None, None, False, -1, -1, None) is local_result
+        obtain.assert_called_once_with(remote_result)
+
+    def test__run_command_keeps_proxy_when_obtain_fails(self, rpyc, mocker):
+        remote_result = mocker.create_autospec(rpyc_module.core.netref.BaseNetref, instance=True)
+        rpyc._connection = mocker.Mock(closed=False)
+        rpyc._connection.modules.subprocess.run.return_value = remote_result
+        mocker.patch("mfd_connect.rpyc.rpyc.classic.obtain", side_effect=ValueError("unsupported pickle protocol"))
+
+        assert rpyc._run_command(["cmd"], None, None, None, False, -1, -1, None) is remote_result
+
+    def test__run_command_does_not_obtain_local_result(self, rpyc, mocker):
+        rpyc._connection = mocker.Mock(closed=False)
+        obtain = mocker.patch("mfd_connect.rpyc.rpyc.classic.obtain")
+        rpyc._run_command(["cmd"], None, None, None, False, -1, -1, None)
+        obtain.assert_not_called()
+
+    @pytest.fixture()
+    def rpyc_with_channels(self, rpyc, mocker):
+        rpyc._channels = 3
+        rpyc._channel_connections = [None, None]
+        rpyc._channel_counter = itertools.count()
+        rpyc._channel_lock = threading.Lock()
+        rpyc._connection = mocker.Mock(closed=False)
+        rpyc._create_connection = mocker.Mock(side_effect=lambda: mocker.Mock(closed=False))
+        return rpyc
+
+    def test__run_command_round_robin_over_channels(self, rpyc_with_channels):
+        rpyc = rpyc_with_channels
+        for _ in range(4):
+            rpyc._run_command(["cmd"], None, None, None, False, -1, -1, None)
+        first_channel, second_channel = rpyc._channel_connections
+        assert rpyc._create_connection.call_count == 2
+        assert rpyc._connection.modules.subprocess.run.call_count == 2
+        assert first_channel.modules.subprocess.run.call_count == 1
+        assert second_channel.modules.subprocess.run.call_count == 1
+
+    def test__run_command_reopens_dropped_channel(self, rpyc_with_channels):
+        rpyc = rpyc_with_channels
+        rpyc._channel_counter = itertools.count(1)
+        rpyc._run_command(["cmd"], None, None, None, False, -1, -1, None)
+        dropped = rpyc._channel_connections[0]
+        dropped.closed = True
+        rpyc._channel_counter = itertools.count(1)
+        rpyc._run_command(["cmd"], None, None, None, False, -1, -1, None)
+        assert rpyc._channel_connections[0] is not dropped
+        assert rpyc._create_connection.call_count == 2
+
+    def test_send_command_and_disconnect_platform_uses_main_connection(self, rpyc_with_channels, mocker, clock):
+        rpyc = rpyc_with_channels
+        rpyc._channel_counter = itertools.count(1)
+        rpyc._run_command(["cmd"], None, None, None, False, -1, -1, None)
+        channel = rpyc._channel_connections[0]
+        main_connection = rpyc._connection
+        main_connection.modules.subprocess.run.side_effect = EOFError
+        mocker.patch.object(
+            rpyc,
+            "execute_command",
+            side_effect=lambda command: rpyc._run_command(command, None, None, None, False, -1, -1, None),
+        )
+        rpyc.send_command_and_disconnect_platform("reboot")
+        main_connection.modules.subprocess.run.assert_called_once()
+        channel.close.assert_called_once()
+        channel.modules.subprocess.run.assert_called_once()
+        assert rpyc._channel_connections == [None, None]
+        assert rpyc._channels == 3
+
+    @pytest.mark.parametrize("reconnect", ["_reconnect", "wait_for_host"])
+    def test_reconnect_drops_channels(self, rpyc_with_channels, mocker, reconnect):
+        rpyc = rpyc_with_channels
+        rpyc.enable_deploy = False
+        rpyc._enable_bg_serving_thread = False
+        rpyc._channel_counter = itertools.count(1)
+        rpyc._run_command(["cmd"], None, None, None, False, -1, -1, None)
+        channel = rpyc._channel_connections[0]
+        getattr(rpyc, reconnect)()
+        channel.close.assert_called_once()
+        assert rpyc._channel_connections == [None, None]
+        assert rpyc._subprocess_run_cache == {}
+
+    def test_disconnect_closes_channels(self, rpyc_with_channels):
+        rpyc = rpyc_with_channels
+        rpyc._channel_counter = itertools.count(1)
+        rpyc._run_command(["cmd"], None, None, None, False, -1, -1, None)
+        channel = rpyc._channel_connections[0]
+        main_connection = rpyc._connection
+        rpyc.disconnect()
+        channel.close.assert_called_once()
+        main_connection.close.assert_called_once()
+        assert rpyc._channel_connections == [None, None]
+
+
+class TestConnectionPool:
+    """Tests of _ConnectionPool."""
+
+    def test_acquire_empty(self):
+        assert _ConnectionPool().acquire(("10.10.10.10", 18816)) is None
+
+    def test_acquire_skips_dead_connections(self, mocker):
+        pool = _ConnectionPool()
+        alive = mocker.Mock(closed=False)
+        not_responding = mocker.Mock(closed=False)
+        not_responding.ping.side_effect = EOFError
+        pool.release("key", alive, max_idle=4)
+        pool.release("key", not_responding, max_idle=4)
+        assert pool.acquire("key") is alive
+        not_responding.close.assert_called_once()
+        assert pool.acquire("key") is None
+
+    def test_release_closed_connection_is_dropped(self, mocker):
+        pool = _ConnectionPool()
+        pool.release("key", mocker.Mock(closed=True), max_idle=4)
+        assert pool.acquire("key") is None
+
+    def test_release_above_limit_closes_connection(self, mocker):
+        pool = _ConnectionPool()
+        kept, surplus = mocker.Mock(closed=False), mocker.Mock(closed=False)
+        pool.release("key", kept, max_idle=1)
+        pool.release("key", surplus, max_idle=1)
+        surplus.close.assert_called_once()
+        kept.close.assert_not_called()
+        assert pool.acquire("key") is kept
@@ -2,10 +2,19 @@
 # SPDX-License-Identifier: MIT
 """Module for SerialConnection tests."""
 
+import hashlib
+
 import pytest
 from netaddr import IPAddress
 
-from mfd_connect import Connection, AsyncConnection, SerialConnection, TelnetConnection, RPyCConnection
+from mfd_connect import (
+    Connection,
+    AsyncConnection,
+    SerialConnection,
+    TelnetConnection,
+    RPyCConnection,
+    SSHConnection,
+)
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_connect.exceptions import (
     SerialException,
@@ -130,18 +139,14 @@ class TestSerialConnection:
         caplog.set_level(log_levels.MODULE_DEBUG)
         log_message = "Killing old netcat connections on host"
         mocker.patch("time.sleep")
-        netcat_process = mocker.create_autospec(RemoteProcess)
-        netcat_process.running = True
         serial._serial_logs_path = None
-        serial._remote_host.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args=f'pkill -f "nc -k -l -4 {serial._telnet_port}"', stdout="stdout", stderr="stderr"
-        )
         serial._remote_host.start_process.return_value = mocker.create_autospec(RemoteProcess)
 
         serial._run_netcat()
-        serial._remote_host.execute_command.assert_called_once_with(
-            f'pkill -f "nc -k -l -4 {serial._telnet_port}"', expected_return_codes=None
-        )
+        serial._remote_host.execute_command.assert_not_called()
+        command = serial._remote_host.start_process.call_args.args[0]
+        assert command.startswith(f'port={serial._telnet_port}; pkill -f "nc -k -l -4 $port"; nc')
+        assert f"nc -k -l -4 {serial._telnet_port}" not in command
         assert log_message in caplog.messages
 
     def test_run_netcat_start_netcat_server(self, mocker, caplog, serial):
@@ -151,15 +156,41 @@ class TestSerialConnection:
             "Netcat sender server is running",
         ]
         caplog.set_level(log_levels.MODULE_DEBUG)
-        mocker.patch("time.sleep")
+        sleep_mock = mocker.patch("time.sleep")
 
         serial._serial_logs_path = None
         serial._run_netcat()
+        sleep_mock.assert_called_once_with(0.5)
         serial._remote_host.start_process.assert_called_once_with(
-            f"nc -k -l -4 {serial._telnet_port} > {serial._serial_device} < {serial._serial_device}", shell=True
+            f'port={serial._telnet_port}; pkill -f "nc -k -l -4 $port"; '
+            f'nc -k -l -4 "$port" > {serial._serial_device} < {serial._serial_device}',
+            shell=True,
         )
         assert all(msg in caplog.messages for msg in log_messages)
 
+    def test_run_netcat_keeps_ssh_process_marker_on_shell(self, mocker, serial):
+        mocker.patch("time.sleep")
+        mocker.patch("mfd_connect.ssh.random.random", return_value=0.5)
+        ssh = SSHConnection.__new__(SSHConnection)
+        ssh.cache_system_data = True
+        ssh._os_type = OSType.POSIX
+        ssh._connection = mocker.Mock()
+
+        def start_process(command: str, shell: bool) -> RemoteProcess:
+            ssh._start_process(command)
+            return mocker.create_autospec(RemoteProcess)
+
+        serial._remote_host.start_process.side_effect = start_process
+        serial._serial_logs_path = None
+
+        serial._run_netcat()
+        sent_command = ssh._connection.get_transport().open_session().exec_command.call_args.args[0]
+        # PosixSSHProcess finds nc as child of the shell whose command line ends with the marker
+        assert sent_command.endswith(
+            f'; nc -k -l -4 "$port" > {serial._serial_device} < {serial._serial_device} && true 0.5'
+        )
+        assert "exec " not in sent_command
+
     def test_run_netcat_server_not_running_exception(self, mocker, serial):
         mocker.patch("time.sleep")
         netcat_process = mocker.create_autospec(RemoteProcess)
@@ -212,6 +243,8 @@ class TestSerialConnection:
             ),
         )
         assert serial.get_os_type() == OSType.POSIX
+        assert serial.get_os_type() == OSType.POSIX
+        serial.execute_command.assert_called_once()
 
     def test_get_os_type_exception(self, serial, mocker):
         serial.execute_command = mocker.create_autospec(
@@ -239,6 +272,8 @@ class TestSerialConnection:
         )
 
         assert serial.get_os_name() == OSName.LINUX
+        assert serial.get_os_name() == OSName.LINUX
+        serial.execute_command.assert_called_once()
 
     def test_get_os_name_exception(self, serial, mocker):
         serial.execute_command = mocker.create_autospec(
@@ -266,6 +301,8 @@ class TestSerialConnection:
         )
 
         assert serial.get_os_bitness() == OSBitness.OS_64BIT
+        assert serial.get_os_bitness() == OSBitness.OS_64BIT
+        serial.execute_command.assert_called_once()
 
     def test_get_os_bitness_32(self, serial, mocker):
         serial.execute_command = mocker.create_autospec(
@@ -345,34 +382,37 @@ class TestSerialConnection:
         serial._server_process.kill.assert_called_once()
         serial._remote_host.disconnect.assert_called_once()
 
-    def test__check_control_sum(self, mocker, serial, caplog):
+    def test__check_control_sum(self, mocker, serial, caplog, tmp_path):
         caplog.set_level(log_levels.MODULE_DEBUG)
-        file_hash = "28d939c07a3c246ff39feeca72915c618526543a85d6663442ac13ebc1683e04"
+        local_file = tmp_path / "test_path.txt"
+        local_file.write_bytes(b"file content")
+        file_hash = hashlib.sha256(b"file content").hexdigest()
         serial._telnet_connection = mocker.Mock()
         serial._telnet_connection.execute_command.return_value = ConnectionCompletedProcess(
             return_code=0, args="", stdout=f"{file_hash}  test.txt", stderr="stderr"
         )
-        hexdigest_mock = mocker.Mock()
-        hexdigest_mock.hexdigest.return_value = file_hash
-        mocker.patch("hashlib.sha256", return_value=hexdigest_mock)
-        mocker.patch("builtins.open", return_value=mocker.MagicMock())
-        serial._check_control_sum(local_path="test_path.txt", remote_path="test_path.txt")
+        serial._check_control_sum(local_path=local_file, remote_path="test_path.txt")
         assert f"Correct sha256sum for file, local: {file_hash}, remote: {file_hash}" in caplog.messages
 
-    def test__check_control_sum_not_equal_exception(self, mocker, serial):
+    def test__check_control_sum_not_equal_exception(self, mocker, serial, tmp_path):
         hash_a = "28d939c07a3c246ff39feeca72915c618526543a85d6663442ac13ebc1683e04"
-        hash_b = "af3ebdafaacbf284d7aef03caaf7e100511b7e3e4bcaf6cceabb3c8272f28e9f"
+        local_file = tmp_path / "test_path.txt"
+        local_file.write_bytes(b"other content")
+        hash_b = hashlib.sha256(b"other content").hexdigest()
 
         serial._telnet_connection = mocker.Mock()
         serial._telnet_connection.execute_command.return_value = ConnectionCompletedProcess(
             return_code=0, args="", stdout=f"{hash_a}  test.txt", stderr="stderr"
         )
-        hexdigest_mock = mocker.Mock()
-        hexdigest_mock.hexdigest.return_value = hash_b
-        mocker.patch("hashlib.sha256", return_value=hexdigest_mock)
-        mocker.patch("builtins.open", return_value=mocker.MagicMock())
         with pytest.raises(TransferFileError, match=f"Incorrect sha256sum, local: {hash_b}, remote: {hash_a}"):
-            serial._check_control_sum(local_path="test_path.txt", remote_path="test_path.txt")
+            serial._check_control_sum(local_path=local_file, remote_path="test_path.txt")
+
+    def test__local_sha256sum_reads_in_chunks(self, mocker, tmp_path):
+        mocker.patch("mfd_connect.serial.CHECKSUM_CHUNK_SIZE", 4)
+        local_file = tmp_path / "test_path.txt"
+        content = b"0123456789abcdef-tail"
+        local_file.write_bytes(content)
+        assert SerialConnection._local_sha256sum(local_file) == hashlib.sha256(content).hexdigest()
 
     def test__check_control_sum_execute_command_exception(self, mocker, serial):
         serial._telnet_connection = mocker.Mock()
@@ -1,8 +1,10 @@
 # Copyright (C) 2025-2026 Intel Corporation
 # SPDX-License-Identifier: MIT
+import copy
 import sys
 from subprocess import CalledProcessError
 from textwrap import dedent
+from unittest.mock import Mock
 
 import pytest
 from mfd_typing.os_values import OSBitness, OSType, OSName
@@ -13,24 +15,89 @@ from mfd_connect.base import ConnectionCompletedProcess
 from mfd_connect.exceptions import OsNotSupported, SolException
 from mfd_connect.util.serial_utils import SerialKeyCode
 
+LINUX_UNAME = ConnectionCompletedProcess(
+    return_code=0,
+    args="command",
+    stdout=r"Linux localhost.localdomain 5.3.15-200.fc30.x86_64 #1 SMP "
+    r"Thu Dec 5 15:18:00 UTC 2019 x86_64 x86_64 x86_64 GNU/Linux",
+    stderr="stderr",
+)
+FREEBSD_UNAME = ConnectionCompletedProcess(
+    return_code=0,
+    args="command",
+    stdout=r"Linux localhost.localdomain 5.3.15-200.fc30.x86_64 #1 SMP "
+    r"Thu Dec 5 15:18:00 UTC 2019 x86_64 x86_64 x86_64 FreeBSD",
+    stderr="stderr",
+)
+UNAME_O_LINUX = ConnectionCompletedProcess(return_code=0, args="command", stdout=r"GNU/Linux", stderr="stderr")
+UNAME_O_FREEBSD = ConnectionCompletedProcess(return_code=0, args="command", stdout=r"FreeBSD", stderr="stderr")
+UNAME_NOT_RECOGNIZED = ConnectionCompletedProcess(
+    return_code=9009,
+    args="command",
+    stdout=r"\'uname\' is not recognized as an internal or external command\noperable program or batch file.",
+    stderr="stderr",
+)
+UNAME_NOT_RECOGNIZED_IN_EFI_SHELL = ConnectionCompletedProcess(
+    return_code=14,
+    args="command",
+    stdout=r"\'uname\' is not recognized as an internal or external command,\noperable program, or script file.",
+    stderr="stderr",
+)
+VER_NOT_FOUND = ConnectionCompletedProcess(
+    return_code=0, args="command", stdout=r"bash: ver: command not found...", stderr="stderr"
+)
+DELL_EFI_SHELL_BANNER = ConnectionCompletedProcess(
+    return_code=0,
+    args="command",
+    stdout=r"DELL Custom UEFI Shell v2.2\nDell Build 2.6.1\nUEFI v2.70 (Dell Inc., 0x0A030201)",
+    stderr="stderr",
+)
+EFI_INTERACTIVE_SHELL_BANNER = ConnectionCompletedProcess(
+    return_code=0,
+    args="command",
+    stdout=r"UEFI Interactive Shell v2.2\nEDK II\nUEFI v2.70 (Dell Inc., 0x05030201)",
+    stderr="stderr",
+)
+WINDOWS_BANNER = ConnectionCompletedProcess(
+    return_code=0, args="command", stdout=r"\nMicrosoft Windows [Version 10.0.18363.1440]\n", stderr="stderr"
+)
+
+RAW_BOOTUTIL_OUTPUT = (
+    ", use '~.' to end, '~?' for help.]\r\r\n"
+    "[25;30H\r\r\n"
+    "\r\r\n"
+    "\r\r\n"
+    "\r\r\n"
+    "Intel(R) Ethernet Flash Firmware Utility\r\r\n"
+    "\r\r\n"
+    "BootUtil version 1.7.11.7\r\r\n"
+    "\r\r\n"
+    r"[25;01H[1m[33m[40mFS0:\560559"
+)
+PARSED_BOOTUTIL_OUTPUT = dedent("""\
+    Intel(R) Ethernet Flash Firmware Utility
+    BootUtil version 1.7.11.7""")
+
 
 class TestSolConnection:
     """Tests of SolConnection."""
 
     CustomTestException = CalledProcessError
 
-    @fixture
-    def sol(self, mocker) -> SolConnection:
+    @fixture(scope="class")
+    def sol_template(self) -> SolConnection:
         sol = SolConnection.__new__(SolConnection)
-        sol.__init__ = mocker.create_autospec(sol.__init__, return_value=None)
         sol._prompt = ""
         sol._ip = "10.10.10.10"
         sol.cache_system_data = True
         return sol
 
+    @fixture
+    def sol(self, sol_template) -> SolConnection:
+        return copy.copy(sol_template)
+
     def test_get_os_bitness_os_not_supported(self, sol, mocker):
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
+        sol.execute_command = mocker.Mock(
             return_value=ConnectionCompletedProcess(
                 return_code=0, args="command", stdout="random stuff", stderr="stderr"
             ),
@@ -40,8 +107,7 @@ class TestSolConnection:
 
     def test_get_os_bitness_os_supported(self, sol, mocker):
         real_correct_output = "Dell Custom UEFI Shell v2.2\nDell Build 2.6.1\nUEFI v2.70 (Dell Inc., 0x0A030201)"
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
+        sol.execute_command = mocker.Mock(
             return_value=ConnectionCompletedProcess(
                 return_code=0, args="command", stdout=real_correct_output, stderr="stderr"
             ),
@@ -49,8 +115,7 @@ class TestSolConnection:
         assert sol.get_os_bitness() == OSBitness.OS_64BIT
 
     def test_get_cwd(self, sol, mocker):
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
+        sol.execute_command = mocker.Mock(
             return_value=ConnectionCompletedProcess(
                 return_code=0,
                 args="command",
@@ -61,8 +126,7 @@ class TestSolConnection:
         assert sol.get_cwd() == r"FS0:\569000"
 
     def test_get_cwd_failure(self, sol, mocker):
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
+        sol.execute_command = mocker.Mock(
             return_value=ConnectionCompletedProcess(
                 return_code=0, args="command", stdout=r"uefiversion = 27.0\nscriptargc = 0\n", stderr="stderr"
             ),
@@ -167,24 +231,7 @@ class TestSolConnection:
         assert selected == "*Legacy Boot Option"
 
     def test__parse_output(self, sol):
-        output = (
-            ", use '~.' to end, '~?' for help.]\r\r\n"
-            "[25;30H\r\r\n"
-            "\r\r\n"
-            "\r\r\n"
-            "\r\r\n"
-            "Intel(R) Ethernet Flash Firmware Utility\r\r\n"
-            "\r\r\n"
-            "BootUtil version 1.7.11.7\r\r\n"
-            "\r\r\n"
-            r"[25;01H[1m[33m[40mFS0:\560559"
-        )
-        expected_output = dedent(
-            """\
-        Intel(R) Ethernet Flash Firmware Utility
-        BootUtil version 1.7.11.7"""
-        )
-        assert sol._parse_output(output) == expected_output
+        assert sol._parse_output(RAW_BOOTUTIL_OUTPUT) == PARSED_BOOTUTIL_OUTPUT
 
     def test__parse_selection_windows_boot_manager(self, sol):
         output = (
@@ -216,254 +263,83 @@ class TestSolConnection:
         assert selected == "Continue Normal Boot"
 
     def test__check_if_unix(self, sol, mocker):
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
-            return_value=ConnectionCompletedProcess(
-                return_code=0,
-                args="command",
-                stdout=r"Linux localhost.localdomain 5.3.15-200.fc30.x86_64 #1 SMP "
-                r"Thu Dec 5 15:18:00 UTC 2019 x86_64 x86_64 x86_64 GNU/Linux",
-                stderr="stderr",
-            ),
-        )
+        sol.execute_command = mocker.Mock(return_value=LINUX_UNAME)
         assert sol._check_if_unix()
 
     def test__check_if_unix_failure(self, sol, mocker):
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
-            return_value=ConnectionCompletedProcess(
-                return_code=9009,
-                args="command",
-                stdout=r"\'uname\' is not recognized as an internal or external command,"
-                r"\noperable program or batch file.",
-                stderr="stderr",
-            ),
-        )
+        sol.execute_command = mocker.Mock(return_value=UNAME_NOT_RECOGNIZED)
         assert not sol._check_if_unix()
 
-    def test__check_if_efi_shell(self, sol, mocker):
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
-            return_value=ConnectionCompletedProcess(
-                return_code=0,
-                args="command",
-                stdout=r"DELL Custom UEFI Shell v2.2\nDell Build 2.6.1" r"\nUEFI v2.70 (Dell Inc., 0x0A030201)",
-                stderr="stderr",
-            ),
-        )
-        assert sol._check_if_efi_shell()
-
-    def test__check_if_efi_shell_interactive_mode(self, sol, mocker):
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
-            return_value=ConnectionCompletedProcess(
-                return_code=0,
-                args="command",
-                stdout=r"UEFI Interactive Shell v2.2\nEDK II\nUEFI v2.70 (Dell Inc., 0x05030201)",
-                stderr="stderr",
-            ),
-        )
-        assert sol._check_if_efi_shell()
-
-    def test__check_if_efi_shell_failure(self, sol, mocker):
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
-            return_value=ConnectionCompletedProcess(
-                return_code=0,
-                args="command",
-                stdout=r"\nMicrosoft Windows [Version 10.0.18363.1440]\n",
-                stderr="stderr",
-            ),
-        )
-        assert not sol._check_if_efi_shell()
-
-    def test_get_os_type_unix(self, sol, mocker):
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
-            return_value=ConnectionCompletedProcess(
-                return_code=0,
-                args="command",
-                stdout=r"Linux localhost.localdomain 5.3.15-200.fc30.x86_64 #1 SMP "
-                r"Thu Dec 5 15:18:00 UTC 2019 x86_64 x86_64 x86_64 GNU/Linux",
-                stderr="stderr",
-            ),
-        )
-        assert sol.get_os_type() == OSType.POSIX
-
-    def test_get_os_type_efi_shell(self, sol, mocker):
-        def return_check_output(*args, **kwargs):
-            if args[0] == "uname -a":
-                return ConnectionCompletedProcess(
-                    return_code=14,
-                    args="command",
-                    stdout=r"\'uname\' is not recognized as an internal or external "
-                    r"command,\noperable program, or script file.",
-                    stderr="stderr",
-                )
-            else:
-                return ConnectionCompletedProcess(
-                    return_code=0,
-                    args="command",
-                    stdout=r"DELL Custom UEFI Shell v2.2\nDell Build 2.6.1" r"\nUEFI v2.70 (Dell Inc., 0x0A030201)",
-                    stderr="stderr",
-                )
-
-        sol.execute_command = mocker.Mock(side_effect=return_check_output)
-        assert sol.get_os_type() == OSType.EFISHELL
+    @pytest.mark.parametrize(
+        "ver, is_efi_shell",
+        [(DELL_EFI_SHELL_BANNER, True), (EFI_INTERACTIVE_SHELL_BANNER, True), (WINDOWS_BANNER, False)],
+    )
+    def test__check_if_efi_shell(self, sol, mocker, ver, is_efi_shell):
+        sol.execute_command = mocker.Mock(return_value=ver)
+        assert sol._check_if_efi_shell() is is_efi_shell
+
+    @staticmethod
+    def _dispatch(mocker, responses: dict) -> Mock:
+        return mocker.Mock(side_effect=lambda command, **kwargs: responses[command])
+
+    @pytest.mark.parametrize(
+        "responses, os_type",
+        [
+            ({"uname -a": LINUX_UNAME}, OSType.POSIX),
+            ({"uname -a": UNAME_NOT_RECOGNIZED_IN_EFI_SHELL, "ver": DELL_EFI_SHELL_BANNER}, OSType.EFISHELL),
+        ],
+    )
+    def test_get_os_type(self, sol, mocker, responses, os_type):
+        sol.execute_command = self._dispatch(mocker, responses)
+        assert sol.get_os_type() == os_type
 
     def test_get_os_type_failure(self, sol, mocker):
-        def return_check_output(*args, **kwargs):
-            if args[0] == "uname -a":
-                return ConnectionCompletedProcess(
-                    return_code=9009,
-                    args="command",
-                    stdout=r"\'uname\' is not recognized as an internal or external "
-                    r"command\noperable program or batch file.",
-                    stderr="stderr",
-                )
-            else:
-                return ConnectionCompletedProcess(
-                    return_code=0,
-                    args="command",
-                    stdout=r"\nMicrosoft Windows [Version 10.0.18363.1440]\n",
-                    stderr="stderr",
-                )
-
-        sol.execute_command = mocker.Mock(side_effect=return_check_output)
+        sol.execute_command = self._dispatch(mocker, {"uname -a": UNAME_NOT_RECOGNIZED, "ver": WINDOWS_BANNER})
         with pytest.raises(OsNotSupported):
             _ = sol.get_os_type()
 
-    def test_get_os_name_linux(self, sol, mocker):
-        def return_check_output(*args, **kwargs):
-            if args[0] == "uname -o":
-                return ConnectionCompletedProcess(
-                    return_code=0,
-                    args="command",
-                    stdout=r"GNU/Linux",
-                    stderr="stderr",
-                )
-            elif args[0] == "uname -a":
-                return ConnectionCompletedProcess(
-                    return_code=0,
-                    args="command",
-                    stdout=r"Linux localhost.localdomain 5.3.15-200.fc30.x86_64 #1 SMP "
-                    r"Thu Dec 5 15:18:00 UTC 2019 x86_64 x86_64 x86_64 GNU/Linux",
-                    stderr="stderr",
-                )
-            else:
-                return ConnectionCompletedProcess(
-                    return_code=0,
-                    args="command",
-                    stdout=r"bash: ver: command not found...",
-                    stderr="stderr",
-                )
-
-        sol.execute_command = mocker.Mock(side_effect=return_check_output)
-        assert sol.get_os_name() == OSName.LINUX
-
-    def test_get_os_name_freebsd(self, sol, mocker):
-        def return_check_output(*args, **kwargs):
-            if args[0] == "uname -o":
-                return ConnectionCompletedProcess(
-                    return_code=0,
-                    args="command",
-                    stdout=r"FreeBSD",
-                    stderr="stderr",
-                )
-            elif args[0] == "uname -a":
-                return ConnectionCompletedProcess(
-                    return_code=0,
-                    args="command",
-                    stdout=r"Linux localhost.localdomain 5.3.15-200.fc30.x86_64 #1 SMP "
-                    r"Thu Dec 5 15:18:00 UTC 2019 x86_64 x86_64 x86_64 FreeBSD",
-                    stderr="stderr",
-                )
-            else:
-                return ConnectionCompletedProcess(
-                    return_code=0,
-                    args="command",
-                    stdout=r"bash: ver: command not found...",
-                    stderr="stderr",
-                )
-
-        sol.execute_command = mocker.Mock(side_effect=return_check_output)
-        assert sol.get_os_name() == OSName.FREEBSD
-
-    def test_get_os_name_efi_shell(self, sol, mocker):
-        def return_check_output(*args, **kwargs):
-            if args[0] == "uname -o":
-                return ConnectionCompletedProcess(
-                    return_code=14,
-                    args="command",
-                    stdout=r"\'uname\' is not recognized as an internal or external "
-                    r"command,\noperable program, or script file.",
-                    stderr="stderr",
-                )
-            elif args[0] == "uname -a":
-                return ConnectionCompletedProcess(
-                    return_code=9009,
-                    args="command",
-                    stdout=r"\'uname\' is not recognized as an internal or external "
-                    r"command\noperable program or batch file.",
-                    stderr="stderr",
-                )
-            else:
-                return ConnectionCompletedProcess(
-                    return_code=0,
-                    args="command",
-                    stdout=r"DELL Custom UEFI Shell v2.2\nDell Build 2.6.1" r"\nUEFI v2.70 (Dell Inc., 0x0A030201)",
-                    stderr="stderr",
-                )
-
-        sol.execute_command = mocker.Mock(side_effect=return_check_output)
+    @pytest.mark.parametrize(
+        "uname_o, uname_a, ver, os_name",
+        [
+            (UNAME_O_LINUX, LINUX_UNAME, VER_NOT_FOUND, OSName.LINUX),
+            (UNAME_O_FREEBSD, FREEBSD_UNAME, VER_NOT_FOUND, OSName.FREEBSD),
+            (UNAME_NOT_RECOGNIZED_IN_EFI_SHELL, UNAME_NOT_RECOGNIZED, DELL_EFI_SHELL_BANNER, OSName.EFISHELL),
+        ],
+    )
+    def test_get_os_name(self, sol, mocker, uname_o, uname_a, ver, os_name):
+        sol.execute_command = self._dispatch(mocker, {"uname -o": uname_o, "uname -a": uname_a, "ver": ver})
+        assert sol.get_os_name() == os_name
+
+    def test_os_probes_are_shared_between_system_data_getters(self, sol, mocker):
+        sol.execute_command = self._dispatch(
+            mocker, {"uname -a": UNAME_NOT_RECOGNIZED_IN_EFI_SHELL, "ver": DELL_EFI_SHELL_BANNER}
+        )
         assert sol.get_os_name() == OSName.EFISHELL
+        assert sol.get_os_type() == OSType.EFISHELL
+        assert sol.get_os_bitness() == OSBitness.OS_64BIT
+        assert [c.args[0] for c in sol.execute_command.call_args_list] == ["ver", "uname -a"]
+
+    def test_os_probes_are_repeated_without_cache(self, sol, mocker):
+        sol.cache_system_data = False
+        sol.execute_command = mocker.Mock(return_value=DELL_EFI_SHELL_BANNER)
+        sol.get_os_name()
+        sol.get_os_bitness()
+        assert sol.execute_command.call_count == 2
 
     def test_get_os_name_failure(self, sol, mocker):
-        def return_check_output(*args, **kwargs):
-            if args[0] == "uname -o":
-                return ConnectionCompletedProcess(
-                    return_code=9009,
-                    args="command",
-                    stdout=r"\'uname\' is not recognized as an internal or external "
-                    r"command\noperable program or batch file.",
-                    stderr="stderr",
-                )
-            elif args[0] == "uname -a":
-                return ConnectionCompletedProcess(
-                    return_code=9009,
-                    args="command",
-                    stdout=r"\'uname\' is not recognized as an internal or external "
-                    r"command\noperable program or batch file.",
-                    stderr="stderr",
-                )
-            else:
-                return ConnectionCompletedProcess(
-                    return_code=0,
-                    args="command",
-                    stdout=r"\nMicrosoft Windows [Version 10.0.18363.1440]\n",
-                    stderr="stderr",
-                )
-
-        sol.execute_command = mocker.Mock(side_effect=return_check_output)
+        sol.execute_command = self._dispatch(
+            mocker, {"uname -o": UNAME_NOT_RECOGNIZED, "uname -a": UNAME_NOT_RECOGNIZED, "ver": WINDOWS_BANNER}
+        )
         with pytest.raises(OsNotSupported):
             _ = sol.get_os_name()
 
-    @pytest.mark.parametrize("command_output, os_name", [("GNU/Linux", OSName.LINUX), ("FreeBSD", OSName.FREEBSD)])
-    def test_get_unix_distribution(self, sol, mocker, command_output, os_name):
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
-            return_value=ConnectionCompletedProcess(
-                return_code=0,
-                args="command",
-                stdout=command_output,
-                stderr="stderr",
-            ),
-        )
+    @pytest.mark.parametrize("uname_o, os_name", [(UNAME_O_LINUX, OSName.LINUX), (UNAME_O_FREEBSD, OSName.FREEBSD)])
+    def test_get_unix_distribution(self, sol, mocker, uname_o, os_name):
+        sol.execute_command = mocker.Mock(return_value=uname_o)
         assert sol._get_unix_distribution() == os_name
 
     def test_get_unix_distribution_fail(self, sol, mocker):
-        sol.execute_command = mocker.create_autospec(
-            sol.execute_command,
+        sol.execute_command = mocker.Mock(
             return_value=ConnectionCompletedProcess(
                 return_code=0,
                 args="command",
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Module for ssh tests."""
 
+import copy
 import logging
 import os
 import random
@@ -11,7 +12,7 @@ import time
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
 from subprocess import CalledProcessError
-from unittest.mock import patch, Mock, MagicMock
+from unittest.mock import call, patch, Mock, MagicMock, create_autospec
 
 import paramiko
 import pytest
@@ -32,6 +33,70 @@ from mfd_connect.exceptions import (
     RemoteProcessTimeoutExpired,
     CPUArchitectureNotSupported,
 )
+from mfd_connect.process.ssh.base import SSHProcess
+
+ARCHITECTURE_OUTPUTS = {
+    architecture: ConnectionCompletedProcess(return_code=0, args="command", stdout=architecture, stderr="stderr")
+    for architecture in (
+        "amd64",
+        "ia64",
+        "x86_64",
+        "aarch64",
+        "i386",
+        "i586",
+        "x86",
+        "ia32",
+        "armv7l",
+        "arm",
+        "dunno",
+        "2-bit",
+    )
+}
+ARCHITECTURE_GETTER_CASES = [
+    *[(arch, "get_os_bitness", OSBitness.OS_64BIT) for arch in ("amd64", "ia64", "x86_64", "aarch64")],
+    *[(arch, "get_os_bitness", OSBitness.OS_32BIT) for arch in ("i386", "i586", "x86", "ia32", "armv7l", "arm")],
+    ("dunno", "get_os_bitness", OsNotSupported),
+    ("2-bit", "get_os_bitness", OsNotSupported),
+    *[(arch, "get_cpu_architecture", CPUArchitecture.X86_64) for arch in ("amd64", "ia64", "x86_64")],
+    *[(arch, "get_cpu_architecture", CPUArchitecture.X86) for arch in ("i386", "i586", "x86", "ia32")],
+    *[(arch, "get_cpu_architecture", CPUArchitecture.ARM) for arch in ("armv7l", "arm")],
+    ("aarch64", "get_cpu_architecture", CPUArchitecture.ARM64),
+    ("dunno", "get_cpu_architecture", CPUArchitectureNotSupported),
+]
+POSIX_UNAME_OUTPUTS = (
+    ConnectionCompletedProcess(return_code=1, args="command", stdout="unrecognized command", stderr="stderr"),
+    ConnectionCompletedProcess(return_code=0, args="command", stdout="Linux", stderr="stderr"),
+)
+START_PROCESS_KWARGS = {
+    "command": "ls",
+    "cwd": None,
+    "env": None,
+    "stderr_to_stdout": False,
+    "discard_stdout": False,
+    "discard_stderr": False,
+    "cpu_affinity": None,
+    "shell": False,
+    "enable_input": False,
+    "log_file": True,
+    "output_file": None,
+    "get_pty": False,
+}
+DESTINATION_PATH = Path("/path/to/destination")
+DOWNLOAD_FILE_UNIX_KWARGS = {"url": "http://url.com", "destination_file": DESTINATION_PATH, "options": " -u ***:*** "}
+NOT_ALLOWED_CHARACTERS_PATTERN = re.compile("Command contains not allowed characters")
+DOWNLOAD_FROM_URL_NOT_SUPPORTED_PATTERN = re.compile(
+    re.escape("Downloading files from URL on Windows is not supported for SSHConnection.")
+)
+DEFAULT_EXEC_COMMAND_KWARGS = {
+    "input_data": None,
+    "cwd": None,
+    "timeout": None,
+    "environment": None,
+    "stderr_to_stdout": False,
+    "discard_stdout": False,
+    "discard_stderr": False,
+    "get_pty": False,
+}
 
 
 class TestSSHConnection:
@@ -39,130 +104,70 @@ class TestSSHConnection:
 
     CustomTestException = CalledProcessError
 
-    @pytest.fixture()
-    def ssh(self):
-        with patch.object(SSHConnection, "__init__", return_value=None):
-            ssh = SSHConnection(username="root", password="***", ip="10.10.10.10")
-            ssh._connection_details = {"hostname": "10.10.10.10", "port": 22, "username": "root", "password": "root"}
-            ssh._ip = "10.10.10.10"
-            ssh._default_timeout = None
-            ssh.cache_system_data = True
-            ssh.disable_sudo()
-            return ssh
-
-    def test_get_os_bitness_os_not_supported(self, ssh):
-        ssh._os_type = "Unknown"
-        with pytest.raises(OsNotSupported):
-            ssh.get_os_bitness()
-
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    @pytest.mark.parametrize("architecture_options", ["dunno"])
-    def test_get_os_bitness_os_arch_not_supported(self, ssh, type_options, architecture_options):
-        ssh._os_type = type_options
-        ssh.execute_command = Mock(
-            return_value=ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=architecture_options, stderr="stderr"
-            )
-        )
-        with pytest.raises(OsNotSupported):
-            ssh.get_os_bitness()
-
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    @pytest.mark.parametrize("architecture_options", ["amd64", "ia64", "x86_64"])
-    def test_get_os_bitness_os_supported_64bit(self, ssh, type_options, architecture_options):
-        ssh._os_type = type_options
-        ssh.execute_command = Mock(
-            return_value=ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=architecture_options, stderr="stderr"
-            )
-        )
-        assert ssh.get_os_bitness() == OSBitness.OS_64BIT
-
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    @pytest.mark.parametrize("architecture_options", ["i386", "i586", "x86", "ia32", "armv7l", "arm"])
-    def test_get_os_bitness_os_supported_32bit(self, ssh, type_options, architecture_options):
-        ssh._os_type = type_options
-        ssh.execute_command = Mock(
-            return_value=ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=architecture_options, stderr="stderr"
-            )
-        )
-        assert ssh.get_os_bitness() == OSBitness.OS_32BIT
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        monkeypatch.setattr(time, "sleep", lambda *args, **kwargs: None)
+
+    @pytest.fixture(scope="class")
+    def ssh_template(self):
+        ssh = SSHConnection.__new__(SSHConnection)
+        ssh._connection_details = {"hostname": "10.10.10.10", "port": 22, "username": "root", "password": "root"}
+        ssh._ip = "10.10.10.10"
+        ssh._default_timeout = None
+        ssh.cache_system_data = True
+        ssh.disable_sudo()
+        return ssh
 
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    def test_get_os_bitness_os_supported_aarch64(self, ssh, type_options):
-        ssh._os_type = type_options
-        ssh.execute_command = Mock(
-            return_value=ConnectionCompletedProcess(return_code=0, args="command", stdout="aarch64", stderr="stderr")
-        )
-        assert ssh.get_os_bitness() == OSBitness.OS_64BIT
+    @pytest.fixture(scope="class")
+    def ssh_client_template(self):
+        return create_autospec(mfd_connect.ssh.SSHClient)
 
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    def test_get_cpu_architecture_aarch64(self, ssh, type_options):
-        ssh._os_type = type_options
-        ssh.execute_command = Mock(
-            return_value=ConnectionCompletedProcess(return_code=0, args="command", stdout="aarch64", stderr="stderr")
-        )
-        assert ssh.get_cpu_architecture() == CPUArchitecture.ARM64
+    @pytest.fixture()
+    def ssh_client(self, ssh_client_template):
+        ssh_client_template.reset_mock(return_value=True, side_effect=True)
+        return ssh_client_template
 
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    @pytest.mark.parametrize("architecture_options", ["i386", "i586", "x86", "ia32"])
-    def test_get_cpu_architecture_x86(self, ssh, type_options, architecture_options):
-        ssh._os_type = type_options
-        ssh.execute_command = Mock(
-            return_value=ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=architecture_options, stderr="stderr"
-            )
-        )
-        assert ssh.get_cpu_architecture() == CPUArchitecture.X86
+    @pytest.fixture()
+    def mock_download_unix(self, mocker):
+        return mocker.patch("mfd_connect.base.download_file_unix", return_value=mocker.Mock(return_code=0, stdout=""))
 
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    @pytest.mark.parametrize("architecture_options", ["armv7l", "arm"])
-    def test_get_cpu_architecture_ARM(self, ssh, type_options, architecture_options):
-        ssh._os_type = type_options
-        ssh.execute_command = Mock(
-            return_value=ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=architecture_options, stderr="stderr"
-            )
-        )
-        assert ssh.get_cpu_architecture() == CPUArchitecture.ARM
+    @pytest.fixture()
+    def caplog_debug(self, caplog):
+        caplog.set_level(logging.NOTSET)
+        return caplog
 
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    @pytest.mark.parametrize("architecture_options", ["amd64", "ia64", "x86_64"])
-    def test_get_cpu_architecture_XH86_64(self, ssh, type_options, architecture_options):
-        ssh._os_type = type_options
-        ssh.execute_command = Mock(
-            return_value=ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=architecture_options, stderr="stderr"
-            )
-        )
-        assert ssh.get_cpu_architecture() == CPUArchitecture.X86_64
+    @pytest.fixture(params=[OSType.WINDOWS, OSType.POSIX], ids=["windows", "posix"])
+    def os_type(self, request):
+        return request.param
 
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    @pytest.mark.parametrize("architecture_options", ["dunno"])
-    def test_get_cpu_architecture_not_supported(self, ssh, type_options, architecture_options):
-        ssh._os_type = type_options
-        ssh.execute_command = Mock(
-            return_value=ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=architecture_options, stderr="stderr"
-            )
-        )
-        with pytest.raises(CPUArchitectureNotSupported):
-            ssh.get_cpu_architecture()
+    @pytest.fixture()
+    def ssh(self, ssh_template):
+        ssh = copy.copy(ssh_template)
+        ssh._connection_details = dict(ssh_template._connection_details)
+        return ssh
 
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    def test_get_os_bitness_os_supported_non_expected_bitness(self, ssh, type_options):
-        ssh._os_type = type_options
-        ssh.execute_command = Mock(
-            return_value=ConnectionCompletedProcess(return_code=0, args="command", stdout="2-bit", stderr="stderr")
-        )
+    def test_get_os_bitness_os_not_supported(self, ssh):
+        ssh._os_type = "Unknown"
         with pytest.raises(OsNotSupported):
             ssh.get_os_bitness()
 
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    def test_get_os_type(self, ssh, type_options):
-        ssh._os_type = type_options
-        if type_options == OSType.WINDOWS:
+    @pytest.mark.parametrize(
+        "architecture_options, method, expected",
+        ARCHITECTURE_GETTER_CASES,
+        ids=[f"{method}-{arch}" for arch, method, _ in ARCHITECTURE_GETTER_CASES],
+    )
+    def test_architecture_dependent_getters(self, ssh, os_type, architecture_options, method, expected):
+        ssh._os_type = os_type
+        ssh.execute_command = Mock(return_value=ARCHITECTURE_OUTPUTS[architecture_options])
+        if isinstance(expected, type) and issubclass(expected, Exception):
+            with pytest.raises(expected):
+                getattr(ssh, method)()
+        else:
+            assert getattr(ssh, method)() == expected
+
+    def test_get_os_type(self, ssh, os_type):
+        ssh._os_type = os_type
+        if os_type == OSType.WINDOWS:
             ssh.execute_command = Mock(
                 return_value=ConnectionCompletedProcess(
                     return_code=0, args="command", stdout="Microsoft Windows", stderr="stderr"
@@ -170,20 +175,12 @@ class TestSSHConnection:
             )
             assert ssh.get_os_type() == OSType.WINDOWS
         else:
-            ssh.execute_command = Mock(
-                side_effect=[
-                    ConnectionCompletedProcess(
-                        return_code=1, args="command", stdout="unrecognized command", stderr="stderr"
-                    ),
-                    ConnectionCompletedProcess(return_code=0, args="command", stdout="Linux", stderr="stderr"),
-                ]
-            )
+            ssh.execute_command = Mock(side_effect=list(POSIX_UNAME_OUTPUTS))
             assert ssh.get_os_type() == OSType.POSIX
 
-    @pytest.mark.parametrize("type_options", [OSType.WINDOWS, OSType.POSIX])
-    def test_get_os_name(self, ssh, type_options):
-        ssh._os_type = type_options
-        if type_options == OSType.WINDOWS:
+    def test_get_os_name(self, ssh, os_type):
+        ssh._os_type = os_type
+        if os_type == OSType.WINDOWS:
             ssh.execute_command = Mock(
                 return_value=ConnectionCompletedProcess(
                     return_code=0, args="command", stdout="Microsoft Windows 11 Enterprise", stderr="stderr"
@@ -191,14 +188,7 @@ class TestSSHConnection:
             )
             assert ssh.get_os_name() == OSName.WINDOWS
         else:
-            ssh.execute_command = Mock(
-                side_effect=[
-                    ConnectionCompletedProcess(
-                        return_code=1, args="command", stdout="unrecognized command", stderr="stderr"
-                    ),
-                    ConnectionCompletedProcess(return_code=0, args="command", stdout="Linux", stderr="stderr"),
-                ]
-            )
+            ssh.execute_command = Mock(side_effect=list(POSIX_UNAME_OUTPUTS))
             assert ssh.get_os_name() == OSName.LINUX
 
     cwd_test_params = {"random_name": "1231", "command_to_send": "ls", "cwd_folder": "folder"}
@@ -218,23 +208,25 @@ class TestSSHConnection:
             ),
         ],
     )
-    def test__start_process_cwd(self, ssh, mocker, type_options, correct_command):
-        random_cache = random.random
+    def test__start_process_cwd(self, ssh, mocker, monkeypatch, type_options, correct_command):
         ssh._os_type = type_options
-        random.random = mocker.Mock(return_value=self.cwd_test_params["random_name"])
+        monkeypatch.setattr(random, "random", lambda: self.cwd_test_params["random_name"])
         ssh._connection = Mock()
-        ssh.SSHClient = mocker.Mock()
         ssh._start_process(command=self.cwd_test_params["command_to_send"], cwd=self.cwd_test_params["cwd_folder"])
         ssh._connection.get_transport().open_session().exec_command.assert_called_once_with(correct_command)
-        random.random = random_cache
 
-    def test__exec_command_cwd(self, ssh, mocker):
-        random_cache = random.random
-        random.random = mocker.Mock()
-        random.random.return_value = "random_name"
+    def test__start_process_output_read_in_chunks(self, ssh):
+        ssh._os_type = OSType.POSIX
+        ssh._connection = Mock()
+        ssh._start_process(command="cmd")
+        channel = ssh._connection.get_transport().open_session()
+        channel.makefile.assert_called_once_with("r", SSHProcess.READ_CHUNK_SIZE)
+        channel.makefile_stderr.assert_called_once_with("r", SSHProcess.READ_CHUNK_SIZE)
+
+    def test__exec_command_cwd(self, ssh, mocker, monkeypatch):
+        monkeypatch.setattr(random, "random", lambda: "random_name")
         ssh._os_type = OSType.WINDOWS
         ssh._connection = mocker.Mock()
-        ssh.SSHClient = mocker.Mock()
 
         correct_command = (
             f'title random_name && cd {self.cwd_test_params["cwd_folder"]} '
@@ -244,47 +236,35 @@ class TestSSHConnection:
             command=self.cwd_test_params["command_to_send"], cwd=self.cwd_test_params["cwd_folder"], input_data=None
         )
         ssh._connection.get_transport().open_session().exec_command.assert_called_once_with(correct_command)
-        random.random = random_cache
 
     def test_wait_for_host(self, ssh, mocker):
         ssh._connection = mocker.Mock()
-        ssh.SSHClient = mocker.Mock()
-        ssh._connection.get_transport().is_active().return_value = True
+        ssh._connection.get_transport.return_value.is_active.return_value = True
         ssh._connect = mocker.Mock(side_effect=[OSError, AuthenticationException, None])
-        time.sleep = mocker.Mock(return_value=None)
         ssh.wait_for_host(10)
 
     def test_wait_for_host_fail(self, ssh, mocker):
         ssh._connection = mocker.Mock()
-        ssh.SSHClient = mocker.Mock()
         ssh._connect = mocker.Mock(side_effect=OSError)
-        time.sleep = mocker.Mock(return_value=None)
         with pytest.raises(TimeoutError):
             ssh.wait_for_host(1)
 
     @pytest.mark.skipif(os.name == "nt", reason="Sighup doesn't exist on Windows, test is not required.")
     def test_send_command_and_disconnect_platform_with_sighup(self, ssh, mocker):
-        time.sleep = mocker.Mock(return_value=None)
         ssh._connection = mocker.Mock()
-        ssh.SSHClient = mocker.Mock()
         ssh.disconnect = mocker.Mock()
         e = ConnectionCalledProcessError(-1, "ls")
         ssh.execute_command = mocker.Mock(side_effect=e)
         ssh.send_command_and_disconnect_platform("")
 
     def test_send_command_and_disconnect_platform(self, ssh, mocker):
-        time.sleep = mocker.Mock(return_value=None)
         ssh._connection = mocker.Mock()
-        ssh.SSHClient = mocker.Mock()
         ssh.disconnect = mocker.Mock()
         ssh.execute_command = mocker.Mock()
         ssh.send_command_and_disconnect_platform("")
 
     def test_send_command_and_disconnect_platform_fail(self, ssh, mocker):
-        time.sleep = mocker.Mock()
-        time.sleep.return_value = None
         ssh._connection = mocker.Mock()
-        ssh.SSHClient = mocker.Mock()
         e = ConnectionCalledProcessError(1, "ls")
         ssh.execute_command = mocker.Mock(side_effect=e)
         with pytest.raises(ConnectionCalledProcessError):
@@ -292,44 +272,35 @@ class TestSSHConnection:
 
     @pytest.mark.parametrize("e", [RemoteProcessTimeoutExpired(), ConnectionResetError()])
     def test_send_command_and_disconnect_platform_timeout_or_conn_reset(self, ssh, mocker, e):
-        time.sleep = mocker.Mock()
-        time.sleep.return_value = None
         ssh._connection = mocker.Mock()
-        ssh.SSHClient = mocker.Mock()
         ssh.execute_command = mocker.Mock(side_effect=e)
         with does_not_raise():
             ssh.send_command_and_disconnect_platform("")
 
-    def test___reconnect_successful(self, ssh, mocker):
+    def test___reconnect_successful(self, ssh, ssh_client, mocker):
         log_debug = mocker.patch("mfd_connect.ssh.logger.log")
         ssh._connect = mocker.Mock()
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
-        ssh._connection.get_transport = mocker.Mock(return_value=mocker.Mock(is_active=mocker.Mock(return_value=True)))
+        ssh._connection = ssh_client
+        ssh._connection.get_transport.return_value.is_active.return_value = True
         ssh._reconnect()
         log_debug.assert_called_with(level=log_levels.MODULE_DEBUG, msg="Reconnection successful.")
 
-    def test___reconnect_failed(self, ssh, mocker):
+    def test___reconnect_failed(self, ssh, ssh_client, mocker):
         log_debug = mocker.patch("mfd_connect.ssh.logger.log")
         ssh._connect = mocker.Mock()
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
-        ssh._connection.get_transport = mocker.Mock(return_value=mocker.Mock(is_active=mocker.Mock(return_value=False)))
+        ssh._connection = ssh_client
+        ssh._connection.get_transport.return_value.is_active.return_value = False
         with pytest.raises(SSHReconnectException):
             ssh._reconnect()
         log_debug.assert_called_with(level=log_levels.MODULE_DEBUG, msg="Connection lost.")
 
-    def test__connection_check_and_reconnect_transport_is_active(self, ssh, mocker):
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
-        ssh._connection.get_transport = mocker.Mock(return_value=mocker.Mock(is_active=mocker.Mock(return_value=True)))
+    @pytest.mark.parametrize("transport_active", [True, False])
+    def test__connection_check_and_reconnect(self, ssh, ssh_client, mocker, transport_active):
+        ssh._connection = ssh_client
+        ssh._connection.get_transport.return_value.is_active.return_value = transport_active
         ssh._reconnect = mocker.Mock()
         ssh._remote()
-        ssh._reconnect.assert_not_called()
-
-    def test__connection_check_and_reconnect_transport_is_not_active(self, ssh, mocker):
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
-        ssh._connection.get_transport = mocker.Mock(return_value=mocker.Mock(is_active=mocker.Mock(return_value=False)))
-        ssh._reconnect = mocker.Mock()
-        ssh._remote()
-        ssh._reconnect.assert_called_once()
+        assert ssh._reconnect.call_count == (0 if transport_active else 1)
 
     def test_execute_command_raise_custom_exception(self, ssh, mocker):
         ssh._exec_command = mocker.Mock(return_value=(None, None, None, 1))
@@ -349,17 +320,7 @@ class TestSSHConnection:
         result = ssh.execute_command("test_command")
         ssh.handle_execution_reconnect.assert_called_once()
 
-        ssh._exec_command.assert_any_call(
-            "test_command",
-            input_data=None,
-            cwd=None,
-            timeout=None,
-            environment=None,
-            stderr_to_stdout=False,
-            discard_stdout=False,
-            discard_stderr=False,
-            get_pty=False,
-        )
+        assert ssh._exec_command.call_args_list == [call("test_command", **DEFAULT_EXEC_COMMAND_KWARGS)] * 2
         assert result.return_code == 0
 
     def test_execute_command_with_reconnect_fail_raises_connection_called_process_error(self, ssh, mocker):
@@ -392,62 +353,59 @@ class TestSSHConnection:
         assert "Reconnect exhausted" in str(exc_info.value.stderr)
         assert isinstance(exc_info.value.__cause__, SSHReconnectException)
 
-    def test_execute_command_skip_logging_provided(self, ssh, mocker, caplog):
-        caplog.set_level(0)
+    def test_execute_command_skip_logging_provided(self, ssh, mocker, caplog_debug):
         channel = mocker.create_autospec(ChannelFile)
         channel.read.return_value = b"someoutput"
         ssh._exec_command = mocker.Mock(return_value=(None, channel, channel, 0))
         ssh.execute_command("cmd arg1 arg2", skip_logging=True)
-        assert not any("someoutput" in msg for msg in caplog.messages)
+        assert not any("someoutput" in msg for msg in caplog_debug.messages)
 
         ssh.execute_command("cmd arg1 arg2", skip_logging=False)
-        assert len([msg for msg in caplog.messages if "someoutput" in msg]) == 2  # stdout + stderr log
+        assert len([msg for msg in caplog_debug.messages if "someoutput" in msg]) == 2  # stdout + stderr log
 
-    def test_execute_command_get_pty_warning(self, ssh, mocker, caplog):
-        caplog.set_level(0)
+    def test_execute_command_get_pty_warning(self, ssh, mocker, caplog_debug):
         ssh._exec_command = mocker.Mock(return_value=(None, None, None, 0))
         ssh.execute_command("cmd arg1 arg2", get_pty=True)
-        assert next(("pseudo-terminal" in msg for msg in caplog.messages), None) is not None
+        assert next(("pseudo-terminal" in msg for msg in caplog_debug.messages), None) is not None
 
-    def test_connect_additional_auth(self, ssh, mocker, caplog):
-        caplog.set_level(logging.DEBUG)
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
+    def test_connect_additional_auth(self, ssh, ssh_client, mocker, caplog_debug):
+        ssh._connection = ssh_client
         ssh._connection.get_transport().__str__.return_value = (
             "<paramiko.Transport at 0x7808aa08 (cipher aes128-ctr, " "128 bits) (connected; awaiting auth)>"
         )
-        ssh.get_os_name = mocker.create_autospec(ssh.get_os_name, return_value=OSName.LINUX)
-        ssh.get_os_type = mocker.create_autospec(ssh.get_os_type, return_value=OSType.POSIX)
+        ssh.get_os_name = mocker.Mock(return_value=OSName.LINUX)
+        ssh.get_os_type = lambda: OSType.POSIX
         ssh._connect()
         ssh._connection.get_transport().auth_interactive_dumb.assert_called_with("root")
         ssh.get_os_name.assert_called()
-        assert ["SSH server requested additional authentication"] == [rec.message for rec in caplog.records]
+        assert ["SSH server requested additional authentication"] == [rec.message for rec in caplog_debug.records]
 
-    def test_connect(self, ssh, mocker):
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
+    def test_connect(self, ssh, ssh_client, mocker):
+        ssh._connection = ssh_client
         ssh._connection.get_transport().__str__.return_value = (
             "<paramiko.Transport at 0xbd6b0888 (cipher aes128-ctr, " "128 bits) (active; 0 open channel(s))>"
         )
-        ssh.get_os_name = mocker.create_autospec(ssh.get_os_name, return_value=OSName.LINUX)
-        ssh.get_os_type = mocker.create_autospec(ssh.get_os_type, return_value=OSType.POSIX)
+        ssh.get_os_name = mocker.Mock(return_value=OSName.LINUX)
+        ssh.get_os_type = lambda: OSType.POSIX
         ssh._connect()
         ssh.get_os_name.assert_called()
 
     def test_str_function(self, ssh):
         assert str(ssh) == "ssh"
 
-    def test_enable_sudo_posix(self, ssh, mocker):
+    def test_enable_sudo_posix(self, ssh, ssh_client, mocker):
         ssh._os_type = OSType.POSIX
         ssh.enable_sudo()
         ssh._exec_command = mocker.Mock(return_value=(None, None, None, 0))
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
+        ssh._connection = ssh_client
         completed_process = ssh.execute_command("cmd arg1 arg2", custom_exception=self.CustomTestException)
         assert completed_process.args == "sudo cmd arg1 arg2"
 
-    def test_enable_sudo_echo_cmd(self, ssh, mocker):
+    def test_enable_sudo_echo_cmd(self, ssh, ssh_client, mocker):
         ssh._os_type = OSType.POSIX
         ssh.enable_sudo()
         ssh._exec_command = mocker.Mock(return_value=(None, None, None, 0))
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
+        ssh._connection = ssh_client
         completed_process = ssh.execute_command("echo arg > /some/restricted/path")
         assert completed_process.args == 'sudo sh -c "echo arg > /some/restricted/path"'
 
@@ -456,12 +414,12 @@ class TestSSHConnection:
         with pytest.raises(OsNotSupported, match=f"{ssh._os_type} is not supported for enabling sudo!"):
             ssh.enable_sudo()
 
-    def test_disable_sudo(self, ssh, mocker):
+    def test_disable_sudo(self, ssh, ssh_client, mocker):
         ssh._os_type = OSType.POSIX
         ssh.enable_sudo()
         ssh.disable_sudo()
         ssh._exec_command = mocker.Mock(return_value=(None, None, None, 0))
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
+        ssh._connection = ssh_client
         completed_process = ssh.execute_command("cmd arg1 arg2", custom_exception=self.CustomTestException)
         assert completed_process.args == "cmd arg1 arg2"
 
@@ -469,7 +427,7 @@ class TestSSHConnection:
         assert ssh.ip == "10.10.10.10"
 
     def test_init_with_model(self, mocker):
-        mocker.patch("paramiko.SSHClient", return_value=mocker.Mock())
+        ssh_client = mocker.patch("mfd_connect.ssh.SSHClient")
         mocker.patch(
             "mfd_connect.SSHConnection._connect",
         )
@@ -481,6 +439,7 @@ class TestSSHConnection:
         assert obj.model == model
         obj = SSHConnection(ip="10.10.10.10", username="", password="")
         assert obj.model is None
+        assert ssh_client.call_count == 2
 
     def test__add_discard_commands_windows(self, ssh):
         ssh._os_type = OSType.WINDOWS
@@ -506,7 +465,6 @@ class TestSSHConnection:
         )
 
     def test__terminate_command_after_timeout(self, ssh, mocker):
-        time.sleep = mocker.Mock()
         mocker.patch("mfd_common_libs.timeout_counter.TimeoutCounter.__bool__", return_value=True)
 
         chan = mocker.create_autospec(paramiko.Channel)
@@ -520,27 +478,23 @@ class TestSSHConnection:
 
     def test__verify_command_correctness(self, ssh):
         ssh._verify_command_correctness("echo pid")
-        with pytest.raises(ValueError, match="Command contains not allowed characters"):
+        with pytest.raises(ValueError, match=NOT_ALLOWED_CHARACTERS_PATTERN):
             ssh._verify_command_correctness("echo pid\n")
-        with pytest.raises(ValueError, match="Command contains not allowed characters"):
+        with pytest.raises(ValueError, match=NOT_ALLOWED_CHARACTERS_PATTERN):
             ssh._verify_command_correctness("echo pid\r ")
-        with pytest.raises(ValueError, match="Command contains not allowed characters"):
+        with pytest.raises(ValueError, match=NOT_ALLOWED_CHARACTERS_PATTERN):
             ssh._verify_command_correctness("echo pid |")
 
     def test_execute_command_invalid_character_check(self, ssh):
-        with pytest.raises(ValueError, match="Command contains not allowed characters"):
+        with pytest.raises(ValueError, match=NOT_ALLOWED_CHARACTERS_PATTERN):
             ssh.execute_command("cmd arg1 arg2;")
 
     @pytest.fixture()
-    def ssh_conn_with_timeout(self):
-        with patch.object(SSHConnection, "__init__", return_value=None):
-            ssh = SSHConnection(username="root", password="***", ip="10.10.10.10")
-            ssh._connection_details = {"hostname": "10.10.10.10", "port": 22, "username": "root", "password": "root"}
-            ssh._ip = "10.10.10.10"
-            ssh._default_timeout = 1
-            ssh.cache_system_data = True
-            ssh.disable_sudo()
-            return ssh
+    def ssh_conn_with_timeout(self, ssh_template):
+        ssh = copy.copy(ssh_template)
+        ssh._connection_details = dict(ssh_template._connection_details)
+        ssh._default_timeout = 1
+        return ssh
 
     def test_execute_with_timeout(self, ssh_conn_with_timeout, ssh, mocker):
         ssh_conn_with_timeout._exec_command = mocker.create_autospec(
@@ -551,31 +505,13 @@ class TestSSHConnection:
         ssh.execute_command("ping localhost")
 
         ssh_conn_with_timeout._exec_command.assert_called_with(
-            "ping localhost",
-            cwd=None,
-            discard_stderr=False,
-            discard_stdout=False,
-            environment=None,
-            get_pty=False,
-            input_data=None,
-            stderr_to_stdout=False,
-            timeout=1,
-        )
-        ssh._exec_command.assert_called_with(
-            "ping localhost",
-            cwd=None,
-            discard_stderr=False,
-            discard_stdout=False,
-            environment=None,
-            get_pty=False,
-            input_data=None,
-            stderr_to_stdout=False,
-            timeout=None,
+            "ping localhost", **{**DEFAULT_EXEC_COMMAND_KWARGS, "timeout": 1}
         )
+        ssh._exec_command.assert_called_with("ping localhost", **DEFAULT_EXEC_COMMAND_KWARGS)
 
-    def test_restart_platform_ssh(self, ssh, mocker):
+    def test_restart_platform_ssh(self, ssh, ssh_client, mocker):
         ssh._os_type = OSType.POSIX
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
+        ssh._connection = ssh_client
         mocker.patch("mfd_connect.ssh.read_uptime", side_effect=[100.0, 10.0])
         ssh.send_command_and_disconnect_platform = mocker.Mock()
         ssh.wait_for_host = mocker.Mock()
@@ -585,9 +521,9 @@ class TestSSHConnection:
         )
         ssh.wait_for_host.assert_called_once_with(timeout=1)
 
-    def test_restart_platform_windows(self, ssh, mocker):
+    def test_restart_platform_windows(self, ssh, ssh_client, mocker):
         ssh._os_type = OSType.WINDOWS
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
+        ssh._connection = ssh_client
         mocker.patch("mfd_connect.ssh.read_uptime", side_effect=[100.0, 10.0])
         ssh.send_command_and_disconnect_platform = mocker.Mock()
         ssh.wait_for_host = mocker.Mock()
@@ -597,9 +533,9 @@ class TestSSHConnection:
         ssh.send_command_and_disconnect_platform.assert_called_once_with("shutdown /r /f -t 0")
         ssh.wait_for_host.assert_called_once_with(timeout=1)
 
-    def test_restart_platform_timeout_error(self, ssh, mocker):
+    def test_restart_platform_timeout_error(self, ssh, ssh_client, mocker):
         ssh._os_type = OSType.POSIX
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
+        ssh._connection = ssh_client
         mocker.patch("mfd_connect.ssh.read_uptime", return_value=100.0)
         ssh.send_command_and_disconnect_platform = mocker.Mock()
         ssh.wait_for_host = mocker.Mock(side_effect=TimeoutError)
@@ -608,11 +544,10 @@ class TestSSHConnection:
 
         ssh.wait_for_host.assert_called_once_with(timeout=1)
 
-    def test_restart_platform_uptime_not_decreased_then_rebooted(self, ssh, mocker):
+    def test_restart_platform_uptime_not_decreased_then_rebooted(self, ssh, ssh_client, mocker):
         ssh._os_type = OSType.POSIX
-        ssh._connection = mocker.create_autospec(mfd_connect.ssh.SSHClient)
+        ssh._connection = ssh_client
         mocker.patch("mfd_connect.ssh.read_uptime", side_effect=[100.0, 200.0, 10.0])
-        mocker.patch("mfd_connect.ssh.time.sleep")
         ssh.send_command_and_disconnect_platform = mocker.Mock()
         ssh.wait_for_host = mocker.Mock()
 
@@ -697,50 +632,34 @@ class TestSSHConnection:
 
     def test_download_file_from_url_windows_ssh_no_supported(self, ssh, mocker):
         ssh.get_os_name = mocker.Mock(return_value=OSName.WINDOWS)
-        with pytest.raises(
-            OsNotSupported, match=re.escape("Downloading files from URL on Windows is not supported for SSHConnection.")
-        ):
+        with pytest.raises(OsNotSupported, match=DOWNLOAD_FROM_URL_NOT_SUPPORTED_PATTERN):
             ssh.download_file_from_url("http://url.com", Path("something.txt"), username="***", password="***")
 
-    def test_download_file_from_url(self, ssh, mocker, caplog):
-        caplog.set_level(MODULE_DEBUG)
+    def test_download_file_from_url(self, ssh, mocker, caplog, mock_download_unix):
         ssh.get_os_name = mocker.Mock(return_value=OSName.LINUX)
-        mock_download_func = mocker.patch(
-            "mfd_connect.base.download_file_unix", return_value=mocker.Mock(return_code=0, stdout="")
-        )
-        ssh._manage_temporary_envs = mocker.Mock()
-        ssh._generate_random_string = mocker.Mock(return_value="9yDOrm4D")
-        path = Path("/path/to/destination")
-        ssh.download_file_from_url("http://url.com", path, username="***", password="***")
-
-        mock_download_func.assert_called_once_with(
-            connection=ssh,
-            url="http://url.com",
-            destination_file=path,
-            options=" -u ***:*** ",
-        )
+        with caplog.at_level(MODULE_DEBUG, logger="mfd_connect.ssh"):
+            ssh.download_file_from_url("http://url.com", DESTINATION_PATH, username="***", password="***")
+
+        assert mock_download_unix.call_count == 1
+        download_kwargs = dict(mock_download_unix.call_args.kwargs)
+        assert download_kwargs.pop("connection") is ssh
+        assert download_kwargs == DOWNLOAD_FILE_UNIX_KWARGS
         assert (
             "hide_credentials flag is not supported for SSHConnection. For continue execution, "
             "the flag will be forced to be set on False."
         ) in caplog.text
 
-    def test_download_file_from_url_no_hidden_creds(self, ssh, mocker, caplog):
-        caplog.set_level(MODULE_DEBUG)
+    def test_download_file_from_url_no_hidden_creds(self, ssh, mocker, caplog, mock_download_unix):
         ssh.get_os_name = mocker.Mock(return_value=OSName.LINUX)
-        mock_download_func = mocker.patch(
-            "mfd_connect.base.download_file_unix", return_value=mocker.Mock(return_code=0, stdout="")
-        )
-        ssh._manage_temporary_envs = mocker.Mock()
-        ssh._generate_random_string = mocker.Mock(return_value="9yDOrm4D")
-        path = Path("/path/to/destination")
-        ssh.download_file_from_url("http://url.com", path, username="***", password="***", hide_credentials=False)
-
-        mock_download_func.assert_called_once_with(
-            connection=ssh,
-            url="http://url.com",
-            destination_file=path,
-            options=" -u ***:*** ",
-        )
+        with caplog.at_level(MODULE_DEBUG, logger="mfd_connect.ssh"):
+            ssh.download_file_from_url(
+                "http://url.com", DESTINATION_PATH, username="***", password="***", hide_credentials=False
+            )
+
+        assert mock_download_unix.call_count == 1
+        download_kwargs = dict(mock_download_unix.call_args.kwargs)
+        assert download_kwargs.pop("connection") is ssh
+        assert download_kwargs == DOWNLOAD_FILE_UNIX_KWARGS
         assert (
             "hide_credentials flag is not supported for SSHConnection. For continue execution, "
             "the flag will be forced to be set on False."
@@ -749,60 +668,47 @@ class TestSSHConnection:
     class TestSSHConnectionStartProcess:
         """Tests for SSHConnection start_process method."""
 
+        @pytest.fixture(scope="class")
+        def ssh_template(self):
+            ssh = SSHConnection.__new__(SSHConnection)
+            ssh._ip = "10.10.10.10"
+            ssh._verify_command_correctness = MagicMock()
+            ssh._adjust_command = MagicMock()
+            ssh._process_class = MagicMock()
+            ssh._start_process = MagicMock()
+            ssh._prepare_log_file = MagicMock()
+            return ssh
+
         @pytest.fixture()
-        def ssh(self):
-            with patch("mfd_connect.ssh.SSHConnection.__init__", return_value=None):
-                ssh = SSHConnection.__new__(SSHConnection)
-                ssh._ip = "10.10.10.10"
-                ssh._verify_command_correctness = MagicMock()
-                ssh._adjust_command = MagicMock(side_effect=lambda x: x)
-                ssh._process_class = MagicMock()
-                ssh._start_process = MagicMock(return_value=(None, None, None, "unique_name", None))
-                return ssh
-
-        def test_start_process_calls_prepare_log_file(self, ssh):
-            with patch.object(ssh, "_prepare_log_file", return_value=None) as prepare_log_file_mock:
-                ssh.start_process(
-                    command="ls",
-                    cwd=None,
-                    env=None,
-                    stderr_to_stdout=False,
-                    discard_stdout=False,
-                    discard_stderr=False,
-                    cpu_affinity=None,
-                    shell=False,
-                    enable_input=False,
-                    log_file=True,
-                    output_file=None,
-                    get_pty=False,
-                )
-                prepare_log_file_mock.assert_called_once()
-
-        def test_start_process_sets_log_file_true_if_log_path(self, ssh):
-            # Patch _prepare_log_file to return a dummy log_path
-            with patch.object(ssh, "_prepare_log_file", return_value="dummy_log_path") as prepare_log_file_mock:
-                # log_file is initially False, but should be set to True if log_path is not None
-                ssh.start_process(
-                    command="ls",
-                    cwd=None,
-                    env=None,
-                    stderr_to_stdout=False,
-                    discard_stdout=False,
-                    discard_stderr=False,
-                    cpu_affinity=None,
-                    shell=False,
-                    enable_input=False,
-                    log_file=False,
-                    output_file=None,
-                    get_pty=False,
-                )
-                prepare_log_file_mock.assert_called_once()
+        def ssh(self, ssh_template):
+            for mock in (
+                ssh_template._verify_command_correctness,
+                ssh_template._adjust_command,
+                ssh_template._process_class,
+                ssh_template._start_process,
+                ssh_template._prepare_log_file,
+            ):
+                mock.reset_mock(return_value=True, side_effect=True)
+            ssh_template._adjust_command.side_effect = lambda x: x
+            ssh_template._start_process.return_value = (None, None, None, "unique_name", None)
+            ssh_template._prepare_log_file.return_value = None
+            return copy.copy(ssh_template)
+
+        @pytest.mark.parametrize(
+            "prepare_log_file_return, log_file", [(None, True), ("dummy_log_path", False)], ids=["log_file", "log_path"]
+        )
+        def test_start_process_prepare_log_file(self, ssh, prepare_log_file_return, log_file):
+            # log_file=False is switched to True when _prepare_log_file returns a log path
+            ssh._prepare_log_file.return_value = prepare_log_file_return
+            ssh.start_process(**{**START_PROCESS_KWARGS, "log_file": log_file})
+            ssh._prepare_log_file.assert_called_once()
 
         def test_path_python_313plus(self, monkeypatch, ssh, mocker):
             # Simulate Python 3.13+
             ssh.cache_system_data = mocker.Mock()
             monkeypatch.setattr(sys, "version_info", (3, 13, 0))
-            cpf = mocker.patch("mfd_connect.ssh.custom_path_factory", return_value="custom_path")
+            cpf = Mock(return_value="custom_path")
+            monkeypatch.setattr("mfd_connect.ssh.custom_path_factory", cpf)
             result = ssh.path("foo", bar=1)
             assert result == "custom_path"
             cpf.assert_called_once()
@@ -813,7 +719,8 @@ class TestSSHConnection:
             # Simulate Python < 3.13
             ssh.cache_system_data = mocker.Mock()
             monkeypatch.setattr(sys, "version_info", (3, 10, 0))
-            cp = mocker.patch("mfd_connect.ssh.CustomPath", return_value="custom_path")
+            cp = Mock(return_value="custom_path")
+            monkeypatch.setattr("mfd_connect.ssh.CustomPath", cp)
             result = ssh.path("foo", bar=1)
             assert result == "custom_path"
             cp.assert_called_once()
@@ -1,5 +1,6 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import copy
 from logging import DEBUG
 from re import Match
 from subprocess import CalledProcessError
@@ -7,7 +8,7 @@ from textwrap import dedent
 
 import pytest
 from mfd_common_libs import log_levels
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from mfd_connect import TelnetConnection
 from mfd_connect.base import ConnectionCompletedProcess
@@ -20,6 +21,8 @@ from mfd_connect.telnet.telnet_console import TelnetConsole
 from mfd_connect.util import LOGIN_PROMPT_RECOVERY_TIMEOUT
 from mfd_typing.os_values import OSBitness, OSType
 
+MATCH = Mock(spec_set=Match)
+
 telnet_output = """
 [0m[30m[40m[25;27H  [01D  [0m[30m[47m[10;01H   [02D>[01CDevice Manager                                        [0m[37m[40m[23;02H [22;02H [50C                         [51D                          [23;53H                           [77D^v=Move Highlight       [22;03H                        [23;27H<Enter>=Select Entry      [0m[30m[47m[0m[37m[40m[08;31H<Standard English>[0m[30m[47m         [57D   Select Language            [0m[34m[47m[27CThis is the option
 [57Cone adjusts to change
@@ -57,18 +60,22 @@ class TestTelnetConnection:
     [userb@Mickey-10-010 ~]$"""
     )
 
-    @pytest.fixture()
-    def telnet(self, mocker):
-        mocker.patch.object(TelnetConnection, "_establish_telnet_connection", return_value=None)
-        conn = TelnetConnection(ip="10.10.10.10", port=10, username="***", password="***")
+    @pytest.fixture(scope="class")
+    def telnet_template(self):
+        with patch.object(TelnetConnection, "_establish_telnet_connection", return_value=None):
+            conn = TelnetConnection(ip="10.10.10.10", port=10, username="***", password="***")
         conn._ip = "10.10.10.10"
-        conn.console = mocker.create_autospec(TelnetConsole)
+        conn.console = Mock(spec_set=TelnetConsole)
         conn._login_timeout = 1
         conn._username = "user"
         conn._password = "pass"
-        mocker.stopall()
         return conn
 
+    @pytest.fixture()
+    def telnet(self, telnet_template):
+        telnet_template.console.reset_mock(return_value=True, side_effect=True)
+        return copy.copy(telnet_template)
+
     @pytest.fixture()
     def connect_mock(self, telnet, mocker):
         return mocker.patch.object(telnet, "_connect", return_value=None)
@@ -148,7 +155,7 @@ class TestTelnetConnection:
         mocker.patch("time.sleep", return_value=None)
         telnet.console.is_connected.return_value = True
         telnet.console.write.return_value = None
-        telnet.console.expect.side_effect = [(1, mocker.create_autospec(Match), "")]
+        telnet.console.expect.side_effect = [(1, MATCH, "")]
         telnet._enter_credentials()
         # Just verify expect was called, don't check exact pattern list
         assert telnet.console.expect.called
@@ -160,7 +167,7 @@ class TestTelnetConnection:
         mocker.patch("time.sleep", return_value=None)
         telnet.console.is_connected.return_value = True
         telnet.console.write.return_value = None
-        telnet.console.expect.side_effect = [(-1, mocker.create_autospec(Match), "")]
+        telnet.console.expect.side_effect = [(-1, MATCH, "")]
         with pytest.raises(ConnectionResetError, match="Login prompt not found"):
             telnet._enter_credentials()
         # Just verify expect was called
@@ -173,8 +180,8 @@ class TestTelnetConnection:
         telnet.console.is_connected.return_value = True
         telnet.console.write.return_value = None
         telnet.console.expect.side_effect = [
-            (0, mocker.create_autospec(Match), ""),
-            (0, mocker.create_autospec(Match), ""),
+            (0, MATCH, ""),
+            (0, MATCH, ""),
         ]
         telnet._enter_credentials()
         telnet.console.write.assert_has_calls([mocker.call("user")])
@@ -191,9 +198,9 @@ class TestTelnetConnection:
         telnet.console.is_connected.return_value = True
         telnet.console.write.return_value = None
         telnet.console.expect.side_effect = [
-            (0, mocker.create_autospec(Match), ""),
-            (0, mocker.create_autospec(Match), ""),
-            (0, mocker.create_autospec(Match), ""),
+            (0, MATCH, ""),
+            (0, MATCH, ""),
+            (0, MATCH, ""),
         ]
         telnet._enter_credentials()
         telnet.console.write.assert_has_calls([mocker.call("user"), mocker.call("pass")])
@@ -212,9 +219,9 @@ class TestTelnetConnection:
         telnet.console.is_connected.return_value = True
         telnet.console.write.return_value = None
         telnet.console.expect.side_effect = [
-            (0, mocker.create_autospec(Match), ""),
-            (-1, mocker.create_autospec(Match), ""),
-            (0, mocker.create_autospec(Match), ""),
+            (0, MATCH, ""),
+            (-1, MATCH, ""),
+            (0, MATCH, ""),
         ]
         telnet._enter_credentials()
         telnet.console.write.assert_has_calls([mocker.call("user")])
@@ -235,13 +242,13 @@ class TestTelnetConnection:
         telnet.console.write.return_value = None
         # Return failure on all attempts (6 retries total per LOGIN_PROMPT_RECOVERY_RETRIES)
         telnet.console.expect.side_effect = [
-            (0, mocker.create_autospec(Match), ""),  # Login prompt found
-            (-1, mocker.create_autospec(Match), ""),  # Prompt not found, triggers recovery
-            (-1, mocker.create_autospec(Match), ""),  # Retry 1
-            (-1, mocker.create_autospec(Match), ""),  # Retry 2
-            (-1, mocker.create_autospec(Match), ""),  # Retry 3
-            (-1, mocker.create_autospec(Match), ""),  # Retry 4
-            (-1, mocker.create_autospec(Match), ""),  # Retry 5
+            (0, MATCH, ""),  # Login prompt found
+            (-1, MATCH, ""),  # Prompt not found, triggers recovery
+            (-1, MATCH, ""),  # Retry 1
+            (-1, MATCH, ""),  # Retry 2
+            (-1, MATCH, ""),  # Retry 3
+            (-1, MATCH, ""),  # Retry 4
+            (-1, MATCH, ""),  # Retry 5
         ]
         with pytest.raises(ConnectionResetError, match="Prompt not found after entering credentials"):
             telnet._enter_credentials()
@@ -290,7 +297,7 @@ class TestTelnetConnection:
         time_sleep_mock = mocker.patch("time.sleep", return_value=None)
         mocker.patch.object(telnet, "_connect", return_value=None)
         telnet.console.write.return_value = None
-        telnet.console.expect.return_value = (0, mocker.create_autospec(Match), b"my_output")
+        telnet.console.expect.return_value = (0, MATCH, b"my_output")
         assert telnet._write_to_console("test command", timeout=1, execution_retries=1) == "my_output"
         telnet.console.write.assert_called_once_with(buffer=b"test command", end=b"\n")
         time_sleep_mock.assert_called_once_with(0.5)
@@ -303,7 +310,7 @@ class TestTelnetConnection:
         caplog.set_level(log_levels.MODULE_DEBUG)
         time_sleep_mock = mocker.patch("time.sleep", return_value=None)
         telnet.console.write.side_effect = [EOFError, None]
-        telnet.console.expect.return_value = (0, mocker.create_autospec(Match), b"my_output")
+        telnet.console.expect.return_value = (0, MATCH, b"my_output")
         assert telnet._write_to_console("test command", timeout=1, execution_retries=1) == "my_output"
         telnet.console.write.assert_has_calls(
             [mocker.call(buffer=b"test command", end=b"\n"), mocker.call(buffer=b"test command", end=b"\n")]
@@ -317,7 +324,7 @@ class TestTelnetConnection:
     def test__write_to_console_fail(self, telnet, mocker):
         mocker.patch.object(telnet, "_connect", return_value=None)
         telnet.console.write.side_effect = [EOFError, None]
-        telnet.console.expect.return_value = (0, mocker.create_autospec(Match), b"my_output")
+        telnet.console.expect.return_value = (0, MATCH, b"my_output")
         with pytest.raises(TelnetException, match="Reached retries count, command was not executed"):
             telnet._write_to_console("test command", timeout=1, execution_retries=0)
         telnet.console.write.assert_called_once_with(buffer=b"test command", end=b"\n")
@@ -631,7 +638,7 @@ class TestTelnetConnection:
         """Test successful prompt detection on first attempt."""
         caplog.set_level(log_levels.MODULE_DEBUG)
         shell_prompt_patterns = [telnet._prompt.encode()]
-        telnet.console.expect.return_value = (0, mocker.create_autospec(Match), b"")
+        telnet.console.expect.return_value = (0, MATCH, b"")
         telnet._wait_for_shell_prompt_after_login(shell_prompt_patterns)
         telnet.console.expect.assert_called_once()
         assert "Prompt found" in caplog.text
@@ -642,8 +649,8 @@ class TestTelnetConnection:
         shell_prompt_patterns = [telnet._prompt.encode()]
         # First attempt: no prompt found but CPR detected, second attempt: success
         telnet.console.expect.side_effect = [
-            (-1, mocker.create_autospec(Match), b"\x1b[6n"),  # No prompt, CPR request detected
-            (0, mocker.create_autospec(Match), b""),  # Prompt found on retry
+            (-1, MATCH, b"\x1b[6n"),  # No prompt, CPR request detected
+            (0, MATCH, b""),  # Prompt found on retry
         ]
         telnet.console.write.return_value = None
         telnet._wait_for_shell_prompt_after_login(shell_prompt_patterns)
@@ -657,10 +664,10 @@ class TestTelnetConnection:
         shell_prompt_patterns = [telnet._prompt.encode()]
         # First 3 attempts fail without CPR, 4th succeeds
         telnet.console.expect.side_effect = [
-            (-1, mocker.create_autospec(Match), b"some output"),
-            (-1, mocker.create_autospec(Match), b"more output"),
-            (-1, mocker.create_autospec(Match), b"still waiting"),
-            (0, mocker.create_autospec(Match), b""),  # Success
+            (-1, MATCH, b"some output"),
+            (-1, MATCH, b"more output"),
+            (-1, MATCH, b"still waiting"),
+            (0, MATCH, b""),  # Success
         ]
         telnet.console.write.return_value = None
         telnet._wait_for_shell_prompt_after_login(shell_prompt_patterns)
@@ -672,7 +679,7 @@ class TestTelnetConnection:
         caplog.set_level(log_levels.MODULE_DEBUG)
         shell_prompt_patterns = [telnet._prompt.encode()]
         # All 6 attempts fail
-        telnet.console.expect.return_value = (-1, mocker.create_autospec(Match), b"no prompt")
+        telnet.console.expect.return_value = (-1, MATCH, b"no prompt")
         telnet.console.write.return_value = None
         with pytest.raises(ConnectionResetError, match="Prompt not found after entering credentials"):
             telnet._wait_for_shell_prompt_after_login(shell_prompt_patterns)
@@ -682,8 +689,8 @@ class TestTelnetConnection:
         caplog.set_level(log_levels.MODULE_DEBUG)
         shell_prompt_patterns = [telnet._prompt.encode()]
         telnet.console.expect.side_effect = [
-            (-1, mocker.create_autospec(Match), b"output"),  # First attempt (uses login_timeout)
-            (0, mocker.create_autospec(Match), b""),  # Second attempt (uses recovery timeout)
+            (-1, MATCH, b"output"),  # First attempt (uses login_timeout)
+            (0, MATCH, b""),  # Second attempt (uses recovery timeout)
         ]
         telnet.console.write.return_value = None
         telnet._wait_for_shell_prompt_after_login(shell_prompt_patterns)
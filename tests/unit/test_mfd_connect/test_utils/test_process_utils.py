@@ -20,6 +20,7 @@ from mfd_connect.util.process_utils import (
     kill_process_by_name,
     kill_all_processes_by_name,
     stop_process_by_name,
+    split_command,
 )
 
 
@@ -239,3 +240,14 @@ class TestProcessUtils:
         mocker.patch("mfd_connect.util.process_utils.kill_process_by_name")
         with pytest.raises(Exception, match="Unknown error killing irqbalance"):
             stop_process_by_name(ssh_linux, "irqbalance")
+
+    def test_split_command(self):
+        assert split_command('ping "local host" -c 1') == ["ping", "local host", "-c", "1"]
+        assert split_command('ping "local host"', posix=False) == ["ping", '"local host"']
+
+    def test_split_command_is_memoized(self, mocker):
+        shlex_split = mocker.patch("mfd_connect.util.process_utils.shlex.split", return_value=["uname", "-a"])
+        first = split_command("uname -a --memoized")
+        first.append("modified")
+        assert split_command("uname -a --memoized") == ["uname", "-a"]
+        shlex_split.assert_called_once_with("uname -a --memoized", posix=True)
@@ -139,7 +139,7 @@ class TestRPyCZeroDeployConnection:
         remote = mocker.patch("mfd_connect.RPyCZeroDeployConnection.remote", new_callable=mocker.PropertyMock)
         remote.return_value = rpyc_module.Connection
         mocker.patch("rpyc.BgServingThread", mocker.create_autospec(rpyc_module.BgServingThread))
-        time.sleep = mocker.Mock(return_value=None)
+        mocker.patch.object(time, "sleep", return_value=None)
         zero_rpyc.wait_for_host(timeout=10)
 
     def test_wait_for_host_fail(self, zero_rpyc, mocker):
@@ -147,14 +147,14 @@ class TestRPyCZeroDeployConnection:
         timeout_mocker.return_value.__bool__.return_value = True
         zero_rpyc._prepare_connection = mocker.Mock(return_value=None)
         zero_rpyc._create_connection = mocker.Mock(side_effect=OSError)
-        time.sleep = mocker.Mock(return_value=None)
+        mocker.patch.object(time, "sleep", return_value=None)
         with pytest.raises(TimeoutError):
             zero_rpyc.wait_for_host(timeout=1)
 
     @pytest.mark.parametrize("command", ["shutdown", "shutdown -r now"])
     def test__send_command_and_disconnect_platform_with_drop(self, patches, zero_rpyc, mocker, command, caplog):
         caplog.set_level(log_levels.MODULE_DEBUG)
-        time.sleep = mocker.Mock(return_value=None)
+        mocker.patch.object(time, "sleep", return_value=None)
         zero_rpyc._connection = mocker.Mock()
         zero_rpyc._mach.which.side_effect = ["/user/shutdown", SSHException]
         remote_command_mock = mocker.create_autospec(RemoteCommand)
@@ -167,7 +167,7 @@ class TestRPyCZeroDeployConnection:
         assert "Dropped connection via SSH, expected" in caplog.text
 
     def test__send_command_and_disconnect_platform_popen_fail(self, patches, zero_rpyc, mocker):
-        time.sleep = mocker.Mock(return_value=None)
+        mocker.patch.object(time, "sleep", return_value=None)
         zero_rpyc._connection = mocker.Mock()
         zero_rpyc._mach.which.side_effect = ["/user/shutdown", "/user/shutdown"]
         remote_command_mock = mocker.create_autospec(RemoteCommand)
@@ -182,7 +182,7 @@ class TestRPyCZeroDeployConnection:
         zero_rpyc._connection.close.assert_called_once()
 
     def test__send_command_and_disconnect_platform_command_not_found(self, patches, zero_rpyc, mocker):
-        time.sleep = mocker.Mock(return_value=None)
+        mocker.patch.object(time, "sleep", return_value=None)
         zero_rpyc._connection = mocker.Mock()
         zero_rpyc._mach.which.side_effect = CommandNotFound("command", [])
         zero_rpyc._background_serving_thread = mocker.Mock()
@@ -192,7 +192,7 @@ class TestRPyCZeroDeployConnection:
         zero_rpyc._connection.close.assert_called_once()
 
     def test__send_command_and_disconnect_platform_fail(self, patches, zero_rpyc, mocker):
-        time.sleep = mocker.Mock(return_value=None)
+        mocker.patch.object(time, "sleep", return_value=None)
         zero_rpyc._connection = mocker.Mock()
         zero_rpyc._mach.which.return_value = "/user/shutdown"
         zero_rpyc._background_serving_thread = mocker.Mock()